@@ -7,8 +7,6 @@ Run with:
 
 import logging
 import os
-import random
-import uuid
 
 import psycopg2
 
@@ -20,23 +18,22 @@ from kraft import (
     SchemaManager,
     SimulationRunner,
 )
+from kraft.generators import ChoiceGenerator, IntegerGenerator, UUIDGenerator
 
 TABLE_NAME = "example_sales"
 
 
 def build_columns():
     return {
-        "id": ColumnDefinition("id", "UUID", lambda: str(uuid.uuid4()), protected=True),
+        "id": ColumnDefinition("id", "UUID", UUIDGenerator(), protected=True),
         "updated_at": ColumnDefinition(
             "updated_at", "TIMESTAMP", lambda: "now()", protected=True
         ),
-        "item": ColumnDefinition(
-            "item", "TEXT", lambda: random.choice(["shoes", "shirt", "hat"])
-        ),
+        "item": ColumnDefinition("item", "TEXT", ChoiceGenerator(["shoes", "shirt", "hat"])),
         "region": ColumnDefinition(
-            "region", "TEXT", lambda: random.choice(["NA", "EU", "APAC"])
+            "region", "TEXT", ChoiceGenerator(["NA", "EU", "APAC"], weights=[5, 3, 2])
         ),
-        "quantity": ColumnDefinition("quantity", "INT", lambda: random.randint(1, 5)),
+        "quantity": ColumnDefinition("quantity", "INT", IntegerGenerator(1, 5)),
         "discount": ColumnDefinition("discount", "FLOAT", lambda: 0.0, reserved=True),
         "coupon": ColumnDefinition("coupon", "TEXT", lambda: "NONE", reserved=True),
     }
@@ -72,6 +69,7 @@ def run_simulation(conn):
         evolution_controller=evolution,
         total_records=30,
         batch_size=5,
+        columnar=True,
     )
 
     runner.run()
@@ -3,7 +3,6 @@
 import logging
 import os
 import random
-import uuid
 
 import psycopg2
 
@@ -17,6 +16,7 @@ from kraft import (
     get_registered_columns,
     register_column,
 )
+from kraft.generators import FloatGenerator, IntegerGenerator, UUIDGenerator
 
 TABLE_NAME = "registry_sales"
 
@@ -24,9 +24,7 @@ TABLE_NAME = "registry_sales"
 def register_columns():
     clear_column_registry()
 
-    @register_column(name="id", sql_type="UUID", protected=True)
-    def generate_id():
-        return str(uuid.uuid4())
+    register_column(name="id", sql_type="UUID", protected=True, generator=UUIDGenerator())
 
     @register_column(name="updated_at", sql_type="TIMESTAMP", protected=True)
     def updated_at():
@@ -36,13 +34,12 @@ def register_columns():
     def product():
         return random.choice(["bag", "jacket", "socks"])
 
-    @register_column(name="quantity", sql_type="INT")
-    def quantity():
-        return random.randint(1, 10)
-
-    @register_column(name="unit_price", sql_type="FLOAT")
-    def unit_price():
-        return round(random.uniform(15, 120), 2)
+    register_column(name="quantity", sql_type="INT", generator=IntegerGenerator(1, 10))
+    register_column(
+        name="unit_price",
+        sql_type="FLOAT",
+        generator=FloatGenerator(low=15, high=120, precision=2),
+    )
 
     @register_column(name="discount_rate", sql_type="FLOAT", reserved=True)
     def discount():
@@ -86,6 +83,7 @@ def run_simulation(conn):
         evolution_controller=evolution,
         total_records=20,
         batch_size=4,
+        columnar=True,
     )
     runner.run()
 
@@ -1,20 +1,68 @@
 from __future__ import annotations
 
-from kraft.core.batch import BatchGenerator
+from kraft.core.async_mutator import AsyncMutationEngine
+from kraft.core.async_runner import AsyncSimulationRunner
+from kraft.core.batch import BatchGenerator, ColumnarBatch
+from kraft.core.capture import (
+    CaptureEngine,
+    CaptureSchemaManager,
+    CaptureWriter,
+    Replayer,
+    read_capture,
+)
 from kraft.core.column import ColumnDefinition
+from kraft.core.ddl import LockPolicy
 from kraft.core.evolution import EvolutionController
+from kraft.core.keys import LiveKeyIndex
+from kraft.core.metrics import JSONLinesSink, MemorySink, Metrics, MetricsSink, PrometheusTextSink
 from kraft.core.mutator import MutationEngine
+from kraft.core.parallel import ParallelSimulationRunner
+from kraft.core.pool import ConnectionPool
+from kraft.core.rate import RateController
 from kraft.core.registry import clear_column_registry, get_registered_columns, register_column
 from kraft.core.runner import SimulationRunner
 from kraft.core.schema import SchemaManager
+from kraft.core.seed import RandomStreams
+from kraft.core.strategy import MixStrategy, MutationStrategy, RandomStrategy
+from kraft.core.transaction import TransactionPolicy
+from kraft.core.value_pool import PooledGenerator, ValuePool, pooled_columns
+from kraft.core.workload import TableSpec, Workload
 
 __all__ = [
     "ColumnDefinition",
     "BatchGenerator",
+    "ColumnarBatch",
     "MutationEngine",
+    "LiveKeyIndex",
+    "MutationStrategy",
+    "RandomStrategy",
+    "MixStrategy",
+    "TransactionPolicy",
+    "AsyncMutationEngine",
     "EvolutionController",
     "SimulationRunner",
+    "RateController",
+    "ParallelSimulationRunner",
+    "AsyncSimulationRunner",
     "SchemaManager",
+    "ConnectionPool",
+    "LockPolicy",
+    "Metrics",
+    "MetricsSink",
+    "MemorySink",
+    "JSONLinesSink",
+    "PrometheusTextSink",
+    "RandomStreams",
+    "CaptureWriter",
+    "CaptureEngine",
+    "CaptureSchemaManager",
+    "Replayer",
+    "read_capture",
+    "ValuePool",
+    "PooledGenerator",
+    "pooled_columns",
+    "TableSpec",
+    "Workload",
     "register_column",
     "get_registered_columns",
     "clear_column_registry",
@@ -0,0 +1,481 @@
+"""Throughput benchmarks for the generation, mutation and evolution hot paths.
+
+Run the suite with ``python -m kraft.bench`` (or the ``kraft-bench`` script).
+By default every case runs against :class:`FakeConnection`, which accepts all
+statements without a server, so the numbers isolate Kraft's own Python costs.
+Pass ``--dsn`` to run the same cases against a disposable PostgreSQL database;
+each case creates and drops its own ``kraft_bench_*`` table.
+
+Results are written as JSON (``--output``) and can be compared with an earlier
+run (``--compare``) to catch regressions between commits::
+
+    python -m kraft.bench --output main.json
+    python -m kraft.bench --compare main.json --threshold 1.2
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+import psycopg2
+from psycopg2 import extensions
+
+from kraft.core import mutator as mutator_module
+from kraft.core.batch import BatchGenerator
+from kraft.core.column import ColumnDefinition
+from kraft.core.evolution import EvolutionController
+from kraft.core.mutator import MutationEngine
+from kraft.core.schema import SchemaManager
+from kraft.generators import (
+    FloatGenerator,
+    IntegerGenerator,
+    TextGenerator,
+    TimestampGenerator,
+    UUIDGenerator,
+)
+
+COLUMN_KINDS = ("int", "text", "uuid", "mixed")
+TARGETS = ("fake", "postgres")
+
+_MIXED = ("int", "text", "float", "timestamp", "uuid")
+
+
+@dataclass
+class BenchResult:
+    """Timings of one benchmark case.
+
+    ``operations`` is what one timed call processes: rows for generation and
+    DML, evolution events for evolution.
+    """
+
+    name: str
+    params: dict[str, Any]
+    operations: int
+    timings: list[float] = field(default_factory=list)
+
+    @property
+    def key(self) -> str:
+        """Stable identifier used to match cases across runs."""
+        params = ",".join(f"{name}={value}" for name, value in self.params.items())
+        return f"{self.name}[{params}]"
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.timings)
+
+    @property
+    def operations_per_second(self) -> float:
+        median = self.median
+        return self.operations / median if median > 0 else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "key": self.key,
+            "name": self.name,
+            "params": self.params,
+            "operations": self.operations,
+            "repeat": len(self.timings),
+            "min_seconds": min(self.timings),
+            "median_seconds": self.median,
+            "mean_seconds": statistics.fmean(self.timings),
+            "operations_per_second": self.operations_per_second,
+        }
+
+
+# ---------------------------------------------------------------------- #
+#   Fake driver                                                          #
+# ---------------------------------------------------------------------- #
+class FakeCursor:
+    """Cursor that adapts parameters like psycopg2 but sends nothing."""
+
+    def __init__(self) -> None:
+        self.query: bytes | None = None
+
+    def __enter__(self) -> FakeCursor:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+    def execute(self, query: Any, params: Sequence[Any] | None = None) -> None:
+        if params is not None:
+            for value in params:
+                _quote(value)
+
+    def mogrify(self, template: bytes, params: Sequence[Any]) -> bytes:
+        return template % tuple(_quote(value) for value in params)
+
+    def copy_expert(self, query: Any, buffer: Any) -> None:
+        buffer.read()
+
+    def fetchone(self) -> tuple[int]:
+        return (0,)
+
+
+class FakeConnection:
+    """Connection stand-in for measuring pure-Python costs."""
+
+    closed = 0
+
+    def cursor(self) -> FakeCursor:
+        return FakeCursor()
+
+    def commit(self) -> None:
+        return None
+
+    def rollback(self) -> None:
+        return None
+
+    def close(self) -> None:
+        return None
+
+
+def _quote(value: Any) -> bytes:
+    if isinstance(value, (list, tuple)):
+        return b"ARRAY[" + b",".join(_quote(item) for item in value) + b"]"
+    quoted: bytes = extensions.adapt(value).getquoted()
+    return quoted
+
+
+def fake_execute_values(
+    cur: FakeCursor,
+    query: Any,
+    argslist: Sequence[Sequence[Any]],
+    template: bytes | None = None,
+    page_size: int = 100,
+) -> None:
+    """Render every row the way ``execute_values`` would, without sending it.
+
+    psycopg2 can only quote the identifiers of a composed statement against a
+    live connection, so fake runs substitute this function for the real one.
+    """
+    for start in range(0, len(argslist), page_size):
+        page = argslist[start : start + page_size]
+        cur.query = b",".join(
+            cur.mogrify(b"(" + b",".join([b"%s"] * len(row)) + b")", row) for row in page
+        )
+
+
+@contextmanager
+def _fake_driver() -> Iterator[None]:
+    original = mutator_module.execute_values
+    mutator_module.execute_values = fake_execute_values
+    try:
+        yield
+    finally:
+        mutator_module.execute_values = original
+
+
+# ---------------------------------------------------------------------- #
+#   Cases                                                                #
+# ---------------------------------------------------------------------- #
+def bench_columns(count: int, kind: str, *, reserved: int = 0) -> dict[str, ColumnDefinition]:
+    """Return a ``UUID`` key plus ``count`` active and ``reserved`` dormant columns."""
+    if kind not in COLUMN_KINDS:
+        raise ValueError(f"kind must be one of {COLUMN_KINDS}, got {kind!r}")
+    columns = {"id": ColumnDefinition("id", "UUID", UUIDGenerator(), protected=True)}
+    for index in range(count + reserved):
+        column_kind = _MIXED[index % len(_MIXED)] if kind == "mixed" else kind
+        name = f"c{index}"
+        sql_type, generator = _column_kind(column_kind)
+        columns[name] = ColumnDefinition(name, sql_type, generator, reserved=index >= count)
+    return columns
+
+
+def _column_kind(kind: str) -> tuple[str, Callable[[], Any]]:
+    if kind == "int":
+        return "INT", IntegerGenerator(0, 1_000_000)
+    if kind == "text":
+        return "TEXT", TextGenerator(8, 32)
+    if kind == "float":
+        return "DOUBLE PRECISION", FloatGenerator()
+    if kind == "timestamp":
+        return "TIMESTAMP", TimestampGenerator(datetime(2020, 1, 1), datetime(2030, 1, 1))
+    return "UUID", UUIDGenerator()
+
+
+def _measure(
+    call: Callable[[], Any], repeat: int, setup: Callable[[], Any] | None = None
+) -> list[float]:
+    timings = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        started = time.perf_counter()
+        call()
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def bench_generate(
+    *, columns: int, kind: str, rows: int, repeat: int, columnar: bool = False
+) -> BenchResult:
+    """Time :meth:`BatchGenerator.generate_batch` (or ``generate_columnar``)."""
+    generator = BatchGenerator(schema=bench_columns(columns, kind))
+    generate = generator.generate_columnar if columnar else generator.generate_batch
+    result = BenchResult(
+        "generate_columnar" if columnar else "generate_batch",
+        {"columns": columns, "kind": kind},
+        rows,
+    )
+    result.timings = _measure(lambda: generate(rows), repeat)
+    return result
+
+
+class _Table:
+    """A benchmark table on the target, created on entry and dropped on exit."""
+
+    def __init__(self, conn: Any, columns: dict[str, ColumnDefinition]):
+        self.manager = SchemaManager(
+            conn,
+            schema="public",
+            table_name=f"kraft_bench_{uuid.uuid4().hex[:12]}",
+            columns=columns,
+        )
+        self.generator = BatchGenerator(schema=self.manager.get_active_columns())
+
+    def __enter__(self) -> _Table:
+        self.manager.create_table()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.manager.drop_table()
+
+    def engine(self, **options: Any) -> MutationEngine:
+        return MutationEngine(
+            self.manager.conn,
+            schema=self.manager.schema,
+            table_name=self.manager.table_name,
+            generator=self.generator,
+            schema_manager=self.manager,
+            **options,
+        )
+
+
+def bench_insert(
+    conn: Any, *, mode: str, copy_format: str = "text", columns: int, rows: int, repeat: int
+) -> BenchResult:
+    """Time :meth:`MutationEngine.insert_batch` with one insert mode."""
+    params: dict[str, Any] = {"mode": mode, "columns": columns}
+    if mode == "copy":
+        params["format"] = copy_format
+    result = BenchResult("insert_batch", params, rows)
+    with _Table(conn, bench_columns(columns, "mixed")) as table:
+        engine = table.engine(insert_mode=mode, copy_format=copy_format)
+        batches: list[Any] = []
+        result.timings = _measure(
+            lambda: engine.insert_batch(batches.pop()),
+            repeat,
+            setup=lambda: batches.append(table.generator.generate_batch(rows)),
+        )
+    return result
+
+
+def bench_mutation(
+    conn: Any, *, operation: str, update_mode: str = "row", columns: int, rows: int, repeat: int
+) -> BenchResult:
+    """Time :meth:`MutationEngine.update_rows` or ``delete_rows`` on fresh rows."""
+    params: dict[str, Any] = {"columns": columns}
+    if operation == "update":
+        params["mode"] = update_mode
+    result = BenchResult(f"{operation}_rows", params, rows)
+    with _Table(conn, bench_columns(columns, "mixed")) as table:
+        engine = table.engine(update_mode=update_mode)
+        apply = engine.update_rows if operation == "update" else engine.delete_rows
+        targets: list[Any] = []
+        result.timings = _measure(
+            lambda: apply(targets.pop()),
+            repeat,
+            setup=lambda: targets.append(engine.insert_batch(table.generator.generate_batch(rows))),
+        )
+    return result
+
+
+def bench_evolution(conn: Any, *, columns: int, evolutions: int, repeat: int) -> BenchResult:
+    """Time ``evolutions`` add/drop events on a table with ``columns`` registered columns."""
+    result = BenchResult("evolve", {"columns": columns}, evolutions)
+    controllers: list[EvolutionController] = []
+    tables: list[_Table] = []
+
+    def setup() -> None:
+        table = _Table(conn, bench_columns(columns // 2, "int", reserved=columns - columns // 2))
+        tables.append(table.__enter__())
+        controllers.append(
+            EvolutionController(
+                table.manager,
+                evolution_interval=1,
+                evolution_probability=1.0,
+                max_additions=evolutions,
+                max_drops=evolutions,
+            )
+        )
+
+    def evolve() -> None:
+        controller = controllers.pop()
+        for batch_number in range(1, evolutions + 1):
+            controller.evolve(batch_number)
+
+    try:
+        result.timings = _measure(evolve, repeat, setup=setup)
+    finally:
+        for table in tables:
+            table.__exit__(None, None, None)
+    return result
+
+
+# ---------------------------------------------------------------------- #
+#   Suite                                                                #
+# ---------------------------------------------------------------------- #
+def run_suite(
+    conn: Any = None, *, repeat: int = 5, quick: bool = False, target: str = "fake"
+) -> list[BenchResult]:
+    """Run every case; ``conn`` defaults to a :class:`FakeConnection`.
+
+    ``quick`` shrinks every case by a factor of ten, e.g. for smoke tests.
+    """
+    if target not in TARGETS:
+        raise ValueError(f"target must be one of {TARGETS}, got {target!r}")
+    if repeat < 1:
+        raise ValueError(f"repeat must be at least 1, got {repeat!r}")
+    scale = 10 if quick else 1
+    rows = 1_000 // scale
+    # PostgreSQL counts dropped columns towards its 1600 column limit.
+    registered = (1_000 if target == "fake" else 200) // scale
+    evolutions = (200 if target == "fake" else 20) // scale
+
+    results = [
+        bench_generate(columns=columns, kind=kind, rows=rows, repeat=repeat)
+        for columns in (10, 100)
+        for kind in COLUMN_KINDS
+    ]
+    results += [
+        bench_generate(columns=columns, kind="mixed", rows=rows, repeat=repeat, columnar=True)
+        for columns in (10, 100)
+    ]
+    conn = conn if conn is not None else FakeConnection()
+    with _fake_driver() if target == "fake" else nullcontext():
+        results += [
+            bench_insert(conn, mode="values", columns=20, rows=rows, repeat=repeat),
+            bench_insert(conn, mode="copy", columns=20, rows=rows, repeat=repeat),
+            bench_insert(
+                conn, mode="copy", copy_format="binary", columns=20, rows=rows, repeat=repeat
+            ),
+            bench_mutation(conn, operation="update", columns=20, rows=rows // 5, repeat=repeat),
+            bench_mutation(
+                conn,
+                operation="update",
+                update_mode="batch",
+                columns=20,
+                rows=rows // 5,
+                repeat=repeat,
+            ),
+            bench_mutation(conn, operation="delete", columns=20, rows=rows // 5, repeat=repeat),
+            bench_evolution(conn, columns=registered, evolutions=evolutions, repeat=repeat),
+        ]
+    return results
+
+
+def report(results: Sequence[BenchResult], *, target: str) -> dict[str, Any]:
+    """Return a JSON-serialisable report of ``results`` and the environment."""
+    return {
+        "commit": _git_revision(),
+        "timestamp": time.time(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "target": target,
+        "results": [result.to_dict() for result in results],
+    }
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any]) -> dict[str, float]:
+    """Return each shared case's median time relative to ``baseline``.
+
+    Values above ``1.0`` mean the current run is slower.
+    """
+    previous = {entry["key"]: entry["median_seconds"] for entry in baseline["results"]}
+    return {
+        entry["key"]: entry["median_seconds"] / previous[entry["key"]]
+        for entry in current["results"]
+        if previous.get(entry["key"])
+    }
+
+
+def _git_revision() -> str | None:
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return completed.stdout.strip() or None
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="kraft-bench", description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--dsn",
+        default=os.getenv("KRAFT_BENCH_DSN"),
+        help="PostgreSQL DSN; omit to benchmark against a fake connection",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per case")
+    parser.add_argument("--quick", action="store_true", help="shrink every case tenfold")
+    parser.add_argument("--output", help="write the JSON report to this file")
+    parser.add_argument("--compare", help="JSON report of an earlier run to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        help="exit with status 1 if a case is this many times slower than --compare",
+    )
+    args = parser.parse_args(argv)
+    logging.getLogger("kraft").setLevel(logging.ERROR)
+
+    target = "postgres" if args.dsn else "fake"
+    conn = psycopg2.connect(args.dsn) if args.dsn else None
+    try:
+        results = run_suite(conn, repeat=args.repeat, quick=args.quick, target=target)
+    finally:
+        if conn is not None:
+            conn.close()
+    current = report(results, target=target)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(current, handle, indent=2)
+
+    ratios: dict[str, float] = {}
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as handle:
+            ratios = compare(current, json.load(handle))
+    for result in results:
+        line = (
+            f"{result.key:<60} {result.median * 1000:10.2f} ms"
+            f" {result.operations_per_second:14,.0f}/s"
+        )
+        if result.key in ratios:
+            line += f"  x{ratios[result.key]:.2f}"
+        print(line)
+
+    if args.threshold is not None and any(ratio > args.threshold for ratio in ratios.values()):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,385 @@
+"""asyncio counterpart of :class:`~kraft.core.mutator.MutationEngine`.
+
+The engine talks to PostgreSQL through a psycopg 3 ``AsyncConnectionPool`` (see
+:func:`create_pool`), borrowing a connection per statement group, or per
+transaction under a :class:`~kraft.core.transaction.TransactionPolicy`.  Many
+engines can share one pool, so a single event loop can drive dozens of tables
+without a thread per stream.  Install the ``async`` extra to pull in psycopg 3.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import time
+from collections.abc import AsyncIterator, Iterable, Sequence
+from contextlib import asynccontextmanager
+from typing import Any
+
+from psycopg2 import sql
+
+from kraft.core.batch import BatchGenerator, ColumnarBatch
+from kraft.core.keys import KeyArray, LiveKeyIndex, key_array
+from kraft.core.metrics import Metrics
+from kraft.core.mutator import _MutationPlanner
+from kraft.core.strategy import MutationStrategy
+from kraft.core.transaction import TransactionPolicy
+
+logger = logging.getLogger(__name__)
+
+# PostgreSQL's wire protocol caps a statement at 65535 bind parameters.
+MAX_PARAMETERS = 65_535
+
+
+async def create_pool(
+    conninfo: str, *, min_size: int = 1, max_size: int = 10, **kwargs: Any
+) -> Any:
+    """Open a psycopg ``AsyncConnectionPool`` suitable for :class:`AsyncMutationEngine`.
+
+    Args:
+        conninfo: libpq connection string.
+        min_size: Connections kept open by the pool.
+        max_size: Upper bound on concurrently borrowed connections.
+        **kwargs: Forwarded to ``AsyncConnectionPool``.
+    """
+    try:
+        from psycopg_pool import AsyncConnectionPool
+    except ImportError as exc:  # pragma: no cover - depends on the environment
+        raise ImportError("create_pool requires psycopg 3; install kraft[async]") from exc
+
+    pool = AsyncConnectionPool(
+        conninfo, min_size=min_size, max_size=max_size, open=False, **kwargs
+    )
+    await pool.open()
+    return pool
+
+
+def _ident(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _values_placeholders(rows: int, width: int) -> sql.SQL:
+    row = "(" + ", ".join(["%s"] * width) + ")"
+    return sql.SQL(", ".join([row] * rows))
+
+
+def _render(query: sql.Composable) -> str:
+    """Render a statement from the shared psycopg2 builders as psycopg 3 query text.
+
+    The builders only compose ``SQL`` fragments and identifiers, which need no
+    connection to quote.
+    """
+    if isinstance(query, sql.Composed):
+        return "".join(map(_render, query.seq))
+    if isinstance(query, sql.Identifier):
+        return ".".join(map(_ident, query.strings))
+    if isinstance(query, sql.SQL):
+        return str(query.string)
+    raise TypeError(f"Cannot render {query!r} without a connection")
+
+
+class AsyncMutationEngine(_MutationPlanner):
+    """Perform bulk insert/update/delete operations using an async connection pool.
+
+    Target sampling, update plans, statement text and counters are shared with
+    :class:`~kraft.core.mutator.MutationEngine`; this class only awaits the
+    statements, and every public mutation method is a coroutine.
+    """
+
+    def __init__(
+        self,
+        pool: Any,
+        *,
+        schema: str,
+        table_name: str,
+        primary_key: str = "id",
+        update_column: str | None = None,
+        generator: BatchGenerator | None = None,
+        insert_mode: str = "values",
+        copy_format: str = "text",
+        update_mode: str = "row",
+        mutation_probability: float = 0.5,
+        update_ratio: float = 0.5,
+        sample_fraction: float = 0.25,
+        key_index: LiveKeyIndex | None = None,
+        key_type: str = "object",
+        strategy: MutationStrategy | None = None,
+        transaction_policy: TransactionPolicy | None = None,
+        metrics: Metrics | None = None,
+        rng: random.Random | None = None,
+    ):
+        """
+        Args:
+            pool: psycopg ``AsyncConnectionPool`` (or any object whose
+                ``connection()`` returns an async context manager yielding an
+                ``AsyncConnection``).
+            schema: Database schema (e.g. ``public``).
+            table_name: Target table for all mutations.
+            primary_key: Column name used for ``WHERE`` clauses.
+            update_column: Optional ``TIMESTAMP`` column that should be bumped
+                whenever a row is updated (e.g. ``updated_at``).
+            generator: Optional :class:`BatchGenerator` used to pick random
+                columns/values during updates.
+            insert_mode: ``"values"`` sends multi-row ``INSERT ... VALUES``
+                statements; ``"copy"`` streams batches with ``COPY ... FROM
+                STDIN`` and falls back to ``"values"`` when a value cannot be
+                encoded.
+            copy_format: ``"text"`` or ``"binary"`` COPY encoding.
+            update_mode: ``"row"`` issues one ``UPDATE`` per sampled id;
+                ``"batch"`` applies each chosen column with a single
+                ``UPDATE ... FROM (VALUES ...)`` statement.
+            mutation_probability: Chance that :meth:`maybe_mutate_batch`
+                mutates anything at all (default strategy only).
+            update_ratio: Share of mutations that are updates rather than
+                deletes (default strategy only).
+            sample_fraction: Fraction of the batch's ids sampled by each
+                mutation, at least one id (default strategy only).
+            key_index: Optional :class:`LiveKeyIndex`.  Inserted keys are
+                registered in it and mutations sample their targets from it,
+                so rows of any age are updated and deleted keys are never
+                targeted again.  Without an index only the ids of the batch
+                just inserted are mutated.
+            key_type: How inserted primary keys are held: ``"object"`` keeps
+                the generated values, ``"uuid"`` packs them into 16 bytes each
+                and ``"int"`` into a 64-bit array.  Packed keys are decoded
+                only for the sampled ids handed to the driver.
+            strategy: :class:`MutationStrategy` deciding how many updates and
+                deletes follow each batch, how many ids go into one statement
+                and how many columns an update changes.  Defaults to a
+                :class:`RandomStrategy` built from ``mutation_probability``,
+                ``update_ratio`` and ``sample_fraction``.
+            transaction_policy: Optional :class:`TransactionPolicy`.  Without
+                one every statement group borrows a pooled connection and
+                commits on its own; with one, the engine holds a connection
+                and its open transaction until :meth:`end_batch` reports a
+                due commit or :meth:`flush` is called.
+            metrics: Optional :class:`Metrics` recorder timing the
+                ``insert``, ``update``, ``delete`` and ``commit`` phases and
+                counting rows and COPY payload bytes.
+            rng: Random source for choosing mutation targets and updated
+                columns, and for the default strategy (defaults to the
+                ``random`` module).
+        """
+        super().__init__(
+            schema=schema,
+            table_name=table_name,
+            primary_key=primary_key,
+            update_column=update_column,
+            generator=generator,
+            insert_mode=insert_mode,
+            copy_format=copy_format,
+            update_mode=update_mode,
+            mutation_probability=mutation_probability,
+            update_ratio=update_ratio,
+            sample_fraction=sample_fraction,
+            key_index=key_index,
+            key_type=key_type,
+            strategy=strategy,
+            transaction_policy=transaction_policy,
+            metrics=metrics,
+            rng=rng,
+        )
+        self.pool = pool
+        self._conn: Any = None
+
+    async def insert_batch(self, rows: list[dict[str, object]] | ColumnarBatch) -> KeyArray:
+        """Insert a batch of row dictionaries or a :class:`ColumnarBatch`.
+
+        Returns the primary key values of the inserted rows, stored as
+        configured by ``key_type``.
+        """
+        if not rows:
+            return key_array(self.key_type)
+
+        started = self._clock() if self.metrics is not None else 0.0
+        columns, column_values, inserted_ids = self._split_rows(rows)
+        payload = None
+        if self.insert_mode == "copy":
+            payload = await self._copy_columns(columns, column_values)
+        if payload is None:
+            await self._insert_values(columns, column_values)
+        self._inserted(len(rows), inserted_ids, started, payload or 0)
+        return inserted_ids
+
+    async def _insert_values(self, columns: list[str], column_values: list[list[Any]]) -> None:
+        """Insert with multi-row ``VALUES`` statements sized under the parameter cap."""
+        values = list(zip(*column_values, strict=True))
+        chunk = max(1, MAX_PARAMETERS // len(columns))
+        async with self._cursor() as cur:
+            for start in range(0, len(values), chunk):
+                page = values[start : start + chunk]
+                query = self._insert_query(columns, _values_placeholders(len(page), len(columns)))
+                await cur.execute(_render(query), [value for row in page for value in row])
+
+    async def _copy_columns(self, columns: list[str], column_values: list[list[Any]]) -> int | None:
+        """Stream the batch with ``COPY`` and return the payload size in bytes.
+
+        Returns ``None`` without writing anything if the batch cannot be encoded.
+        """
+        buffer = self._encode_copy(columns, column_values)
+        if buffer is None:
+            return None
+        query = _render(self._copy_query(columns))
+        async with self._cursor() as cur, cur.copy(query) as copy:
+            await copy.write(buffer.getvalue())
+        return buffer.getbuffer().nbytes
+
+    async def maybe_mutate_batch(self, ids: Iterable[object]) -> tuple[int, int]:
+        """Run the updates and deletes :attr:`strategy` plans for a new batch."""
+        if not isinstance(ids, Sequence):
+            ids = list(ids)
+        updates, deletes = self.strategy.plan(len(ids))
+        updated = await self.mutate("update", updates, ids) if updates else 0
+        deleted = await self.mutate("delete", deletes, ids) if deletes else 0
+        return updated, deleted
+
+    async def mutate(self, operation: str, count: int, ids: Iterable[object] = ()) -> int:
+        """Update or delete up to ``count`` rows and return how many were affected.
+
+        Targets come from :attr:`key_index` when configured (deleted keys are
+        removed from it), otherwise from ``ids``.  Each statement carries at
+        most :meth:`MutationStrategy.batch_size` ids.
+        """
+        chunks, positions = self._mutation_targets(operation, count, ids)
+        if operation == "update":
+            return sum([await self.update_rows(chunk) for chunk in chunks])
+        deleted = sum([await self.delete_rows(chunk) for chunk in chunks])
+        self._forget_deleted(positions)
+        return deleted
+
+    async def update_rows(self, ids: Iterable[object]) -> int:
+        """Update ``ids`` with fresh values and count them; returns rows updated."""
+        started = self._clock() if self.metrics is not None else 0.0
+        updated = await self._update_records(list(ids))
+        self._updated(updated, started)
+        return updated
+
+    async def delete_rows(self, ids: Iterable[object]) -> int:
+        """Delete ``ids`` and count them; returns rows deleted.
+
+        Explicit ids are not removed from :attr:`key_index`; use :meth:`mutate`
+        or :meth:`LiveKeyIndex.discard` to keep it in sync.
+        """
+        started = self._clock() if self.metrics is not None else 0.0
+        deleted = await self._delete_records(list(ids))
+        self._deleted(deleted, started)
+        return deleted
+
+    async def _update_records(self, ids: list[object]) -> int:
+        modifiable = self._modifiable_columns(ids)
+        if not modifiable:
+            return 0
+
+        if self.update_mode == "batch":
+            await self._apply_update_groups(self._update_groups(ids, modifiable))
+            return len(ids)
+
+        async with self._cursor() as cur:
+            for columns, params in self._row_updates(ids, modifiable):
+                await cur.execute(_render(self._row_update_query(columns)), params)
+
+        return len(ids)
+
+    async def _apply_update_groups(
+        self, groups: dict[tuple[str, ...], list[tuple[object, ...]]]
+    ) -> None:
+        """Apply each column set's ``(id, *values)`` rows with set-based statements."""
+        async with self._cursor() as cur:
+            for columns, rows in groups.items():
+                chunk = MAX_PARAMETERS // (len(columns) + 1)
+                for start in range(0, len(rows), chunk):
+                    page = rows[start : start + chunk]
+                    values = _values_placeholders(len(page), len(columns) + 1)
+                    await cur.execute(
+                        _render(self._batched_update_query(columns, values)),
+                        [value for row in page for value in row],
+                    )
+
+    async def _delete_records(self, ids: list[object]) -> int:
+        if not ids:
+            return 0
+
+        query = sql.SQL("DELETE FROM {}.{} WHERE {} = ANY(%s{})").format(
+            sql.Identifier(self.schema),
+            sql.Identifier(self.table_name),
+            sql.Identifier(self.primary_key),
+            sql.SQL(self._delete_cast()),
+        )
+        async with self._cursor() as cur:
+            await cur.execute(_render(query), (ids,))
+
+        return len(ids)
+
+    # ------------------------------------------------------------------ #
+    #   Connections and transactions                                     #
+    # ------------------------------------------------------------------ #
+    @asynccontextmanager
+    async def _cursor(self) -> AsyncIterator[Any]:
+        """Run one statement group; commits unless a transaction policy defers it.
+
+        Without a policy the group borrows a pooled connection for its
+        duration.  With one, the engine keeps its connection until
+        :meth:`flush`; a failing statement hands it back (rolled back) instead.
+        """
+        if self.transaction_policy is None:
+            async with self.pool.connection() as conn:
+                async with conn.cursor() as cur:
+                    yield cur
+                await self._commit(conn)
+            return
+
+        if self._conn is None:
+            self._conn = await self.pool.getconn()
+        try:
+            async with self._conn.cursor() as cur:
+                await self._begin(cur)
+                yield cur
+        except Exception:
+            await self.release_connection()
+            raise
+
+    async def _begin(self, cur: Any) -> None:
+        """Open the policy's transaction before the first statement of a window."""
+        policy = self.transaction_policy
+        if policy is None or self._in_transaction:
+            return
+        self._in_transaction = True
+        policy.begin()
+        if not policy.synchronous_commit:
+            await cur.execute("SET LOCAL synchronous_commit TO off")
+
+    async def _commit(self, conn: Any) -> None:
+        """Commit, observing the ``commit`` phase when metrics are enabled."""
+        if self.metrics is None:
+            await conn.commit()
+            return
+        started = time.perf_counter()
+        await conn.commit()
+        self._committed(started)
+
+    async def end_batch(self, rows: int) -> bool:
+        """Mark the end of a batch of ``rows``; returns ``True`` if it committed.
+
+        A no-op without a :attr:`transaction_policy`.
+        """
+        policy = self.transaction_policy
+        if policy is None or not policy.record(rows):
+            return False
+        await self.flush()
+        return True
+
+    async def flush(self) -> None:
+        """Commit the open policy transaction, if any, and return its connection."""
+        if self._in_transaction:
+            await self._commit(self._conn)
+            self._in_transaction = False
+        await self.release_connection()
+
+    async def release_connection(self) -> None:
+        """Hand the policy's connection back to the pool, rolling back open work."""
+        conn, self._conn = self._conn, None
+        self._in_transaction = False
+        if self.transaction_policy is not None:
+            self.transaction_policy.reset()
+        if conn is not None:
+            await self.pool.putconn(conn)
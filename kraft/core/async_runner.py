@@ -0,0 +1,104 @@
+"""asyncio orchestrator mirroring :class:`~kraft.core.runner.SimulationRunner`."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Iterable
+
+from kraft.core.async_mutator import AsyncMutationEngine
+from kraft.core.batch import BatchGenerator, ColumnarBatch
+from kraft.core.column import ColumnDefinition
+from kraft.core.evolution import EvolutionController
+from kraft.core.registry import get_registered_columns
+from kraft.core.schema import SchemaManager
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncSimulationRunner:
+    """Coordinate batch generation, async mutations, and schema evolution.
+
+    Runners for different tables can share one connection pool and be driven
+    concurrently with ``asyncio.gather(*(runner.run() for runner in runners))``.
+    Schema evolution still goes through the blocking :class:`SchemaManager`; it
+    is dispatched to a worker thread so other runners keep making progress.
+    """
+
+    def __init__(
+        self,
+        schema_manager: SchemaManager,
+        mutator: AsyncMutationEngine,
+        *,
+        total_records: int = 10_000,
+        batch_size: int = 500,
+        batch_generator: BatchGenerator | None = None,
+        evolution_controller: EvolutionController | None = None,
+        column_registry: dict[str, ColumnDefinition] | None = None,
+        protected_columns: Iterable[str] | None = None,
+        columnar: bool = False,
+    ):
+        """
+        Args:
+            schema_manager: Manages physical table schema and evolution history.
+            mutator: Performs inserts/updates/deletes for each batch.
+            total_records: Total number of synthetic records to emit.
+            batch_size: Number of rows generated per iteration.
+            batch_generator: Optional generator instance; a new one will be
+                created automatically when omitted.
+            evolution_controller: Optional controller that decides when to add
+                or drop columns.
+            column_registry: Optional registry snapshot to seed new generators.
+            protected_columns: Additional columns that should never be dropped.
+            columnar: When ``True`` batches are generated as
+                :class:`ColumnarBatch` objects.
+        """
+        self.schema_manager = schema_manager
+        self.mutator = mutator
+        self.total_records = total_records
+        self.batch_size = batch_size
+        self.batch_generator = batch_generator or BatchGenerator(
+            schema=self.schema_manager.get_active_columns()
+        )
+        self.evolution_controller = evolution_controller
+        self.column_registry = column_registry or get_registered_columns()
+        self.protected_columns = set(protected_columns or [])
+        self.columnar = columnar
+
+        has_work = total_records > 0 and batch_size > 0
+        self.total_batches = -(-total_records // batch_size) if has_work else 0
+
+    async def run(self) -> None:
+        """Execute the simulation loop."""
+        if self.total_batches <= 0:
+            return
+
+        logger.info(
+            "Starting async simulation on %s.%s: %d records across %d batches",
+            self.mutator.schema,
+            self.mutator.table_name,
+            self.total_records,
+            self.total_batches,
+        )
+        for batch_num in range(1, self.total_batches + 1):
+            # The final batch is shortened when total_records is not a multiple.
+            size = min(self.batch_size, self.total_records - (batch_num - 1) * self.batch_size)
+            self.batch_generator.schema = self.schema_manager.get_active_columns()
+            rows: list[dict[str, object]] | ColumnarBatch
+            if self.columnar:
+                rows = self.batch_generator.generate_columnar(size)
+            else:
+                rows = self.batch_generator.generate_batch(size)
+
+            inserted_ids = await self.mutator.insert_batch(rows)
+            await self.mutator.maybe_mutate_batch(inserted_ids)
+            await self.mutator.end_batch(len(rows))
+            logger.debug("Completed batch %d/%d", batch_num, self.total_batches)
+
+            if self.evolution_controller:
+                if batch_num % self.evolution_controller.evolution_interval == 0:
+                    # DDL runs on another session; never let it wait on our locks.
+                    await self.mutator.flush()
+                await asyncio.to_thread(self.evolution_controller.evolve, batch_num)
+        await self.mutator.flush()
+        logger.info("Async simulation finished. Counters: %s", self.mutator.get_counters())
@@ -2,13 +2,51 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
 from typing import Any
 
 from kraft.core.column import ColumnDefinition
 from kraft.core.registry import get_registered_columns
 
 
+@dataclass
+class ColumnarBatch:
+    """Column-oriented batch: one equally sized value list per column.
+
+    Columnar batches avoid building a ``dict`` per row; consumers such as
+    :meth:`MutationEngine.insert_batch` read the column lists directly.
+    """
+
+    columns: dict[str, list[Any]]
+
+    def __post_init__(self) -> None:
+        lengths = {len(values) for values in self.columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"Columnar batch has ragged columns: {sorted(lengths)}")
+        self._length = lengths.pop() if lengths else 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    @property
+    def column_names(self) -> list[str]:
+        return list(self.columns)
+
+    def column(self, name: str) -> list[Any]:
+        """Return the values of ``name`` (raises ``KeyError`` when missing)."""
+        return self.columns[name]
+
+    def rows(self) -> Iterator[tuple[Any, ...]]:
+        """Iterate row tuples ordered like :attr:`column_names`."""
+        return zip(*self.columns.values(), strict=True)
+
+    def to_rows(self) -> list[dict[str, Any]]:
+        """Materialize the batch as row dictionaries."""
+        names = self.column_names
+        return [dict(zip(names, row, strict=True)) for row in self.rows()]
+
+
 class BatchGenerator:
     """Generate dictionaries that resemble table rows.
 
@@ -54,6 +92,12 @@ class BatchGenerator:
             raise KeyError(f"Unknown column '{column}'")
         return self.schema[column].generate()
 
+    def generate_values(self, column: str, count: int) -> list[Any]:
+        """Generate ``count`` values for the given column name."""
+        if column not in self.schema:
+            raise KeyError(f"Unknown column '{column}'")
+        return self.schema[column].generate_many(count)
+
     def generate_batch(self, batch_size: int) -> list[dict[str, Any]]:
         rows: list[dict[str, Any]] = []
         for _ in range(batch_size):
@@ -61,6 +105,16 @@ class BatchGenerator:
             rows.append(row)
         return rows
 
+    def generate_columnar(self, batch_size: int) -> ColumnarBatch:
+        """Generate a column-oriented batch.
+
+        Columns that declare a ``batch_generator`` produce all values in one
+        call; scalar-only columns fall back to one generator call per value.
+        """
+        return ColumnarBatch(
+            {name: col.generate_many(batch_size) for name, col in self.schema.items()}
+        )
+
     def get_modifiable_columns(self, *, exclude: Iterable[str] | None = None) -> list[str]:
         excluded = set(exclude or [])
         return [
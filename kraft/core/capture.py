@@ -0,0 +1,411 @@
+"""Capture a generated workload to a file and replay it into PostgreSQL."""
+
+from __future__ import annotations
+
+import io
+import json
+import logging
+import struct
+import threading
+import time
+import zlib
+from collections.abc import Callable, Iterator, Sequence
+from dataclasses import dataclass
+from typing import Any, BinaryIO
+
+from psycopg2 import extensions, sql
+
+from kraft.core.column import ColumnDefinition
+from kraft.core.copy_codec import CopyEncodingError, encode_text_columns
+from kraft.core.mutator import MutationEngine
+from kraft.core.schema import SchemaManager
+
+logger = logging.getLogger(__name__)
+
+FRAME_KINDS = ("insert", "update", "delete", "ddl", "batch")
+PACINGS = ("max", "original")
+
+_MAGIC = b"KRAFTCAP\x01"
+# kind, seconds since capture start, meta length, body length
+_FRAME = struct.Struct("!BdII")
+
+
+@dataclass
+class CaptureFrame:
+    """One recorded operation.
+
+    ``meta`` names the table and columns; ``body`` holds the rows in
+    PostgreSQL's COPY text format, or as ``VALUES`` row literals when
+    ``meta["format"]`` is ``"values"`` (empty for ``ddl`` and ``batch``
+    frames).
+    """
+
+    kind: str
+    offset: float
+    meta: dict[str, Any]
+    body: bytes
+
+
+class CaptureWriter:
+    """Append operations to a capture file.
+
+    The file is a magic header followed by frames.  Each frame is a fixed
+    header, a JSON ``meta`` object and a zlib-compressed COPY text body, so
+    replay streams rows to the server without re-encoding them.  Writes are
+    serialised, so one writer can record every table of a
+    :class:`~kraft.core.workload.Workload`.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        compression_level: int = 6,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            path: File to create (an existing file is overwritten).
+            compression_level: zlib level for frame bodies, ``0`` to ``9``.
+            clock: Monotonic time source for frame offsets (overridable for
+                tests).
+        """
+        if not 0 <= compression_level <= 9:
+            raise ValueError(f"compression_level must be 0-9, got {compression_level!r}")
+        self.path = path
+        self.compression_level = compression_level
+        self.clock = clock
+        self.frames = 0
+        self._lock = threading.Lock()
+        self._file: BinaryIO = open(path, "wb")  # noqa: SIM115 - closed by close()
+        self._file.write(_MAGIC)
+        self._started_at = clock()
+
+    def write(self, kind: str, meta: dict[str, Any], body: bytes = b"") -> None:
+        """Append one frame of ``kind`` (see :data:`FRAME_KINDS`)."""
+        encoded_meta = json.dumps(meta, separators=(",", ":")).encode()
+        compressed = zlib.compress(body, self.compression_level) if body else b""
+        with self._lock:
+            header = _FRAME.pack(
+                FRAME_KINDS.index(kind),
+                self.clock() - self._started_at,
+                len(encoded_meta),
+                len(compressed),
+            )
+            self._file.write(header + encoded_meta + compressed)
+            self.frames += 1
+
+    def close(self) -> None:
+        """Flush and close the file."""
+        with self._lock:
+            self._file.close()
+
+    def __enter__(self) -> CaptureWriter:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def read_capture(path: str) -> Iterator[CaptureFrame]:
+    """Yield the frames of a capture file in recording order."""
+    with open(path, "rb") as handle:
+        if handle.read(len(_MAGIC)) != _MAGIC:
+            raise ValueError(f"{path} is not a Kraft capture file")
+        while header := handle.read(_FRAME.size):
+            if len(header) < _FRAME.size:
+                raise ValueError(f"{path} ends with a truncated frame")
+            kind, offset, meta_length, body_length = _FRAME.unpack(header)
+            meta = json.loads(handle.read(meta_length))
+            body = handle.read(body_length)
+            yield CaptureFrame(
+                FRAME_KINDS[kind], offset, meta, zlib.decompress(body) if body else b""
+            )
+
+
+class CaptureEngine(MutationEngine):
+    """A :class:`MutationEngine` that records its operations instead of running them.
+
+    Rows, update values and deleted keys are generated exactly as in a live
+    run (including the strategy, key index and seeded streams), then written
+    to a :class:`CaptureWriter`.  No connection is needed.  Updates are always
+    recorded set-based, grouped by the columns they change.
+    """
+
+    def __init__(self, writer: CaptureWriter, *, schema: str, table_name: str, **options: Any):
+        """
+        Args:
+            writer: Destination of the recorded operations.
+            schema: Database schema of the table.
+            table_name: Table the operations target.
+            **options: Other :class:`MutationEngine` options (``generator``,
+                ``primary_key``, ``update_column``, ``key_index``, ...).
+        """
+        options["update_mode"] = "batch"
+        super().__init__(None, schema=schema, table_name=table_name, **options)
+        self.writer = writer
+
+    def _meta(self, columns: Sequence[str], rows: int) -> dict[str, Any]:
+        return {
+            "schema": self.schema,
+            "table": self.table_name,
+            "columns": list(columns),
+            "rows": rows,
+        }
+
+    def _write(
+        self, kind: str, meta: dict[str, Any], names: Sequence[str], columns: list[list[Any]]
+    ) -> int:
+        """Write one frame of rows given column by column; returns the body size.
+
+        Rows are encoded as COPY text.  Like the live engine, a batch that
+        COPY cannot encode falls back to ``VALUES``: the body then holds
+        ``(...), (...)`` row literals and ``meta["format"]`` is ``"values"``.
+        """
+        sql_types = [self._column_type(name) for name in names]
+        try:
+            body = encode_text_columns(columns, sql_types).getvalue()
+        except CopyEncodingError as exc:
+            logger.debug("COPY text encoding unavailable, capturing VALUES: %s", exc)
+            meta["format"] = "values"
+            body = ", ".join(
+                f"({', '.join(map(_literal, row))})" for row in zip(*columns, strict=True)
+            ).encode("utf-8")
+        self.writer.write(kind, meta, body)
+        return len(body)
+
+    def _insert_columns(self, columns: list[str], column_values: list[list[Any]]) -> int:
+        meta = self._meta(columns, len(column_values[0]))
+        return self._write("insert", meta, columns, column_values)
+
+    def _apply_update_groups(self, groups: dict[tuple[str, ...], list[tuple[object, ...]]]) -> None:
+        for columns, rows in groups.items():
+            meta = self._meta(columns, len(rows))
+            meta.update(primary_key=self.primary_key, update_column=self.update_column)
+            names = [self.primary_key, *columns]
+            self._write("update", meta, names, [list(values) for values in zip(*rows, strict=True)])
+
+    def _delete_records(self, ids: list[object]) -> int:
+        if not ids:
+            return 0
+        meta = self._meta([], len(ids))
+        meta["primary_key"] = self.primary_key
+        self._write("delete", meta, [self.primary_key], [ids])
+        return len(ids)
+
+    def end_batch(self, rows: int) -> bool:
+        """Record a batch boundary, where replay commits."""
+        self.writer.write("batch", {"schema": self.schema, "table": self.table_name, "rows": rows})
+        return False
+
+    def flush(self) -> None:
+        """Nothing to commit; frames are written as they happen."""
+
+
+class CaptureSchemaManager(SchemaManager):
+    """A :class:`SchemaManager` that records DDL instead of running it.
+
+    Evolution behaves as in a live run and the active columns, history and
+    ``schema_version`` advance normally; each statement is written as a
+    ``ddl`` frame carrying the version its evolution event migrates from.
+    """
+
+    def __init__(
+        self,
+        writer: CaptureWriter,
+        *,
+        schema: str,
+        table_name: str,
+        columns: dict[str, ColumnDefinition],
+        **options: Any,
+    ):
+        """
+        Args:
+            writer: Destination of the recorded statements.
+            schema: Database schema of the table.
+            table_name: Table name.
+            columns: Column registry, as for :class:`SchemaManager`.
+            **options: Other :class:`SchemaManager` options.
+        """
+        super().__init__(None, schema=schema, table_name=table_name, columns=columns, **options)
+        self.writer = writer
+        self._event_version: int | None = None
+
+    def alter_columns(self, **counts: int) -> dict[str, list[str]]:
+        # Stamp every statement of the event with the version it started from.
+        self._event_version = self.schema_version
+        try:
+            return super().alter_columns(**counts)
+        finally:
+            self._event_version = None
+
+    def _execute(self, statement: str, *, track_rewrite: bool = False) -> None:
+        version = self._event_version if self._event_version is not None else self.schema_version
+        self.writer.write(
+            "ddl",
+            {
+                "schema": self.schema,
+                "table": self.table_name,
+                "version": version,
+                "statement": statement,
+            },
+        )
+        self.ddl_log.append(
+            {
+                "statement": statement,
+                "attempts": 1,
+                "succeeded": True,
+                "waited_seconds": 0.0,
+                "blocked_seconds": 0.0,
+            }
+        )
+
+
+def _literal(value: Any) -> str:
+    """Quote ``value`` for a ``VALUES`` list, as psycopg2 would for a query."""
+    adapted = extensions.adapt(value)
+    if isinstance(adapted, extensions.QuotedString):
+        adapted.encoding = "utf-8"
+    return str(adapted.getquoted().decode("utf-8"))
+
+
+class Replayer:
+    """Stream a capture file back into PostgreSQL through bulk paths.
+
+    Inserts are sent with ``COPY``; updates and deletes are copied into a
+    temporary table and applied with one ``UPDATE ... FROM`` or
+    ``DELETE ... USING`` statement per frame.  DDL runs as recorded.  The
+    replayer commits at every recorded batch boundary and after each DDL
+    statement.
+
+    With ``pacing="max"`` frames are applied as fast as the server accepts
+    them; with ``"original"`` each frame waits until its recorded offset
+    (divided by ``speed``) has elapsed, reproducing the captured rate.
+    """
+
+    def __init__(
+        self,
+        conn: Any,
+        path: str,
+        *,
+        pacing: str = "max",
+        speed: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Args:
+            conn: psycopg2 connection to the target database.
+            path: Capture file written by :class:`CaptureWriter`.
+            pacing: ``"max"`` or ``"original"``.
+            speed: Playback speed factor for ``"original"`` pacing.
+            clock: Monotonic time source (overridable for tests).
+            sleep: Function used to wait (overridable for tests).
+        """
+        if pacing not in PACINGS:
+            raise ValueError(f"pacing must be one of {PACINGS}, got {pacing!r}")
+        if speed <= 0:
+            raise ValueError(f"speed must be positive, got {speed!r}")
+        self.conn = conn
+        self.path = path
+        self.pacing = pacing
+        self.speed = speed
+        self.clock = clock
+        self.sleep = sleep
+        self.counters = dict.fromkeys(("inserts", "updates", "deletes", "ddl", "batches"), 0)
+
+    def run(self) -> dict[str, int]:
+        """Apply every frame and return rows (and statements) replayed per kind."""
+        started = self.clock()
+        for frame in read_capture(self.path):
+            if self.pacing == "original":
+                delay = frame.offset / self.speed - (self.clock() - started)
+                if delay > 0:
+                    self.sleep(delay)
+            self.apply(frame)
+        self.conn.commit()
+        logger.info("Replayed %s: %s", self.path, self.counters)
+        return dict(self.counters)
+
+    def apply(self, frame: CaptureFrame) -> None:
+        """Apply a single frame."""
+        meta = frame.meta
+        if frame.kind == "batch":
+            self.conn.commit()
+            self.counters["batches"] += 1
+            return
+        if frame.kind == "ddl":
+            with self.conn.cursor() as cur:
+                cur.execute(meta["statement"])
+            self.conn.commit()
+            self.counters["ddl"] += 1
+            return
+
+        relation = sql.SQL("{}.{}").format(
+            sql.Identifier(meta["schema"]), sql.Identifier(meta["table"])
+        )
+        with self.conn.cursor() as cur:
+            if frame.kind == "insert":
+                target = sql.SQL("{} ({})").format(
+                    relation, sql.SQL(", ").join(map(sql.Identifier, meta["columns"]))
+                )
+                self._load(cur, target, meta, frame.body)
+                self.counters["inserts"] += meta["rows"]
+            elif frame.kind == "update":
+                self._apply_staged(cur, relation, meta, frame.body, self._update_sql(meta))
+                self.counters["updates"] += meta["rows"]
+            else:
+                key = sql.Identifier(meta["primary_key"])
+                self._apply_staged(
+                    cur,
+                    relation,
+                    meta,
+                    frame.body,
+                    sql.SQL("DELETE FROM {} AS t USING kraft_replay AS s WHERE t.{} = s.{}").format(
+                        relation, key, key
+                    ),
+                )
+                self.counters["deletes"] += meta["rows"]
+
+    @staticmethod
+    def _load(cur: Any, target: sql.Composable, meta: dict[str, Any], body: bytes) -> None:
+        """Write a frame's rows into ``target`` with COPY, or INSERT for ``VALUES`` bodies."""
+        if meta.get("format") == "values":
+            cur.execute(
+                sql.SQL("INSERT INTO {} VALUES {}").format(target, sql.SQL(body.decode("utf-8")))
+            )
+        else:
+            cur.copy_expert(sql.SQL("COPY {} FROM STDIN").format(target), io.BytesIO(body))
+
+    @staticmethod
+    def _update_sql(meta: dict[str, Any]) -> sql.Composed:
+        assignments = [
+            sql.SQL("{} = s.{}").format(sql.Identifier(column), sql.Identifier(column))
+            for column in meta["columns"]
+        ]
+        if meta.get("update_column"):
+            assignments.append(sql.SQL("{} = now()").format(sql.Identifier(meta["update_column"])))
+        key = sql.Identifier(meta["primary_key"])
+        return sql.SQL("UPDATE {} AS t SET {} FROM kraft_replay AS s WHERE t.{} = s.{}").format(
+            sql.SQL("{}.{}").format(sql.Identifier(meta["schema"]), sql.Identifier(meta["table"])),
+            sql.SQL(", ").join(assignments),
+            key,
+            key,
+        )
+
+    @staticmethod
+    def _apply_staged(
+        cur: Any, relation: sql.Composed, meta: dict[str, Any], body: bytes, statement: Any
+    ) -> None:
+        """Copy ``body`` into a typed temporary table, run ``statement``, drop the table."""
+        columns = sql.SQL(", ").join(
+            map(sql.Identifier, [meta["primary_key"], *meta["columns"]])
+        )
+        cur.execute(
+            sql.SQL("CREATE TEMP TABLE kraft_replay AS SELECT {} FROM {} WITH NO DATA").format(
+                columns, relation
+            )
+        )
+        Replayer._load(cur, sql.SQL("kraft_replay"), meta, body)
+        cur.execute(statement)
+        cur.execute("DROP TABLE kraft_replay")
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 from typing import Any
 
@@ -25,6 +25,11 @@ class ColumnDefinition:
             materialized in the initial schema—useful for staged rollouts.
         protected: When ``True`` the column cannot be dropped by schema
             evolution routines (e.g. primary keys or audit columns).
+        batch_generator: Optional callable that produces ``n`` values at once
+            (a list or NumPy array).  Used by columnar batch generation; when
+            omitted, :meth:`generate_many` uses the generator's own
+            ``generate_many`` (as provided by :mod:`kraft.generators`) or falls
+            back to calling ``generator`` once per value.
     """
 
     name: str
@@ -33,11 +38,29 @@ class ColumnDefinition:
     constraints: str | None = None
     reserved: bool = False
     protected: bool = False
+    batch_generator: Callable[[int], Sequence[Any]] | None = None
 
     def generate(self) -> Any:
         """Return a fresh synthetic value for this column."""
         return self.generator()
 
+    def generate_many(self, count: int) -> list[Any]:
+        """Return ``count`` fresh values as a list of driver-friendly Python objects."""
+        batch_generator = self.batch_generator or getattr(self.generator, "generate_many", None)
+        if batch_generator is None:
+            generator = self.generator
+            return [generator() for _ in range(count)]
+
+        values = batch_generator(count)
+        # NumPy arrays convert to native Python scalars in one C-level pass.
+        result = values.tolist() if hasattr(values, "tolist") else list(values)
+        if len(result) != count:
+            raise ValueError(
+                f"Batch generator for '{self.name}' returned {len(result)} values, "
+                f"expected {count}"
+            )
+        return result
+
     def ddl(self) -> str:
         """Render the column definition for CREATE/ALTER TABLE statements."""
         parts = [self.name, self.sql_type]
@@ -0,0 +1,322 @@
+"""Encoders that render row batches for ``COPY ... FROM STDIN``."""
+
+from __future__ import annotations
+
+import io
+import json
+import re
+import struct
+import uuid
+from collections.abc import Callable, Iterable, Sequence
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from itertools import chain, repeat
+from typing import Any
+
+COPY_FORMATS = ("text", "binary")
+
+_BINARY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack("!ii", 0, 0)
+_BINARY_TRAILER = struct.pack("!h", -1)
+_LENGTH = struct.Struct("!i")
+_NULL_FIELD = _LENGTH.pack(-1)
+_PG_EPOCH = datetime(2000, 1, 1)
+_PG_EPOCH_TZ = datetime(2000, 1, 1, tzinfo=timezone.utc)
+_PG_EPOCH_DATE = date(2000, 1, 1).toordinal()
+_TEXT_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+_TYPE_PARAMS = re.compile(r"\s*\(.*\)\s*$")
+
+
+class CopyEncodingError(TypeError):
+    """Raised when a value cannot be represented in the requested COPY format."""
+
+
+def base_type(sql_type: str) -> str:
+    """Normalize a SQL type literal (``varchar(32)`` -> ``VARCHAR``)."""
+    return _TYPE_PARAMS.sub("", sql_type.strip().upper())
+
+
+# ---------------------------------------------------------------------- #
+#   Text format                                                          #
+# ---------------------------------------------------------------------- #
+def _text_value(value: Any, sql_type: str | None) -> str:
+    if value is None:
+        return "\\N"
+    if isinstance(value, str):
+        return value.translate(_TEXT_ESCAPES)
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (int, float, Decimal, uuid.UUID)):
+        return str(value)
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return "\\\\x" + bytes(value).hex()
+    if isinstance(value, (dict, list)) and (sql_type is None or sql_type in ("JSON", "JSONB")):
+        return json.dumps(value).translate(_TEXT_ESCAPES)
+    raise CopyEncodingError(
+        f"Cannot encode {type(value).__name__} for COPY text format"
+        + (f" ({sql_type})" if sql_type else "")
+    )
+
+
+def _escape(value: str) -> str:
+    return value.translate(_TEXT_ESCAPES)
+
+
+def _bool_text(value: bool) -> str:
+    return "t" if value else "f"
+
+
+# Formatters for the common scalar types; a column made of a single one of these
+# types is rendered with one C-level ``map`` instead of per-value dispatch.
+_TEXT_FORMATTERS: dict[type, Callable[[Any], str]] = {
+    str: _escape,
+    int: int.__repr__,
+    float: float.__repr__,
+    bool: _bool_text,
+    uuid.UUID: str,
+    datetime: datetime.isoformat,
+    date: date.isoformat,
+}
+
+
+def _text_column(values: Sequence[Any], sql_type: str | None) -> list[str]:
+    kinds = set(map(type, values))
+    if kinds == {str}:
+        # Escaping is rare; scan the whole column once before paying for it.
+        joined = "".join(values)
+        if not any(char in joined for char in "\\\t\n\r"):
+            return list(values)
+    if len(kinds) == 1:
+        formatter = _TEXT_FORMATTERS.get(kinds.pop())
+        if formatter is not None:
+            return list(map(formatter, values))
+    return [_text_value(value, sql_type) for value in values]
+
+
+def encode_text(
+    rows: Iterable[Sequence[Any]],
+    sql_types: Sequence[str | None] | None = None,
+) -> io.BytesIO:
+    """Render ``rows`` using PostgreSQL's tab-delimited COPY text format.
+
+    Args:
+        rows: Row tuples ordered like the COPY column list.
+        sql_types: Optional per-column SQL types used to decide how container
+            values (``dict``/``list``) are rendered.
+    """
+    return encode_text_columns(list(zip(*rows, strict=True)), sql_types)
+
+
+def encode_text_columns(
+    columns: Sequence[Sequence[Any]],
+    sql_types: Sequence[str | None] | None = None,
+) -> io.BytesIO:
+    """Column-oriented variant of :func:`encode_text`.
+
+    Each column is formatted in a single pass, so callers holding columnar
+    batches never materialize per-row tuples.
+    """
+    if not columns:
+        return io.BytesIO(b"")
+    types = [base_type(t) if t else None for t in sql_types] if sql_types else None
+    rendered = [
+        _text_column(values, types[index] if types else None)
+        for index, values in enumerate(columns)
+    ]
+    lines = list(map("\t".join, zip(*rendered, strict=True)))
+    lines.append("")
+    return io.BytesIO("\n".join(lines).encode("utf-8"))
+
+
+# ---------------------------------------------------------------------- #
+#   Binary format                                                        #
+# ---------------------------------------------------------------------- #
+def _struct_encoder(fmt: str, kinds: tuple[type, ...]) -> Callable[[Any], bytes]:
+    packer = struct.Struct(fmt).pack
+
+    def encode(value: Any) -> bytes:
+        if type(value) not in kinds:
+            raise CopyEncodingError(f"Expected {kinds[0].__name__}, got {type(value).__name__}")
+        try:
+            return packer(value)
+        except struct.error as exc:
+            raise CopyEncodingError(str(exc)) from exc
+
+    return encode
+
+
+def _encode_bool(value: Any) -> bytes:
+    if not isinstance(value, bool):
+        raise CopyEncodingError(f"Expected bool, got {type(value).__name__}")
+    return b"\x01" if value else b"\x00"
+
+
+def _encode_text(value: Any) -> bytes:
+    if not isinstance(value, str):
+        raise CopyEncodingError(f"Expected str, got {type(value).__name__}")
+    return value.encode("utf-8")
+
+
+def _encode_uuid(value: Any) -> bytes:
+    if isinstance(value, uuid.UUID):
+        return value.bytes
+    if isinstance(value, str):
+        try:
+            packed = bytes.fromhex(value.replace("-", ""))
+        except ValueError:
+            packed = b""
+        if len(packed) == 16:
+            return packed
+        try:
+            return uuid.UUID(value).bytes
+        except ValueError as exc:
+            raise CopyEncodingError(f"Invalid UUID literal {value!r}") from exc
+    if isinstance(value, (bytes, bytearray)) and len(value) == 16:
+        return bytes(value)
+    raise CopyEncodingError(f"Expected UUID, got {type(value).__name__}")
+
+
+def _encode_json(value: Any) -> bytes:
+    if isinstance(value, str):
+        return value.encode("utf-8")
+    if isinstance(value, (dict, list)):
+        return json.dumps(value).encode("utf-8")
+    raise CopyEncodingError(f"Expected JSON document, got {type(value).__name__}")
+
+
+def _encode_jsonb(value: Any) -> bytes:
+    return b"\x01" + _encode_json(value)
+
+
+def _encode_bytea(value: Any) -> bytes:
+    if not isinstance(value, (bytes, bytearray, memoryview)):
+        raise CopyEncodingError(f"Expected bytes, got {type(value).__name__}")
+    return bytes(value)
+
+
+def _pack_micros(delta: timedelta) -> bytes:
+    micros = (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
+    return struct.pack("!q", micros)
+
+
+def _encode_timestamp(value: Any) -> bytes:
+    if not isinstance(value, datetime) or value.tzinfo is not None:
+        raise CopyEncodingError(f"Expected naive datetime, got {value!r}")
+    return _pack_micros(value - _PG_EPOCH)
+
+
+def _encode_timestamptz(value: Any) -> bytes:
+    if not isinstance(value, datetime) or value.tzinfo is None:
+        raise CopyEncodingError(f"Expected timezone-aware datetime, got {value!r}")
+    return _pack_micros(value - _PG_EPOCH_TZ)
+
+
+def _encode_date(value: Any) -> bytes:
+    if not isinstance(value, date) or isinstance(value, datetime):
+        raise CopyEncodingError(f"Expected date, got {value!r}")
+    return struct.pack("!i", value.toordinal() - _PG_EPOCH_DATE)
+
+
+_INT2 = ("!h", (int,))
+_INT4 = ("!i", (int,))
+_INT8 = ("!q", (int,))
+_FLOAT4 = ("!f", (float, int))
+_FLOAT8 = ("!d", (float, int))
+
+# Fixed-width numeric types: (struct format, accepted Python types).
+_FIXED_WIDTH: dict[str, tuple[str, tuple[type, ...]]] = {
+    "SMALLINT": _INT2,
+    "INT2": _INT2,
+    "INT": _INT4,
+    "INTEGER": _INT4,
+    "INT4": _INT4,
+    "SERIAL": _INT4,
+    "BIGINT": _INT8,
+    "INT8": _INT8,
+    "BIGSERIAL": _INT8,
+    "REAL": _FLOAT4,
+    "FLOAT4": _FLOAT4,
+    "FLOAT": _FLOAT8,
+    "FLOAT8": _FLOAT8,
+    "DOUBLE PRECISION": _FLOAT8,
+}
+
+_BINARY_ENCODERS: dict[str, Callable[[Any], bytes]] = {
+    **{name: _struct_encoder(fmt, kinds) for name, (fmt, kinds) in _FIXED_WIDTH.items()},
+    "BOOLEAN": _encode_bool,
+    "BOOL": _encode_bool,
+    "TEXT": _encode_text,
+    "VARCHAR": _encode_text,
+    "CHARACTER VARYING": _encode_text,
+    "UUID": _encode_uuid,
+    "JSON": _encode_json,
+    "JSONB": _encode_jsonb,
+    "BYTEA": _encode_bytea,
+    "TIMESTAMP": _encode_timestamp,
+    "TIMESTAMP WITHOUT TIME ZONE": _encode_timestamp,
+    "TIMESTAMPTZ": _encode_timestamptz,
+    "TIMESTAMP WITH TIME ZONE": _encode_timestamptz,
+    "DATE": _encode_date,
+}
+
+
+def binary_encoder(sql_type: str | None) -> Callable[[Any], bytes]:
+    """Return the binary field encoder for ``sql_type`` or raise ``CopyEncodingError``."""
+    if sql_type is None:
+        raise CopyEncodingError("Binary COPY requires a known SQL type for every column")
+    try:
+        return _BINARY_ENCODERS[base_type(sql_type)]
+    except KeyError:
+        raise CopyEncodingError(f"No COPY binary encoder for type {sql_type}") from None
+
+
+def _binary_column(values: Sequence[Any], sql_type: str | None) -> list[bytes]:
+    """Encode one column into length-prefixed binary COPY fields."""
+    encode = binary_encoder(sql_type)
+    kinds = set(map(type, values))
+    fixed = _FIXED_WIDTH.get(base_type(sql_type or ""))
+    if fixed is not None and kinds.issubset(fixed[1]):
+        # Length prefix and payload packed in one C-level call per value.
+        packer = struct.Struct("!i" + fixed[0][1:])
+        try:
+            return list(map(packer.pack, repeat(packer.size - 4), values))
+        except struct.error as exc:
+            raise CopyEncodingError(str(exc)) from exc
+    if kinds == {str} and encode is _encode_text:
+        encoded = [value.encode("utf-8") for value in values]
+    else:
+        encoded = [None if value is None else encode(value) for value in values]
+    length = _LENGTH.pack
+    return [_NULL_FIELD if data is None else length(len(data)) + data for data in encoded]
+
+
+def encode_binary(
+    rows: Iterable[Sequence[Any]],
+    sql_types: Sequence[str | None],
+) -> io.BytesIO:
+    """Render ``rows`` using PostgreSQL's binary COPY format.
+
+    Args:
+        rows: Row tuples ordered like the COPY column list.
+        sql_types: Per-column SQL types; every type must have a binary encoder.
+    """
+    return encode_binary_columns(list(zip(*rows, strict=True)), sql_types)
+
+
+def encode_binary_columns(
+    columns: Sequence[Sequence[Any]],
+    sql_types: Sequence[str | None],
+) -> io.BytesIO:
+    """Column-oriented variant of :func:`encode_binary`."""
+    if not columns:
+        for sql_type in sql_types:
+            binary_encoder(sql_type)
+        return io.BytesIO(_BINARY_HEADER + _BINARY_TRAILER)
+    fields = [
+        _binary_column(values, sql_type)
+        for values, sql_type in zip(columns, sql_types, strict=True)
+    ]
+    row_header = struct.pack("!h", len(fields))
+    body = b"".join(chain.from_iterable(zip(repeat(row_header), *fields)))
+    return io.BytesIO(_BINARY_HEADER + body + _BINARY_TRAILER)
@@ -0,0 +1,64 @@
+"""Lock-aware execution of schema evolution DDL."""
+
+from __future__ import annotations
+
+import random
+import time
+from collections.abc import Callable
+
+
+class LockPolicy:
+    """Bound how long schema DDL may wait for its table lock.
+
+    ``ALTER TABLE`` needs an ``ACCESS EXCLUSIVE`` lock.  While it waits behind
+    a long transaction, every writer that arrives afterwards queues behind it,
+    so an unbounded wait stalls the whole simulation.  With a policy,
+    :class:`~kraft.core.schema.SchemaManager` runs each statement under
+    ``SET LOCAL lock_timeout``; when the timeout fires the statement is rolled
+    back, writers proceed, and the DDL is retried after an exponential backoff
+    until ``max_attempts`` is exhausted.
+    """
+
+    def __init__(
+        self,
+        *,
+        lock_timeout: float = 1.0,
+        max_attempts: int = 5,
+        backoff: float = 0.1,
+        max_backoff: float = 5.0,
+        jitter: bool = True,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Args:
+            lock_timeout: Seconds one attempt may wait for its lock.
+            max_attempts: Attempts before the lock error is raised.
+            backoff: Pause before the second attempt; doubles per retry.
+            max_backoff: Upper bound on a single pause.
+            jitter: Randomise each pause between half and all of its length,
+                so retries do not fall into step with the batch cadence.
+            sleep: Function used to pause (overridable for tests).
+        """
+        if lock_timeout <= 0:
+            raise ValueError(f"lock_timeout must be positive, got {lock_timeout!r}")
+        if max_attempts < 1:
+            raise ValueError(f"max_attempts must be at least 1, got {max_attempts!r}")
+        if backoff < 0 or max_backoff < 0:
+            raise ValueError("backoff and max_backoff must not be negative")
+        self.lock_timeout = lock_timeout
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.sleep = sleep
+
+    def timeout_sql(self) -> str:
+        """Return the ``SET LOCAL`` statement applied before each attempt."""
+        return f"SET LOCAL lock_timeout = '{max(1, round(self.lock_timeout * 1000))}ms'"
+
+    def delay(self, attempt: int) -> float:
+        """Return the pause after failed attempt number ``attempt`` (1-based)."""
+        delay: float = min(self.max_backoff, self.backoff * 2.0 ** (attempt - 1))
+        if self.jitter:
+            delay *= random.uniform(0.5, 1.0)
+        return delay
@@ -4,11 +4,25 @@ from __future__ import annotations
 
 import logging
 import random
+from collections.abc import Sequence
+from typing import Any
 
-from kraft.core.schema import SchemaManager
+from psycopg2 import errors
+
+from kraft.core.schema import ALTERATIONS, SchemaManager
 
 logger = logging.getLogger(__name__)
 
+_LABELS = {
+    "add": "Added",
+    "drop": "Dropped",
+    "widen": "Widened",
+    "rename": "Renamed",
+    "set_default": "Set default on",
+    "set_not_null": "Set NOT NULL on",
+    "drop_not_null": "Dropped NOT NULL on",
+}
+
 
 class EvolutionController:
     """Decide when and how to evolve the active schema."""
@@ -22,6 +36,11 @@ class EvolutionController:
         add_probability: float = 0.7,
         max_additions: int = 10,
         max_drops: int = 5,
+        width: int = 1,
+        alter_probability: float = 0.0,
+        alterations: Sequence[str] = ALTERATIONS,
+        max_alterations: int = 10,
+        rng: random.Random | None = None,
     ):
         """
         Args:
@@ -33,16 +52,39 @@ class EvolutionController:
                 ADD vs DROP when both are allowed.
             max_additions: Upper bound on how many columns may be added.
             max_drops: Upper bound on how many columns may be dropped.
+            width: Most columns one evolution event adds or drops.  Each slot
+                is decided like a single-column event, and all of them are
+                applied in one ``ALTER TABLE`` statement and transaction.
+            alter_probability: Chance that a slot changes an existing column
+                (see :meth:`SchemaManager.alter_columns`) instead of adding or
+                dropping one.
+            alterations: Operations such slots pick from uniformly, any of
+                ``widen``, ``rename``, ``set_default``, ``set_not_null`` and
+                ``drop_not_null``.
+            max_alterations: Upper bound on how many columns may be altered.
+            rng: Random source for every evolution decision (defaults to the
+                ``random`` module).
         """
+        if width < 1:
+            raise ValueError(f"width must be at least 1, got {width!r}")
+        unknown = set(alterations) - set(ALTERATIONS)
+        if unknown:
+            raise ValueError(f"Unknown alterations: {sorted(unknown)}")
         self.manager = manager
         self.evolution_interval = evolution_interval
         self.evolution_probability = evolution_probability
         self.add_probability = add_probability
         self.max_additions = max_additions
         self.max_drops = max_drops
+        self.width = width
+        self.alter_probability = alter_probability
+        self.alterations = tuple(alterations)
+        self.max_alterations = max_alterations
+        self.rng: Any = rng or random
 
         self.num_additions = 0
         self.num_drops = 0
+        self.num_alterations = 0
         self.evolution_log: list[dict[str, str]] = []
         self.dropped_columns: set[str] = set()
 
@@ -50,28 +92,73 @@ class EvolutionController:
         """Return ``True`` if the controller should attempt evolution."""
         if batch_number % self.evolution_interval != 0:
             return False
-        return random.random() < self.evolution_probability
+        return bool(self.rng.random() < self.evolution_probability)
 
     def evolve(self, batch_number: int) -> str | None:
         if not self.should_evolve(batch_number):
             return None
 
-        action = self._choose_action()
-        if action == "add":
-            result = self._add_column()
-        elif action == "drop":
-            result = self._drop_column()
-        else:
-            result = None
+        changes = self._plan_changes()
+        try:
+            if changes == {"add": 1}:
+                result = self._add_column()
+            elif changes == {"drop": 1}:
+                result = self._drop_column()
+            elif changes:
+                result = self._alter_columns(changes)
+            else:
+                result = None
+        except errors.LockNotAvailable:
+            # The manager's lock policy gave up; writers keep going and a later
+            # interval tries again.
+            logger.warning("Skipped evolution %s: table lock not available", changes)
+            return "Evolution skipped: could not acquire the table lock"
 
         if result:
             self.evolution_log.append(result)
             logger.info("%s", result["message"])
         return result["message"] if result else "No evolution possible"
 
-    def _choose_action(self) -> str:
-        can_add = self.num_additions < self.max_additions and self._has_available_columns()
-        can_drop = self.num_drops < self.max_drops and self._has_droppable_columns()
+    def _plan_changes(self) -> dict[str, int]:
+        """Return how many columns each operation of the next event changes.
+
+        At most ``width`` columns change in total.
+        """
+        changes: dict[str, int] = {}
+        for _ in range(self.width):
+            action = None
+            if self.alter_probability and self.rng.random() < self.alter_probability:
+                action = self._choose_alteration(changes)
+            if action is None:
+                action = self._choose_action(
+                    pending_adds=changes.get("add", 0), pending_drops=changes.get("drop", 0)
+                )
+            if action == "none":
+                break
+            changes[action] = changes.get(action, 0) + 1
+        return changes
+
+    def _choose_alteration(self, pending: dict[str, int]) -> str | None:
+        """Pick an alteration some column still qualifies for, or ``None``."""
+        pending_total = sum(pending.get(name, 0) for name in ALTERATIONS)
+        if self.num_alterations + pending_total >= self.max_alterations:
+            return None
+        feasible = [
+            operation
+            for operation in self.alterations
+            if len(self.manager.alteration_candidates(operation)) > pending.get(operation, 0)
+        ]
+        return self.rng.choice(feasible) if feasible else None
+
+    def _choose_action(self, *, pending_adds: int = 0, pending_drops: int = 0) -> str:
+        can_add = (
+            self.num_additions + pending_adds < self.max_additions
+            and self._has_available_columns(pending_adds)
+        )
+        can_drop = (
+            self.num_drops + pending_drops < self.max_drops
+            and self._has_droppable_columns(pending_drops)
+        )
 
         if can_add and not can_drop:
             return "add"
@@ -80,18 +167,15 @@ class EvolutionController:
         if not can_add and not can_drop:
             return "none"
 
-        return "add" if random.random() < self.add_probability else "drop"
+        return "add" if self.rng.random() < self.add_probability else "drop"
 
-    def _has_available_columns(self) -> bool:
-        return any(
-            col.reserved
-            and name not in self.manager.get_active_columns()
-            and name not in self.dropped_columns
-            for name, col in self.manager.columns.items()
-        )
+    def _has_available_columns(self, pending: int = 0) -> bool:
+        """Return whether more than ``pending`` dormant columns can be added."""
+        return len(self.manager.dormant_columns) > pending
 
-    def _has_droppable_columns(self) -> bool:
-        return any(not col.protected for col in self.manager.get_active_columns().values())
+    def _has_droppable_columns(self, pending: int = 0) -> bool:
+        """Return whether more than ``pending`` active columns can be dropped."""
+        return len(self.manager.droppable_columns) > pending
 
     def _add_column(self) -> dict[str, str] | None:
         promoted = self.manager.add_column()
@@ -120,11 +204,36 @@ class EvolutionController:
             "message": f"[v{self.manager.schema_version}] Dropped column: {dropped}",
         }
 
+    def _alter_columns(self, changes: dict[str, int]) -> dict[str, str] | None:
+        applied = {
+            operation: names
+            for operation, names in self.manager.alter_columns(**changes).items()
+            if names
+        }
+        if not applied:
+            return None
+
+        self.num_additions += len(applied.get("add", []))
+        self.num_drops += len(applied.get("drop", []))
+        self.num_alterations += sum(len(applied.get(name, [])) for name in ALTERATIONS)
+        self.dropped_columns.update(applied.get("drop", []))
+        parts = [
+            f"{_LABELS[operation]} column{'s' * (len(names) > 1)}: {', '.join(names)}"
+            for operation, names in applied.items()
+        ]
+        return {
+            "version": f"v{self.manager.schema_version}",
+            "action": next(iter(applied)) if len(applied) == 1 else "alter",
+            "column": ", ".join(name for names in applied.values() for name in names),
+            "message": f"[v{self.manager.schema_version}] {'; '.join(parts)}",
+        }
+
     def summary(self) -> dict[str, object]:
         return {
             "schema_version": self.manager.schema_version,
             "adds": self.num_additions,
             "drops": self.num_drops,
+            "alterations": self.num_alterations,
             "max_adds": self.max_additions,
             "max_drops": self.max_drops,
             "log": self.evolution_log,
@@ -0,0 +1,240 @@
+"""Compact primary-key storage and the live-key index built on it."""
+
+from __future__ import annotations
+
+import random
+import uuid
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any
+
+SKEWS = ("uniform", "zipf", "recent")
+KEY_TYPES = ("object", "uuid", "int")
+
+
+class ObjectKeys(list[Any]):
+    """Keys kept as the Python objects the generator produced."""
+
+    key_type = "object"
+
+    def swap_remove(self, position: int) -> None:
+        """Remove ``position`` by moving the last key into its slot."""
+        last = self.pop()
+        if position < len(self):
+            self[position] = last
+
+
+class UUIDKeys(Sequence[str]):
+    """UUID keys packed as 16 bytes each in one ``bytearray``.
+
+    Accepts ``str`` (dashed or hex), :class:`uuid.UUID` or 16-byte values and
+    hands keys back as canonical dashed strings, ready for a ``uuid`` cast.
+    """
+
+    key_type = "uuid"
+
+    def __init__(self, keys: Iterable[Any] = ()):
+        self._data = bytearray()
+        self.extend(keys)
+
+    def __len__(self) -> int:
+        return len(self._data) // 16
+
+    def __getitem__(self, position: int) -> str:  # type: ignore[override]
+        if position < 0:
+            position += len(self)
+        if not 0 <= position < len(self):
+            raise IndexError("key position out of range")
+        h = self._data[position * 16 : position * 16 + 16].hex()
+        return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+    def __iter__(self) -> Iterator[str]:
+        return (self[position] for position in range(len(self)))
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._data)
+
+    def extend(self, keys: Iterable[Any]) -> None:
+        if isinstance(keys, UUIDKeys):
+            self._data += keys._data
+            return
+        parts = []
+        for key in keys:
+            if isinstance(key, uuid.UUID):
+                parts.append(key.hex)
+            elif isinstance(key, (bytes, bytearray)):
+                parts.append(key.hex())
+            else:
+                parts.append(str(key))
+        digits = "".join(parts).replace("-", "")
+        if len(digits) != 32 * len(parts):
+            raise ValueError("UUID keys must be 32 hex digits (dashes optional)")
+        self._data += bytes.fromhex(digits)
+
+    def swap_remove(self, position: int) -> None:
+        """Remove ``position`` by moving the last key into its slot."""
+        data = self._data
+        start = position * 16
+        if start + 16 < len(data):
+            data[start : start + 16] = data[-16:]
+        del data[-16:]
+
+
+class IntKeys(Sequence[int]):
+    """Integer (serial/bigint) keys stored in a signed 64-bit ``array``."""
+
+    key_type = "int"
+
+    def __init__(self, keys: Iterable[Any] = ()):
+        self._data = array("q")
+        self.extend(keys)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __getitem__(self, position: int) -> int:  # type: ignore[override]
+        return self._data[position]
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._data)
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._data) * self._data.itemsize
+
+    def extend(self, keys: Iterable[Any]) -> None:
+        if isinstance(keys, IntKeys):
+            self._data.extend(keys._data)
+        else:
+            self._data.extend(int(key) for key in keys)
+
+    def swap_remove(self, position: int) -> None:
+        """Remove ``position`` by moving the last key into its slot."""
+        data = self._data
+        last = data.pop()
+        if position < len(data):
+            data[position] = last
+
+
+KeyArray = ObjectKeys | UUIDKeys | IntKeys
+
+
+def key_array(key_type: str, keys: Iterable[Any] = ()) -> KeyArray:
+    """Build the key container for ``key_type`` (one of :data:`KEY_TYPES`)."""
+    if key_type == "uuid":
+        return UUIDKeys(keys)
+    if key_type == "int":
+        return IntKeys(keys)
+    if key_type == "object":
+        return ObjectKeys(keys)
+    raise ValueError(f"key_type must be one of {KEY_TYPES}, got {key_type!r}")
+
+
+class LiveKeyIndex:
+    """Array-backed set of live keys with O(1) sampling and removal.
+
+    Keys are appended in insertion order.  Sampling returns *positions*, and
+    removal swaps the last key into each freed slot, so both run in constant
+    time per key without a key-to-position map.  Skewed sampling ranks keys by
+    position:
+
+    * ``uniform`` - every live key is equally likely.
+    * ``zipf`` - Zipfian over age with the oldest surviving keys hottest.
+    * ``recent`` - Zipfian with the newest keys hottest.
+
+    Swap-removal moves recent keys into older slots, so the age ordering (and
+    therefore the skew) is approximate once deletes have happened.
+
+    With ``key_type="uuid"`` or ``"int"`` keys are packed into 16 or 8 bytes
+    each (see :class:`UUIDKeys` and :class:`IntKeys`), so hundreds of millions
+    of keys fit in a few gigabytes instead of tens.
+    """
+
+    def __init__(
+        self,
+        keys: Iterable[Any] = (),
+        *,
+        skew: str = "uniform",
+        key_type: str = "object",
+        exponent: float = 1.0,
+        rng: random.Random | None = None,
+    ):
+        """
+        Args:
+            keys: Initial live keys.
+            skew: ``uniform``, ``zipf`` or ``recent``.
+            key_type: Key storage, one of ``object``, ``uuid`` or ``int``.
+            exponent: Zipf exponent; larger values concentrate on fewer keys.
+            rng: Optional random source (defaults to the ``random`` module).
+        """
+        if skew not in SKEWS:
+            raise ValueError(f"skew must be one of {SKEWS}, got {skew!r}")
+        if exponent <= 0:
+            raise ValueError("exponent must be positive")
+        self.skew = skew
+        self.exponent = exponent
+        self.rng: Any = rng or random
+        self.key_type = key_type
+        self._keys = key_array(key_type, keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def extend(self, keys: Iterable[Any]) -> None:
+        """Register newly inserted keys."""
+        self._keys.extend(keys)
+
+    def keys_at(self, positions: Sequence[int]) -> list[Any]:
+        """Return the keys stored at ``positions``."""
+        keys = self._keys
+        return [keys[position] for position in positions]
+
+    def sample(self, count: int) -> list[Any]:
+        """Return up to ``count`` distinct live keys drawn with the configured skew."""
+        return self.keys_at(self.sample_positions(count))
+
+    def sample_positions(self, count: int) -> list[int]:
+        """Return up to ``count`` distinct positions drawn with the configured skew."""
+        size = len(self._keys)
+        count = min(count, size)
+        if count <= 0:
+            return []
+        if self.skew == "uniform" or count * 2 > size:
+            return list(self.rng.sample(range(size), count))
+
+        chosen: set[int] = set()
+        draw = self._draw_position
+        for _ in range(count * 4):
+            chosen.add(draw(size))
+            if len(chosen) == count:
+                return list(chosen)
+        # Heavy skew keeps hitting the same hot keys; top up uniformly.
+        while len(chosen) < count:
+            chosen.add(self.rng.randrange(size))
+        return list(chosen)
+
+    def _draw_position(self, size: int) -> int:
+        """Draw one position via the inverse CDF of a continuous Zipf over ranks."""
+        u: float = self.rng.random()
+        s = self.exponent
+        rank = size**u if s == 1.0 else ((size ** (1 - s) - 1) * u + 1) ** (1 / (1 - s))
+        offset: int = min(size - 1, max(0, int(rank) - 1))
+        return offset if self.skew == "zipf" else size - 1 - offset
+
+    def remove_positions(self, positions: Iterable[int]) -> None:
+        """Remove the keys at ``positions`` (as returned by :meth:`sample_positions`).
+
+        Positions are processed from highest to lowest, so every swap pulls in a
+        key that is not itself scheduled for removal.
+        """
+        swap_remove = self._keys.swap_remove
+        for position in sorted(set(positions), reverse=True):
+            swap_remove(position)
+
+    def discard(self, keys: Iterable[Any]) -> int:
+        """Remove ``keys`` by value; O(n), meant for occasional out-of-band deletes."""
+        targets = set(key_array(self.key_type, keys))
+        positions = [index for index, key in enumerate(self._keys) if key in targets]
+        self.remove_positions(positions)
+        return len(positions)
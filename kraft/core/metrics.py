@@ -0,0 +1,264 @@
+"""Per-phase latency histograms, throughput rates and pluggable metric sinks."""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any
+
+PHASES = ("generate", "insert", "update", "delete", "commit", "ddl")
+QUANTILES = (0.5, 0.9, 0.99)
+
+# Buckets grow by 2 ** (1 / 8) (~9%), starting at one microsecond, so a
+# quantile is accurate to within one bucket width at any latency.
+_BUCKETS_PER_DOUBLING = 8
+_RESOLUTION = 1e-6
+
+
+class Histogram:
+    """Latency histogram with logarithmically sized buckets.
+
+    Only non-empty buckets are stored, so memory grows with the spread of the
+    observed latencies, not with their number.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+        self._buckets: dict[int, int] = {}
+
+    def observe(self, seconds: float) -> None:
+        """Record one duration in seconds."""
+        index = (
+            math.ceil(math.log2(seconds / _RESOLUTION) * _BUCKETS_PER_DOUBLING)
+            if seconds > _RESOLUTION
+            else 0
+        )
+        self._buckets[index] = self._buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+
+    def quantile(self, q: float) -> float:
+        """Return the upper bound of the bucket holding quantile ``q``."""
+        if not 0.0 <= q <= 1.0:
+            raise ValueError(f"q must be between 0 and 1, got {q!r}")
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen >= rank:
+                bound: float = _RESOLUTION * 2.0 ** (index / _BUCKETS_PER_DOUBLING)
+                return min(max(bound, self.min), self.max)
+        return self.max
+
+    def summary(self) -> dict[str, float]:
+        """Return count, sum, mean, min, max and the :data:`QUANTILES`."""
+        summary: dict[str, float] = {
+            "count": self.count,
+            "sum": self.total,
+            "mean": self.total / self.count if self.count else 0.0,
+            "min": self.min if self.count else 0.0,
+            "max": self.max,
+        }
+        for q in QUANTILES:
+            summary[f"p{round(q * 100)}"] = self.quantile(q)
+        return summary
+
+
+class MetricsSink(ABC):
+    """Destination for :class:`Metrics` snapshots.
+
+    Subclasses implement :meth:`emit`, which receives the dictionary returned
+    by :meth:`Metrics.snapshot`.
+    """
+
+    @abstractmethod
+    def emit(self, snapshot: dict[str, Any]) -> None:
+        """Deliver one :meth:`Metrics.snapshot` result."""
+
+
+class MemorySink(MetricsSink):
+    """Keep emitted snapshots in memory, e.g. for tests or notebooks."""
+
+    def __init__(self, max_snapshots: int | None = None):
+        """
+        Args:
+            max_snapshots: Keep only this many of the most recent snapshots.
+        """
+        self.max_snapshots = max_snapshots
+        self.snapshots: list[dict[str, Any]] = []
+
+    @property
+    def latest(self) -> dict[str, Any] | None:
+        """The most recent snapshot, if any was emitted."""
+        return self.snapshots[-1] if self.snapshots else None
+
+    def emit(self, snapshot: dict[str, Any]) -> None:
+        self.snapshots.append(snapshot)
+        if self.max_snapshots is not None and len(self.snapshots) > self.max_snapshots:
+            del self.snapshots[: -self.max_snapshots]
+
+
+class JSONLinesSink(MetricsSink):
+    """Append every snapshot to ``path`` as one JSON object per line."""
+
+    def __init__(self, path: str | os.PathLike[str]):
+        self.path = Path(path)
+
+    def emit(self, snapshot: dict[str, Any]) -> None:
+        with self.path.open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps(snapshot) + "\n")
+
+
+class PrometheusTextSink(MetricsSink):
+    """Rewrite ``path`` in the Prometheus text exposition format.
+
+    Point the node exporter's textfile collector at the file's directory.  The
+    file is replaced atomically, so a scrape never sees a partial write.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], *, prefix: str = "kraft"):
+        """
+        Args:
+            path: Target file, conventionally ending in ``.prom``.
+            prefix: Prefix of every metric name.
+        """
+        self.path = Path(path)
+        self.prefix = prefix
+
+    def render(self, snapshot: dict[str, Any]) -> str:
+        """Return ``snapshot`` in the text exposition format."""
+        p = self.prefix
+        lines = [f"# TYPE {p}_phase_seconds summary"]
+        for phase, summary in snapshot["phases"].items():
+            for q in QUANTILES:
+                value = summary[f"p{round(q * 100)}"]
+                lines.append(f'{p}_phase_seconds{{phase="{phase}",quantile="{q}"}} {value}')
+            lines.append(f'{p}_phase_seconds_sum{{phase="{phase}"}} {summary["sum"]}')
+            lines.append(f'{p}_phase_seconds_count{{phase="{phase}"}} {summary["count"]}')
+        lines.append(f"# TYPE {p}_rows_total counter")
+        for operation, rows in snapshot["rows"].items():
+            lines.append(f'{p}_rows_total{{operation="{operation}"}} {rows}')
+        lines.append(f"# TYPE {p}_rows_per_second gauge")
+        for operation, rate in snapshot["rows_per_second"].items():
+            lines.append(f'{p}_rows_per_second{{operation="{operation}"}} {rate}')
+        lines.append(f"# TYPE {p}_bytes_total counter")
+        lines.append(f"{p}_bytes_total {snapshot['bytes']}")
+        lines.append(f"# TYPE {p}_bytes_per_second gauge")
+        lines.append(f"{p}_bytes_per_second {snapshot['bytes_per_second']}")
+        return "\n".join(lines) + "\n"
+
+    def emit(self, snapshot: dict[str, Any]) -> None:
+        staging = self.path.with_name(self.path.name + ".tmp")
+        staging.write_text(self.render(snapshot), encoding="utf-8")
+        os.replace(staging, self.path)
+
+
+class Metrics:
+    """Record where a simulation spends its time and how fast it writes.
+
+    Components that accept a ``metrics`` argument time their phases with
+    :meth:`observe` (``generate`` in the runner, ``insert``/``update``/
+    ``delete``/``commit`` in :class:`~kraft.core.mutator.MutationEngine`,
+    ``ddl`` in :class:`~kraft.core.schema.SchemaManager`) and count rows and
+    payload bytes with :meth:`add_rows`.  They skip all of it when no recorder
+    is configured, so disabled metrics cost one ``None`` check per call.
+
+    :meth:`maybe_emit` hands a :meth:`snapshot` to every sink once per
+    ``interval``; :meth:`emit` does so unconditionally.
+    """
+
+    def __init__(
+        self,
+        sinks: Iterable[MetricsSink] = (),
+        *,
+        interval: float | None = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            sinks: :class:`MetricsSink` instances receiving snapshots.
+            interval: Seconds between snapshots emitted by :meth:`maybe_emit`;
+                ``None`` emits only when :meth:`emit` is called.
+            clock: Monotonic time source for rates and the emit interval
+                (overridable for tests).
+        """
+        if interval is not None and interval <= 0:
+            raise ValueError(f"interval must be positive, got {interval!r}")
+        self.sinks = list(sinks)
+        self.interval = interval
+        self.clock = clock
+        # Evolution may record DDL from a background thread.
+        self._lock = threading.Lock()
+        self.start()
+
+    def start(self) -> None:
+        """Reset all histograms and counters and restart the rate window."""
+        with self._lock:
+            self.histograms = {phase: Histogram() for phase in PHASES}
+            self.rows = {"insert": 0, "update": 0, "delete": 0}
+            self.bytes = 0
+            self.started_at = self.clock()
+            self._next_emit = self.started_at + (self.interval or 0.0)
+
+    def observe(self, phase: str, seconds: float) -> None:
+        """Record that ``phase`` took ``seconds``; unknown phases are created."""
+        with self._lock:
+            histogram = self.histograms.get(phase)
+            if histogram is None:
+                histogram = self.histograms[phase] = Histogram()
+            histogram.observe(seconds)
+
+    def add_rows(self, operation: str, rows: int, nbytes: int = 0) -> None:
+        """Count ``rows`` written by ``operation`` and ``nbytes`` of payload."""
+        with self._lock:
+            self.rows[operation] = self.rows.get(operation, 0) + rows
+            self.bytes += nbytes
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return totals, per-second rates and a summary of every phase."""
+        with self._lock:
+            elapsed = self.clock() - self.started_at
+            return {
+                "timestamp": time.time(),
+                "elapsed_seconds": elapsed,
+                "rows": dict(self.rows),
+                "rows_per_second": {
+                    operation: rows / elapsed if elapsed > 0 else 0.0
+                    for operation, rows in self.rows.items()
+                },
+                "bytes": self.bytes,
+                "bytes_per_second": self.bytes / elapsed if elapsed > 0 else 0.0,
+                "phases": {
+                    phase: histogram.summary() for phase, histogram in self.histograms.items()
+                },
+            }
+
+    def maybe_emit(self) -> bool:
+        """Emit a snapshot if ``interval`` has passed; returns whether it did."""
+        if self.interval is None:
+            return False
+        now = self.clock()
+        if now < self._next_emit:
+            return False
+        self._next_emit = now + self.interval
+        self.emit()
+        return True
+
+    def emit(self) -> None:
+        """Hand a fresh snapshot to every sink."""
+        snapshot = self.snapshot()
+        for sink in self.sinks:
+            sink.emit(snapshot)
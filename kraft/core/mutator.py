@@ -2,20 +2,363 @@
 
 from __future__ import annotations
 
+import io
+import itertools
 import logging
 import random
-from collections.abc import Iterable
+import time
+import weakref
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from functools import partial
 from typing import Any
 
 from psycopg2 import sql
 from psycopg2.extras import execute_values
 
-from kraft.core.batch import BatchGenerator
+from kraft.core.batch import BatchGenerator, ColumnarBatch
+from kraft.core.copy_codec import (
+    COPY_FORMATS,
+    CopyEncodingError,
+    encode_binary_columns,
+    encode_text_columns,
+)
+from kraft.core.keys import KEY_TYPES, KeyArray, LiveKeyIndex, key_array
+from kraft.core.metrics import Metrics
+from kraft.core.pool import CONNECTION_ERRORS, ConnectionPool
+from kraft.core.schema import SchemaManager
+from kraft.core.strategy import MutationStrategy, RandomStrategy
+from kraft.core.transaction import TransactionPolicy
 
 logger = logging.getLogger(__name__)
 
+INSERT_MODES = ("values", "copy")
+UPDATE_MODES = ("row", "batch")
 
-class MutationEngine:
+# Server-side statement names must be unique per connection; a process-wide
+# counter also keeps engines that share (or later reuse) a connection apart.
+_statement_ids = itertools.count(1)
+
+# Serial pseudo-types only exist in column definitions; casts need the real type.
+_SERIAL_TYPES = {"SMALLSERIAL": "SMALLINT", "SERIAL": "INTEGER", "BIGSERIAL": "BIGINT"}
+
+# ``execute_values`` expands a single ``%s`` into the page of rows.
+_VALUES = sql.SQL("%s")
+
+
+def _value_aliases(count: int) -> list[str]:
+    """Column aliases for the ``VALUES`` list of a set-based update."""
+    return ["value"] if count == 1 else [f"value{index}" for index in range(1, count + 1)]
+
+
+class _MutationPlanner:
+    """Options, counters and the I/O-free half of a mutation engine.
+
+    Target sampling, update plans, statement text and the bookkeeping after
+    each write live here; :class:`MutationEngine` and
+    :class:`~kraft.core.async_mutator.AsyncMutationEngine` only run the
+    statements, blocking or awaiting.
+    """
+
+    def __init__(
+        self,
+        *,
+        schema: str,
+        table_name: str,
+        primary_key: str,
+        update_column: str | None,
+        generator: BatchGenerator | None,
+        insert_mode: str,
+        copy_format: str,
+        update_mode: str,
+        mutation_probability: float,
+        update_ratio: float,
+        sample_fraction: float,
+        key_index: LiveKeyIndex | None,
+        key_type: str,
+        strategy: MutationStrategy | None,
+        transaction_policy: TransactionPolicy | None,
+        metrics: Metrics | None,
+        rng: random.Random | None,
+    ):
+        if insert_mode not in INSERT_MODES:
+            raise ValueError(f"insert_mode must be one of {INSERT_MODES}, got {insert_mode!r}")
+        if copy_format not in COPY_FORMATS:
+            raise ValueError(f"copy_format must be one of {COPY_FORMATS}, got {copy_format!r}")
+        if update_mode not in UPDATE_MODES:
+            raise ValueError(f"update_mode must be one of {UPDATE_MODES}, got {update_mode!r}")
+        if key_type not in KEY_TYPES:
+            raise ValueError(f"key_type must be one of {KEY_TYPES}, got {key_type!r}")
+
+        self.schema = schema
+        self.table_name = table_name
+        self.primary_key = primary_key
+        self.update_column = update_column
+        self.generator = generator
+        self.insert_mode = insert_mode
+        self.copy_format = copy_format
+        self.update_mode = update_mode
+        self.rng: Any = rng or random
+        self.strategy = strategy or RandomStrategy(
+            mutation_probability, update_ratio, sample_fraction, rng=rng
+        )
+        self.key_index = key_index
+        self.key_type = key_type
+        self.transaction_policy = transaction_policy
+        self._in_transaction = False
+        self.metrics = metrics
+        self._commit_seconds = 0.0
+
+        self.total_inserts = 0
+        self.total_updates = 0
+        self.total_deletes = 0
+
+    # ------------------------------------------------------------------ #
+    #   Inserts                                                          #
+    # ------------------------------------------------------------------ #
+    def _split_rows(
+        self, rows: list[dict[str, object]] | ColumnarBatch
+    ) -> tuple[list[str], list[list[Any]], KeyArray]:
+        """Return a batch's column names, its values column by column and its keys."""
+        if isinstance(rows, ColumnarBatch):
+            columns = rows.column_names
+            inserted_ids = key_array(self.key_type, rows.column(self.primary_key))
+            column_values: list[list[Any]] = [rows.column(col) for col in columns]
+        else:
+            columns = list(rows[0].keys())
+            inserted_ids = key_array(self.key_type, (row[self.primary_key] for row in rows))
+            column_values = [[row[col] for row in rows] for col in columns]
+        return columns, column_values, inserted_ids
+
+    def _inserted(self, rows: int, inserted_ids: KeyArray, started: float, payload: int) -> None:
+        """Count an inserted batch and register its keys in :attr:`key_index`."""
+        self.total_inserts += rows
+        if self.key_index is not None:
+            self.key_index.extend(inserted_ids)
+        if self.metrics is not None:
+            self.metrics.observe("insert", self._clock() - started)
+            self.metrics.add_rows("insert", rows, payload)
+        logger.debug("Inserted %d rows into %s.%s", rows, self.schema, self.table_name)
+
+    def _encode_copy(self, columns: list[str], column_values: list[list[Any]]) -> io.BytesIO | None:
+        """Encode a batch for ``COPY``, or return ``None`` if it cannot be encoded."""
+        sql_types = [self._column_type(col) for col in columns]
+        try:
+            if self.copy_format == "binary":
+                return encode_binary_columns(column_values, sql_types)
+            return encode_text_columns(column_values, sql_types)
+        except CopyEncodingError as exc:
+            logger.debug("COPY %s encoding unavailable, using VALUES: %s", self.copy_format, exc)
+            return None
+
+    def _insert_query(self, columns: list[str], values: sql.SQL = _VALUES) -> sql.Composed:
+        """Render a multi-row insert whose rows are ``values``."""
+        return sql.SQL("INSERT INTO {}.{} ({}) VALUES {}").format(
+            sql.Identifier(self.schema),
+            sql.Identifier(self.table_name),
+            sql.SQL(", ").join(map(sql.Identifier, columns)),
+            values,
+        )
+
+    def _copy_query(self, columns: list[str]) -> sql.Composed:
+        return sql.SQL("COPY {}.{} ({}) FROM STDIN WITH (FORMAT {})").format(
+            sql.Identifier(self.schema),
+            sql.Identifier(self.table_name),
+            sql.SQL(", ").join(map(sql.Identifier, columns)),
+            sql.SQL(self.copy_format),
+        )
+
+    # ------------------------------------------------------------------ #
+    #   Updates and deletes                                              #
+    # ------------------------------------------------------------------ #
+    def _mutation_targets(
+        self, operation: str, count: int, ids: Iterable[object]
+    ) -> tuple[list[Sequence[object]], list[int] | None]:
+        """Sample up to ``count`` targets and split them into statement-sized chunks.
+
+        Also returns the sampled :attr:`key_index` positions, which a delete
+        hands to :meth:`_forget_deleted` once it ran.
+        """
+        if operation not in ("update", "delete"):
+            raise ValueError(f"operation must be 'update' or 'delete', got {operation!r}")
+        index = self.key_index
+        positions: list[int] | None = None
+        if index is not None:
+            positions = index.sample_positions(count)
+            subset = index.keys_at(positions)
+        else:
+            candidates = ids if isinstance(ids, Sequence) else list(ids)
+            subset = self.rng.sample(candidates, min(count, len(candidates)))
+        if not subset:
+            return [], None
+        logger.debug("Selected %s mutation for %d ids", operation, len(subset))
+
+        size = self.strategy.batch_size(operation) or len(subset)
+        return [subset[start : start + size] for start in range(0, len(subset), size)], positions
+
+    def _forget_deleted(self, positions: list[int] | None) -> None:
+        if self.key_index is not None and positions is not None:
+            self.key_index.remove_positions(positions)
+
+    def _updated(self, updated: int, started: float) -> None:
+        self.total_updates += updated
+        if self.metrics is not None:
+            self.metrics.observe("update", self._clock() - started)
+            self.metrics.add_rows("update", updated)
+        if updated:
+            logger.debug("Updated %d rows in %s.%s", updated, self.schema, self.table_name)
+
+    def _deleted(self, deleted: int, started: float) -> None:
+        self.total_deletes += deleted
+        if self.metrics is not None:
+            self.metrics.observe("delete", self._clock() - started)
+            self.metrics.add_rows("delete", deleted)
+        if deleted:
+            logger.debug("Deleted %d rows from %s.%s", deleted, self.schema, self.table_name)
+
+    def _modifiable_columns(self, ids: list[object]) -> list[str]:
+        """Columns an update of ``ids`` may change; empty when there is nothing to do."""
+        if not ids or not self.generator:
+            return []
+        excluded = [self.primary_key]
+        if self.update_column:
+            excluded.append(self.update_column)
+        return self.generator.get_modifiable_columns(exclude=excluded)
+
+    def _update_groups(
+        self, ids: list[object], modifiable: list[str]
+    ) -> dict[tuple[str, ...], list[tuple[object, ...]]]:
+        """Group ``ids`` by the columns their update changes, as ``(id, *values)`` rows."""
+        assert self.generator is not None
+        generator = self.generator
+        chosen: dict[tuple[str, ...], list[object]] = defaultdict(list)
+        for row_id in ids:
+            chosen[self._pick_columns(modifiable)].append(row_id)
+        return {
+            columns: list(
+                zip(
+                    group,
+                    *(generator.generate_values(column, len(group)) for column in columns),
+                    strict=True,
+                )
+            )
+            for columns, group in chosen.items()
+        }
+
+    def _row_updates(
+        self, ids: list[object], modifiable: list[str]
+    ) -> Iterator[tuple[tuple[str, ...], tuple[object, ...]]]:
+        """Yield each id's updated columns and ``(*values, id)`` parameters."""
+        assert self.generator is not None
+        for row_id in ids:
+            columns = self._pick_columns(modifiable)
+            values = [self.generator.generate_value(column) for column in columns]
+            yield columns, (*values, row_id)
+
+    def _pick_columns(self, modifiable: list[str]) -> tuple[str, ...]:
+        """Choose the columns one updated row changes, in schema order."""
+        count = self.strategy.columns_per_update
+        if count == 1:
+            return (self.rng.choice(modifiable),)
+        if count >= len(modifiable):
+            return tuple(modifiable)
+        picked = set(self.rng.sample(modifiable, count))
+        return tuple(column for column in modifiable if column in picked)
+
+    def _row_update_query(
+        self, columns: tuple[str, ...], *, prepared: bool = False
+    ) -> sql.Composed:
+        """Render a single-row update with ``%s`` (or ``$n`` when prepared) parameters."""
+        params = [f"${index}" if prepared else "%s" for index in range(1, len(columns) + 2)]
+        assignments = [
+            sql.SQL("{} = {}").format(sql.Identifier(column), sql.SQL(param))
+            for column, param in zip(columns, params, strict=False)
+        ]
+        if self.update_column:
+            assignments.append(sql.SQL("{} = now()").format(sql.Identifier(self.update_column)))
+        return sql.SQL("UPDATE {}.{} SET {} WHERE {} = {}").format(
+            sql.Identifier(self.schema),
+            sql.Identifier(self.table_name),
+            sql.SQL(", ").join(assignments),
+            sql.Identifier(self.primary_key),
+            sql.SQL(params[-1]),
+        )
+
+    def _batched_update_query(
+        self, columns: tuple[str, ...], values: sql.SQL = _VALUES
+    ) -> sql.Composed:
+        """Render a set-based update from ``values`` rows, cast to the column types."""
+        aliases = _value_aliases(len(columns))
+        assignments = [
+            sql.SQL("{} = v.{}{}").format(
+                sql.Identifier(column), sql.SQL(alias), self._cast(column)
+            )
+            for column, alias in zip(columns, aliases, strict=True)
+        ]
+        if self.update_column:
+            assignments.append(sql.SQL("{} = now()").format(sql.Identifier(self.update_column)))
+        return sql.SQL(
+            "UPDATE {}.{} AS t SET {} FROM (VALUES {}) AS v(pk, {}) WHERE t.{} = v.pk{}"
+        ).format(
+            sql.Identifier(self.schema),
+            sql.Identifier(self.table_name),
+            sql.SQL(", ").join(assignments),
+            values,
+            sql.SQL(", ".join(aliases)),
+            sql.Identifier(self.primary_key),
+            self._cast(self.primary_key),
+        )
+
+    def _cast(self, column: str) -> sql.SQL:
+        sql_type = self._column_type(column)
+        if not sql_type:
+            return sql.SQL("")
+        return sql.SQL(f"::{_SERIAL_TYPES.get(sql_type.upper(), sql_type)}")
+
+    def _delete_cast(self) -> str:
+        """Cast for the ``ANY`` array of a delete; driver lists of UUIDs arrive as text."""
+        return "::uuid[]" if self._primary_key_type() == "UUID" else ""
+
+    def _column_type(self, column: str) -> str | None:
+        """Look up a column's SQL type from the generator schema, if known."""
+        if self.generator and column in self.generator.schema:
+            return self.generator.schema[column].sql_type
+        return None
+
+    def _primary_key_type(self) -> str:
+        """Best-effort lookup of the primary key SQL type from the generator."""
+        if self.generator and self.primary_key in self.generator.schema:
+            return self.generator.schema[self.primary_key].sql_type.upper()
+        return "TEXT"
+
+    # ------------------------------------------------------------------ #
+    #   Bookkeeping                                                      #
+    # ------------------------------------------------------------------ #
+    def _committed(self, started: float) -> None:
+        """Observe a commit that began at ``started`` (on ``time.perf_counter``)."""
+        assert self.metrics is not None
+        elapsed = time.perf_counter() - started
+        self._commit_seconds += elapsed
+        self.metrics.observe("commit", elapsed)
+
+    def _clock(self) -> float:
+        """Seconds on a clock that stands still during commits.
+
+        Phase timings use it so a statement group's own commit is reported as
+        ``commit`` only, not again as part of the insert or mutation.
+        """
+        return time.perf_counter() - self._commit_seconds
+
+    def get_counters(self) -> dict[str, int]:
+        return {
+            "total_inserts": self.total_inserts,
+            "total_updates": self.total_updates,
+            "total_deletes": self.total_deletes,
+        }
+
+
+class MutationEngine(_MutationPlanner):
     """Perform bulk insert/update/delete operations against a PostgreSQL table.
 
     The engine purposely tracks counters (inserts/updates/deletes) so callers can
@@ -31,10 +374,28 @@ class MutationEngine:
         primary_key: str = "id",
         update_column: str | None = None,
         generator: BatchGenerator | None = None,
+        insert_mode: str = "values",
+        copy_format: str = "text",
+        update_mode: str = "row",
+        mutation_probability: float = 0.5,
+        update_ratio: float = 0.5,
+        sample_fraction: float = 0.25,
+        key_index: LiveKeyIndex | None = None,
+        key_type: str = "object",
+        strategy: MutationStrategy | None = None,
+        transaction_policy: TransactionPolicy | None = None,
+        schema_manager: SchemaManager | None = None,
+        prepare_statements: bool = False,
+        metrics: Metrics | None = None,
+        rng: random.Random | None = None,
     ):
         """
         Args:
-            conn: psycopg2 connection targeting the writable database.
+            conn: psycopg2 connection targeting the writable database, or a
+                :class:`ConnectionPool`.  A pooled engine borrows one
+                connection on first use, keeps it (so prepared statements and
+                open transactions stay valid) and swaps it for a fresh one
+                after a connection failure.
             schema: Database schema (e.g. ``public``).
             table_name: Target table for all mutations.
             primary_key: Column name used for ``WHERE`` clauses.
@@ -42,128 +403,384 @@ class MutationEngine:
                 whenever a row is updated (e.g. ``updated_at``).
             generator: Optional :class:`BatchGenerator` used to pick random
                 columns/values during updates.
+            insert_mode: ``"values"`` renders batches through
+                ``execute_values``; ``"copy"`` streams them with
+                ``COPY ... FROM STDIN`` and falls back to ``"values"`` when a
+                value cannot be encoded.
+            copy_format: ``"text"`` or ``"binary"`` COPY encoding.  Binary
+                requires the generator schema to know every column's SQL type.
+            update_mode: ``"row"`` issues one ``UPDATE`` per sampled id;
+                ``"batch"`` groups ids by the chosen column and applies each
+                group with a single ``UPDATE ... FROM (VALUES ...)`` statement.
+            mutation_probability: Chance that :meth:`maybe_mutate_batch`
+                mutates anything at all (default strategy only).
+            update_ratio: Share of mutations that are updates rather than
+                deletes (default strategy only).
+            sample_fraction: Fraction of the batch's ids sampled by each
+                mutation, at least one id (default strategy only).
+            key_index: Optional :class:`LiveKeyIndex`.  Inserted keys are
+                registered in it and mutations sample their targets from it,
+                so rows of any age are updated and deleted keys are never
+                targeted again.  Without an index only the ids of the batch
+                just inserted are mutated.
+            key_type: How inserted primary keys are held: ``"object"`` keeps
+                the generated values, ``"uuid"`` packs them into 16 bytes each
+                and ``"int"`` into a 64-bit array.  Packed keys are decoded
+                only for the sampled ids handed to the driver.
+            strategy: :class:`MutationStrategy` deciding how many updates and
+                deletes follow each batch, how many ids go into one statement
+                and how many columns an update changes.  Defaults to a
+                :class:`RandomStrategy` built from ``mutation_probability``,
+                ``update_ratio`` and ``sample_fraction``.
+            transaction_policy: Optional :class:`TransactionPolicy`.  Without
+                one every statement group commits on its own; with one,
+                statements stay in an open transaction until
+                :meth:`end_batch` reports a due commit or :meth:`flush` is
+                called.
+            schema_manager: Optional :class:`SchemaManager` whose
+                ``schema_version`` keys the statement cache; rendered and
+                prepared statements are discarded whenever it changes.
+            prepare_statements: ``PREPARE`` per-row updates and deletes once
+                per connection and run them with ``EXECUTE``, so the server
+                skips parsing and planning in the hot loop.  Statements are
+                remembered per connection, so an engine moved between
+                connections (e.g. by :class:`~kraft.core.workload.Workload` or
+                a pool) reuses them when it returns to one.
+            metrics: Optional :class:`Metrics` recorder timing the
+                ``insert``, ``update``, ``delete`` and ``commit`` phases and
+                counting rows and insert payload bytes.  Phase timings exclude
+                the commits observed as ``commit``.
+            rng: Random source for choosing mutation targets and updated
+                columns, and for the default strategy (defaults to the
+                ``random`` module).  See :class:`~kraft.core.seed.RandomStreams`.
         """
-        self.conn = conn
-        self.schema = schema
-        self.table_name = table_name
-        self.primary_key = primary_key
-        self.update_column = update_column
-        self.generator = generator
+        super().__init__(
+            schema=schema,
+            table_name=table_name,
+            primary_key=primary_key,
+            update_column=update_column,
+            generator=generator,
+            insert_mode=insert_mode,
+            copy_format=copy_format,
+            update_mode=update_mode,
+            mutation_probability=mutation_probability,
+            update_ratio=update_ratio,
+            sample_fraction=sample_fraction,
+            key_index=key_index,
+            key_type=key_type,
+            strategy=strategy,
+            transaction_policy=transaction_policy,
+            metrics=metrics,
+            rng=rng,
+        )
+        self.pool = conn if isinstance(conn, ConnectionPool) else None
+        self._conn = None if self.pool is not None else conn
+        self.schema_manager = schema_manager
+        self.prepare_statements = prepare_statements
+        self._statements: dict[tuple[Any, ...], Any] = {}
+        # Prepared statements per connection, and names to DEALLOCATE on a
+        # connection the next time the engine runs on it.
+        self._prepared: weakref.WeakKeyDictionary[
+            Any, dict[tuple[Any, ...], tuple[str, sql.Composed]]
+        ] = weakref.WeakKeyDictionary()
+        self._deallocate: weakref.WeakKeyDictionary[Any, list[str]] = weakref.WeakKeyDictionary()
+        self._statement_version: int | None = None
 
-        self.total_inserts = 0
-        self.total_updates = 0
-        self.total_deletes = 0
+    def insert_batch(self, rows: list[dict[str, object]] | ColumnarBatch) -> KeyArray:
+        """Insert a batch of row dictionaries or a :class:`ColumnarBatch`.
 
-    def insert_batch(self, rows: list[dict[str, object]]) -> list[object]:
+        Returns the primary key values of the inserted rows, stored as
+        configured by ``key_type``.
+        """
         if not rows:
-            return []
+            return key_array(self.key_type)
 
-        columns = list(rows[0].keys())
-        inserted_ids = [row[self.primary_key] for row in rows]
+        started = self._clock() if self.metrics is not None else 0.0
+        columns, column_values, inserted_ids = self._split_rows(rows)
+        payload = self._insert_columns(columns, column_values)
+        self._inserted(len(rows), inserted_ids, started, payload)
+        return inserted_ids
 
-        query = sql.SQL("INSERT INTO {}.{} ({}) VALUES %s").format(
-            sql.Identifier(self.schema),
-            sql.Identifier(self.table_name),
-            sql.SQL(", ").join(map(sql.Identifier, columns)),
-        )
-        values = [[row[col] for col in columns] for row in rows]
-        with self.conn.cursor() as cur:
-            execute_values(cur, query, values)
-            self.conn.commit()
+    def _insert_columns(self, columns: list[str], column_values: list[list[Any]]) -> int:
+        """Write one batch given column by column; returns the payload size in bytes.
+
+        The size is only measured when :attr:`metrics` is set (or for COPY).
+        """
+        if self.insert_mode == "copy":
+            payload = self._copy_columns(columns, column_values)
+            if payload is not None:
+                return payload
+        query = self._statement(("insert", tuple(columns)), partial(self._insert_query, columns))
+        values = list(zip(*column_values, strict=True))
+        with self._cursor() as cur:
+            execute_values(cur, query, values, page_size=len(values))
+            # One page, so the last query is the whole rendered INSERT.
+            return len(cur.query or b"") if self.metrics is not None else 0
+
+    def _copy_columns(self, columns: list[str], column_values: list[list[Any]]) -> int | None:
+        """Stream the batch with ``COPY`` and return the payload size in bytes.
 
-        self.total_inserts += len(rows)
-        logger.info(
-            "Inserted %d rows into %s.%s", len(rows), self.schema, self.table_name
+        Returns ``None`` without writing anything if the batch cannot be encoded.
+        """
+        buffer = self._encode_copy(columns, column_values)
+        if buffer is None:
+            return None
+        query = self._statement(
+            ("copy", tuple(columns), self.copy_format), partial(self._copy_query, columns)
         )
-        return inserted_ids
+        with self._cursor() as cur:
+            cur.copy_expert(query, buffer)
+        return buffer.getbuffer().nbytes
 
     def maybe_mutate_batch(self, ids: Iterable[object]) -> tuple[int, int]:
-        ids = list(ids)
-        if not ids or random.random() > 0.5:
-            return 0, 0
+        """Run the updates and deletes :attr:`strategy` plans for a new batch."""
+        if not isinstance(ids, Sequence):
+            ids = list(ids)
+        updates, deletes = self.strategy.plan(len(ids))
+        updated = self.mutate("update", updates, ids) if updates else 0
+        deleted = self.mutate("delete", deletes, ids) if deletes else 0
+        return updated, deleted
 
-        operation = random.choice(["update", "delete"])
-        sample_size = max(1, len(ids) // 4)
-        subset = random.sample(ids, sample_size)
-        logger.debug("Selected %s mutation for %d ids", operation, len(subset))
+    def mutate(self, operation: str, count: int, ids: Iterable[object] = ()) -> int:
+        """Update or delete up to ``count`` rows and return how many were affected.
 
+        Targets come from :attr:`key_index` when configured (deleted keys are
+        removed from it), otherwise from ``ids``.  Each statement carries at
+        most :meth:`MutationStrategy.batch_size` ids.
+        """
+        chunks, positions = self._mutation_targets(operation, count, ids)
         if operation == "update":
-            updated = self._update_records(subset)
-            self.total_updates += updated
-            if updated:
-                logger.info(
-                    "Updated %d rows in %s.%s", updated, self.schema, self.table_name
-                )
-            return updated, 0
-        deleted = self._delete_records(subset)
-        self.total_deletes += deleted
-        if deleted:
-            logger.info(
-                "Deleted %d rows from %s.%s", deleted, self.schema, self.table_name
-            )
-        return 0, deleted
+            return sum([self.update_rows(chunk) for chunk in chunks])
+        deleted = sum([self.delete_rows(chunk) for chunk in chunks])
+        self._forget_deleted(positions)
+        return deleted
 
-    def _update_records(self, ids: list[object]) -> int:
-        if not ids or not self.generator:
-            return 0
+    def update_rows(self, ids: Iterable[object]) -> int:
+        """Update ``ids`` with fresh values and count them; returns rows updated."""
+        started = self._clock() if self.metrics is not None else 0.0
+        updated = self._update_records(list(ids))
+        self._updated(updated, started)
+        return updated
 
-        modifiable = self.generator.get_modifiable_columns(exclude=[self.primary_key])
+    def delete_rows(self, ids: Iterable[object]) -> int:
+        """Delete ``ids`` and count them; returns rows deleted.
+
+        Explicit ids are not removed from :attr:`key_index`; use :meth:`mutate`
+        or :meth:`LiveKeyIndex.discard` to keep it in sync.
+        """
+        started = self._clock() if self.metrics is not None else 0.0
+        deleted = self._delete_records(list(ids))
+        self._deleted(deleted, started)
+        return deleted
+
+    def _update_records(self, ids: list[object]) -> int:
+        modifiable = self._modifiable_columns(ids)
         if not modifiable:
             return 0
 
-        with self.conn.cursor() as cur:
-            for row_id in ids:
-                column = random.choice(modifiable)
-                value = self.generator.generate_value(column)
+        if self.update_mode == "batch":
+            self._apply_update_groups(self._update_groups(ids, modifiable))
+            return len(ids)
 
-                if self.update_column:
-                    query = sql.SQL(
-                        "UPDATE {}.{} SET {} = %s, {} = now() WHERE {} = %s"
-                    ).format(
-                        sql.Identifier(self.schema),
-                        sql.Identifier(self.table_name),
-                        sql.Identifier(column),
-                        sql.Identifier(self.update_column),
-                        sql.Identifier(self.primary_key),
-                    )
-                    cur.execute(query, (value, row_id))
-                else:
-                    query = sql.SQL("UPDATE {}.{} SET {} = %s WHERE {} = %s").format(
-                        sql.Identifier(self.schema),
-                        sql.Identifier(self.table_name),
-                        sql.Identifier(column),
-                        sql.Identifier(self.primary_key),
-                    )
-                    cur.execute(query, (value, row_id))
-            self.conn.commit()
+        with self._cursor() as cur:
+            for columns, params in self._row_updates(ids, modifiable):
+                cur.execute(self._row_update_statement(cur, columns), params)
 
         return len(ids)
 
+    def _apply_update_groups(self, groups: dict[tuple[str, ...], list[tuple[object, ...]]]) -> None:
+        """Apply each column set's ``(id, *values)`` rows with one set-based statement."""
+        with self._cursor() as cur:
+            for columns, rows in groups.items():
+                query = self._statement(
+                    ("update_batch", columns), partial(self._batched_update_query, columns)
+                )
+                execute_values(cur, query, rows, page_size=len(rows))
+
+    def _row_update_statement(self, cur: Any, columns: tuple[str, ...]) -> sql.Composed:
+        key = ("update_row", columns)
+        if self.prepare_statements:
+            return self._prepared_statement(
+                cur,
+                key,
+                lambda: self._row_update_query(columns, prepared=True),
+                [*map(self._cast, columns), self._cast(self.primary_key)],
+            )
+        return self._statement(key, lambda: self._row_update_query(columns))
+
     def _delete_records(self, ids: list[object]) -> int:
         if not ids:
             return 0
 
-        pk_type = self._primary_key_type()
-        cast = "::uuid[]" if pk_type == "UUID" else ""
-        query = (
-            f'DELETE FROM "{self.schema}"."{self.table_name}" '
-            f'WHERE "{self.primary_key}" = ANY(%s{cast});'
-        )
-        with self.conn.cursor() as cur:
+        cast = self._delete_cast()
+        with self._cursor() as cur:
+            query: Any
+            if self.prepare_statements:
+                query = self._prepared_statement(
+                    cur,
+                    ("delete",),
+                    lambda: sql.SQL("DELETE FROM {}.{} WHERE {} = ANY($1)").format(
+                        sql.Identifier(self.schema),
+                        sql.Identifier(self.table_name),
+                        sql.Identifier(self.primary_key),
+                    ),
+                    [sql.SQL(cast)],
+                )
+            else:
+                query = self._statement(
+                    ("delete",),
+                    lambda: (
+                        f'DELETE FROM "{self.schema}"."{self.table_name}" '
+                        f'WHERE "{self.primary_key}" = ANY(%s{cast});'
+                    ),
+                )
             cur.execute(query, (ids,))
-            self.conn.commit()
 
         return len(ids)
 
-    def _primary_key_type(self) -> str:
-        """Best-effort lookup of the primary key SQL type from the generator."""
-        if self.generator and self.primary_key in self.generator.schema:
-            return self.generator.schema[self.primary_key].sql_type.upper()
-        return "TEXT"
+    # ------------------------------------------------------------------ #
+    #   Statement cache                                                  #
+    # ------------------------------------------------------------------ #
+    def _statement(self, key: tuple[Any, ...], render: Callable[[], Any]) -> Any:
+        """Return the rendered statement for ``key``, rendering it on first use."""
+        self._sync_statement_cache()
+        statement = self._statements.get(key)
+        if statement is None:
+            statement = self._statements[key] = render()
+        return statement
 
-    def get_counters(self) -> dict[str, int]:
-        return {
-            "total_inserts": self.total_inserts,
-            "total_updates": self.total_updates,
-            "total_deletes": self.total_deletes,
-        }
+    def _prepared_statement(
+        self,
+        cur: Any,
+        key: tuple[Any, ...],
+        render: Callable[[], sql.Composed],
+        casts: list[sql.SQL],
+    ) -> sql.Composed:
+        """``PREPARE`` ``render()`` on first use and return its ``EXECUTE`` statement.
+
+        ``casts`` are applied to the ``EXECUTE`` arguments so untyped literals
+        reach the server with the parameter types the statement was planned for.
+        """
+        self._sync_statement_cache()
+        for name in self._deallocate.pop(self.conn, ()):
+            cur.execute(sql.SQL("DEALLOCATE {}").format(sql.Identifier(name)))
+        statements = self._prepared.setdefault(self.conn, {})
+        prepared = statements.get(key)
+        if prepared is None:
+            name = f"kraft_{next(_statement_ids)}"
+            cur.execute(sql.SQL("PREPARE {} AS {}").format(sql.Identifier(name), render()))
+            execute = sql.SQL("EXECUTE {} ({})").format(
+                sql.Identifier(name),
+                sql.SQL(", ").join(sql.Composed([sql.SQL("%s"), cast]) for cast in casts),
+            )
+            prepared = statements[key] = (name, execute)
+        return prepared[1]
+
+    def _sync_statement_cache(self) -> None:
+        """Drop cached statements after a schema change."""
+        version = self.schema_manager.schema_version if self.schema_manager else None
+        if version != self._statement_version:
+            self._statement_version = version
+            self.clear_statement_cache()
+
+    def clear_statement_cache(self) -> None:
+        """Forget rendered statements and ``DEALLOCATE`` prepared ones.
+
+        Statements on the current connection are deallocated at once.  Other
+        connections may be in use by another thread, so theirs are deallocated
+        the next time the engine runs on them.
+
+        Called automatically when the schema manager's version changes; call it
+        yourself after altering the table behind the engine's back.
+        """
+        self._statements = {}
+        for conn, statements in self._prepared.items():
+            self._deallocate.setdefault(conn, []).extend(name for name, _ in statements.values())
+        self._prepared.clear()
+        conn = self._conn
+        if conn is not None and conn in self._deallocate:
+            names = self._deallocate.pop(conn)
+            with conn.cursor() as cur:
+                for name in names:
+                    cur.execute(sql.SQL("DEALLOCATE {}").format(sql.Identifier(name)))
+
+    def _begin(self, cur: Any) -> None:
+        """Open the policy's transaction before the first statement of a window."""
+        policy = self.transaction_policy
+        if policy is None or self._in_transaction:
+            return
+        self._in_transaction = True
+        policy.begin()
+        if not policy.synchronous_commit:
+            cur.execute("SET LOCAL synchronous_commit TO off")
+
+    @property
+    def conn(self) -> Any:
+        """The engine's connection, borrowed from :attr:`pool` on first use."""
+        if self._conn is None and self.pool is not None:
+            self._conn = self.pool.getconn()
+        return self._conn
+
+    @conn.setter
+    def conn(self, value: Any) -> None:
+        self._conn = value
+
+    @contextmanager
+    def _cursor(self) -> Iterator[Any]:
+        """Run one statement group; commits unless a transaction policy defers it."""
+        try:
+            with self.conn.cursor() as cur:
+                self._begin(cur)
+                yield cur
+                if self.transaction_policy is None:
+                    self._commit()
+        except CONNECTION_ERRORS:
+            if self.pool is not None:
+                self.release_connection(discard=True)
+            raise
+
+    def _commit(self) -> None:
+        """Commit, observing the ``commit`` phase when metrics are enabled."""
+        if self.metrics is None:
+            self.conn.commit()
+            return
+        started = time.perf_counter()
+        self.conn.commit()
+        self._committed(started)
+
+    def release_connection(self, *, discard: bool = False) -> None:
+        """Hand a pooled connection back (``discard`` closes it instead).
+
+        An open policy transaction is rolled back by the pool; call
+        :meth:`flush` first to keep it.  A no-op for unpooled engines.
+        """
+        if self.pool is None or self._conn is None:
+            return
+        conn, self._conn = self._conn, None
+        self._in_transaction = False
+        if self.transaction_policy is not None:
+            self.transaction_policy.reset()
+        if discard:
+            # Closing the connection drops its prepared statements.
+            self._prepared.pop(conn, None)
+            self._deallocate.pop(conn, None)
+        self.pool.putconn(conn, close=discard)
+
+    def end_batch(self, rows: int) -> bool:
+        """Mark the end of a batch of ``rows``; returns ``True`` if it committed.
+
+        A no-op without a :attr:`transaction_policy`.
+        """
+        policy = self.transaction_policy
+        if policy is None or not policy.record(rows):
+            return False
+        self.flush()
+        return True
+
+    def flush(self) -> None:
+        """Commit the open policy transaction, if any."""
+        if self._in_transaction:
+            self._commit()
+            self._in_transaction = False
+        if self.transaction_policy is not None:
+            self.transaction_policy.reset()
@@ -0,0 +1,363 @@
+"""Multi-process simulation driver with centrally coordinated schema evolution."""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import queue
+import random
+import sys
+import traceback
+from collections.abc import Callable, Mapping
+from dataclasses import replace
+from typing import Any
+
+from kraft.core.batch import BatchGenerator, ColumnarBatch
+from kraft.core.column import ColumnDefinition
+from kraft.core.evolution import EvolutionController
+from kraft.core.mutator import MutationEngine
+from kraft.core.pool import ConnectionPool
+from kraft.core.schema import SchemaManager, _NonNullGenerator, _NullableGenerator
+from kraft.core.seed import RandomStreams
+
+logger = logging.getLogger(__name__)
+
+COUNTER_KEYS = ("total_inserts", "total_updates", "total_deletes")
+
+
+class ParallelSimulationRunner:
+    """Shard a simulation across worker processes.
+
+    Each worker forks from the driver, opens its own connection through
+    ``connect`` and drives a private :class:`MutationEngine`.  Schema evolution
+    stays in the driver: workers run in lock-step *rounds* (one batch per worker
+    per round) and the driver only synchronizes with them at rounds where the
+    :class:`EvolutionController` may act.  Between those checkpoints workers run
+    uninterrupted, and every checkpoint hands them the current definition of
+    every active column (name, SQL type, constraints and the ``NOT NULL``
+    changes applied to its generator) before their next batch.
+
+    Workers are started with the ``fork`` start method so column generators
+    (often lambdas) do not need to be picklable; this limits the runner to
+    POSIX platforms.  Columns registered on the schema manager after
+    :meth:`run` starts are not visible to workers.
+    """
+
+    def __init__(
+        self,
+        schema_manager: SchemaManager,
+        connect: Callable[[], Any] | ConnectionPool,
+        *,
+        workers: int = 4,
+        total_records: int = 10_000,
+        batch_size: int = 500,
+        evolution_controller: EvolutionController | None = None,
+        columnar: bool = False,
+        engine_options: dict[str, Any] | None = None,
+        seed: int | str | None = None,
+    ):
+        """
+        Args:
+            schema_manager: Manages the physical schema; evolution DDL runs on
+                its connection in the driver process.
+            connect: Zero-arg callable returning a new psycopg2 connection,
+                called once inside every worker.  A :class:`ConnectionPool`
+                lends its connection factory; pooled connections themselves
+                cannot cross ``fork``.
+            workers: Number of worker processes.
+            total_records: Total number of synthetic records across all workers.
+            batch_size: Number of rows generated per worker batch.
+            evolution_controller: Optional controller evaluated between rounds.
+            columnar: Generate :class:`ColumnarBatch` objects in workers.
+            engine_options: Extra keyword arguments for each worker's
+                :class:`MutationEngine` (e.g. ``primary_key``,
+                ``update_column``, ``insert_mode``).
+            seed: Make the run reproducible.  Worker ``i`` derives its column,
+                mutation and ``random``-module streams from the
+                :class:`~kraft.core.seed.RandomStreams` subtree
+                ``("worker", i)`` and the driver's evolution decisions use
+                their own stream, so the same seed and worker count produce
+                the same rows and mutations on every run.
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.schema_manager = schema_manager
+        self.connect = connect.open_connection if isinstance(connect, ConnectionPool) else connect
+        self.workers = workers
+        self.total_records = total_records
+        self.batch_size = batch_size
+        self.evolution_controller = evolution_controller
+        self.columnar = columnar
+        self.engine_options = dict(engine_options or {})
+        self.streams = RandomStreams(seed) if seed is not None else None
+        if self.streams is not None:
+            self.streams.bind(controller=evolution_controller, manager=schema_manager)
+
+        has_work = total_records > 0 and batch_size > 0
+        self.total_batches = -(-total_records // batch_size) if has_work else 0
+        base, extra = divmod(self.total_batches, workers)
+        self.worker_batches = [base + (1 if index < extra else 0) for index in range(workers)]
+        # Every batch is full except the final one of the last worker given an extra batch.
+        self.worker_records = [batches * batch_size for batches in self.worker_batches]
+        if self.total_batches:
+            short = self.total_batches * batch_size - total_records
+            self.worker_records[(extra or workers) - 1] -= short
+        self.worker_counters: list[dict[str, int]] = []
+
+    def run(self) -> None:
+        """Execute the simulation across all workers."""
+        if self.total_batches <= 0:
+            return
+
+        context = multiprocessing.get_context("fork")
+        results: Any = context.Queue()
+        commands: list[Any] = [context.Queue() for _ in range(self.workers)]
+        processes = [
+            context.Process(
+                target=_worker_main,
+                args=(
+                    index,
+                    self.workers,
+                    self.connect,
+                    self.schema_manager.columns,
+                    self._engine_kwargs(),
+                    self.batch_size,
+                    self.worker_records[index],
+                    self.columnar,
+                    self.streams,
+                    commands[index],
+                    results,
+                ),
+                name=f"kraft-worker-{index}",
+                daemon=True,
+            )
+            for index in range(self.workers)
+        ]
+        logger.info(
+            "Starting parallel simulation: %d records across %d batches on %d workers%s",
+            self.total_records,
+            self.total_batches,
+            self.workers,
+            f" (seed={self.streams.seed})" if self.streams is not None else "",
+        )
+        for process in processes:
+            process.start()
+
+        try:
+            self._drive(commands, results, processes)
+            for command in commands:
+                command.put(None)
+            counters: dict[int, dict[str, int]] = {}
+            while len(counters) < self.workers:
+                kind, index, payload = self._receive(results, processes)
+                if kind == "counters":
+                    counters[index] = payload
+            self.worker_counters = [counters[index] for index in range(self.workers)]
+            for process in processes:
+                process.join()
+        finally:
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+        logger.info("Parallel simulation finished. Counters: %s", self.get_counters())
+
+    def get_counters(self) -> dict[str, int]:
+        """Return mutation counters summed across workers."""
+        return {
+            key: sum(counters.get(key, 0) for counters in self.worker_counters)
+            for key in COUNTER_KEYS
+        }
+
+    # ------------------------------------------------------------------ #
+    #   Driver internals                                                 #
+    # ------------------------------------------------------------------ #
+    def _engine_kwargs(self) -> dict[str, Any]:
+        return {
+            "schema": self.schema_manager.schema,
+            "table_name": self.schema_manager.table_name,
+            **self.engine_options,
+        }
+
+    def _drive(self, commands: list[Any], results: Any, processes: list[Any]) -> None:
+        remaining = list(self.worker_batches)
+        total_rounds = max(remaining)
+        round_num = 0
+        while round_num < total_rounds:
+            checkpoint = self._next_checkpoint(round_num, total_rounds)
+            rounds = checkpoint - round_num
+            active = _column_specs(self.schema_manager)
+            pending = 0
+            for index, command in enumerate(commands):
+                batches = min(rounds, remaining[index])
+                if batches:
+                    command.put((batches, active))
+                    remaining[index] -= batches
+                    pending += 1
+            while pending:
+                kind, _, _ = self._receive(results, processes)
+                if kind == "done":
+                    pending -= 1
+            round_num = checkpoint
+            logger.debug("Completed round %d/%d", round_num, total_rounds)
+
+            if self.evolution_controller:
+                self.evolution_controller.evolve(round_num)
+
+    def _next_checkpoint(self, round_num: int, total_rounds: int) -> int:
+        """Return the next round after which the driver must regain control."""
+        if not self.evolution_controller:
+            return total_rounds
+        interval = max(1, self.evolution_controller.evolution_interval)
+        return min(total_rounds, (round_num // interval + 1) * interval)
+
+    def _receive(self, results: Any, processes: list[Any]) -> tuple[str, int, Any]:
+        while True:
+            try:
+                kind, index, payload = results.get(timeout=1.0)
+            except queue.Empty:
+                dead = [p.name for p in processes if p.exitcode not in (None, 0)]
+                if dead:
+                    raise RuntimeError(f"Worker(s) exited unexpectedly: {dead}") from None
+                continue
+            if kind == "error":
+                raise RuntimeError(f"Worker {index} failed:\n{payload}")
+            return kind, index, payload
+
+
+_ColumnSpec = tuple[str, str, str | None, tuple[tuple[str, Any], ...]]
+
+
+def _column_specs(
+    manager: SchemaManager, active: Mapping[str, ColumnDefinition] | None = None
+) -> dict[str, _ColumnSpec]:
+    """Describe the active columns so a worker can rebuild them from its fork-time registry.
+
+    Each spec is ``(original_name, sql_type, constraints, wrappers)``, where
+    ``wrappers`` lists the ``NOT NULL`` generator changes evolution applied,
+    innermost first: ``("not_null", fill)`` or ``("nullable", fraction)``.
+    ``active`` is a snapshot of the manager's active columns, taken if omitted.
+    """
+    if active is None:
+        active = manager.get_active_columns()
+    specs: dict[str, _ColumnSpec] = {}
+    for name, column in active.items():
+        wrappers: list[tuple[str, Any]] = []
+        generator: Any = column.generator
+        while isinstance(generator, _NonNullGenerator | _NullableGenerator):
+            if isinstance(generator, _NonNullGenerator):
+                wrappers.append(("not_null", generator.fill))
+            else:
+                wrappers.append(("nullable", generator.null_fraction))
+            generator = generator.column.generator
+        origin = manager.original_names.get(name, name)
+        specs[name] = (origin, column.sql_type, column.constraints, tuple(reversed(wrappers)))
+    return specs
+
+
+def _build_column(
+    base: ColumnDefinition, name: str, spec: _ColumnSpec, rng: Any
+) -> ColumnDefinition:
+    """Rebuild a driver-side column definition around this worker's ``base`` generator."""
+    _, sql_type, constraints, wrappers = spec
+    column = replace(base, name=name, sql_type=sql_type, constraints=constraints)
+    for kind, argument in wrappers:
+        wrapped: Any = (
+            _NonNullGenerator(column, argument)
+            if kind == "not_null"
+            else _NullableGenerator(column, argument, rng)
+        )
+        column = replace(column, generator=wrapped, batch_generator=None)
+    return column
+
+
+def _shard_generators(
+    columns: dict[str, ColumnDefinition],
+    index: int,
+    count: int,
+    streams: RandomStreams | None = None,
+) -> None:
+    """Give this worker independent random streams after ``fork``.
+
+    With ``streams`` they are derived from the worker's subtree, otherwise
+    from fresh entropy.
+    """
+    if streams is not None:
+        streams.seed_global()
+        streams.seed_columns(columns)
+    else:
+        random.seed()
+        numpy = sys.modules.get("numpy")
+        if numpy is not None:
+            numpy.random.seed()
+    for column in columns.values():
+        shard = getattr(column.generator, "shard", None)
+        if shard is not None:
+            shard(index, count)
+
+
+def _worker_main(
+    index: int,
+    count: int,
+    connect: Callable[[], Any],
+    columns: dict[str, ColumnDefinition],
+    engine_kwargs: dict[str, Any],
+    batch_size: int,
+    records: int,
+    columnar: bool,
+    streams: RandomStreams | None,
+    commands: Any,
+    results: Any,
+) -> None:
+    """Worker loop: apply ``(batches, active_columns)`` commands until ``None``.
+
+    Batches hold ``batch_size`` rows, except the one that reaches this
+    worker's share of ``records``, which is cut short.  ``active_columns``
+    maps each active column to its spec (see :func:`_column_specs`), which
+    names the fork-time column in ``columns`` it derives from and carries its
+    current type, constraints and nullability.
+    """
+    conn = None
+    try:
+        worker_streams = streams.spawn("worker", index) if streams is not None else None
+        _shard_generators(columns, index, count, worker_streams)
+        conn = connect()
+        generator = BatchGenerator(schema={})
+        engine = MutationEngine(conn, generator=generator, **engine_kwargs)
+        previous: dict[str, _ColumnSpec] | None = None
+        nulls: Any = random
+        if worker_streams is not None:
+            worker_streams.bind(engine=engine)
+            nulls = worker_streams.random("nulls")
+        while True:
+            command = commands.get()
+            if command is None:
+                break
+            batches, active = command
+            if active != previous:
+                # Rendered statements cast to the column types they were built for.
+                engine.clear_statement_cache()
+                previous = active
+            generator.schema = {
+                name: _build_column(columns[spec[0]], name, spec, nulls)
+                for name, spec in active.items()
+            }
+            for _ in range(batches):
+                size = min(batch_size, records)
+                records -= size
+                rows: list[dict[str, object]] | ColumnarBatch
+                if columnar:
+                    rows = generator.generate_columnar(size)
+                else:
+                    rows = generator.generate_batch(size)
+                inserted_ids = engine.insert_batch(rows)
+                engine.maybe_mutate_batch(inserted_ids)
+                engine.end_batch(len(rows))
+            # Evolution DDL runs in the driver between commands; never hold locks.
+            engine.flush()
+            results.put(("done", index, batches))
+        results.put(("counters", index, engine.get_counters()))
+    except Exception:
+        results.put(("error", index, traceback.format_exc()))
+    finally:
+        if conn is not None and hasattr(conn, "close"):
+            conn.close()
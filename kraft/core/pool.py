@@ -0,0 +1,184 @@
+"""Thread-safe psycopg2 connection pool with health checks."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+import psycopg2
+from psycopg2 import extensions
+
+logger = logging.getLogger(__name__)
+
+# Errors after which a connection is assumed broken and must not be reused.
+CONNECTION_ERRORS = (psycopg2.OperationalError, psycopg2.InterfaceError)
+
+
+class PoolTimeout(RuntimeError):
+    """Raised when no connection becomes available within the timeout."""
+
+
+class ConnectionPool:
+    """Hand out psycopg2 connections to schema managers, engines and workers.
+
+    Borrowed connections are checked before reuse: closed ones are replaced,
+    and ones idle for longer than ``health_check_interval`` must answer
+    ``SELECT 1`` first.  Connections returned after a
+    :data:`CONNECTION_ERRORS` failure are closed rather than pooled, so a
+    server restart costs the batch in flight and the next borrow reconnects.
+
+    Pass the pool as ``conn`` to :class:`~kraft.core.schema.SchemaManager` and
+    :class:`~kraft.core.mutator.MutationEngine` to give DDL and DML separate
+    sessions, or as ``connect`` to :class:`~kraft.core.workload.Workload` and
+    :class:`~kraft.core.parallel.ParallelSimulationRunner`.
+    """
+
+    def __init__(
+        self,
+        dsn: str | None = None,
+        *,
+        connect: Callable[[], Any] | None = None,
+        min_size: int = 1,
+        max_size: int = 10,
+        timeout: float | None = 30.0,
+        health_check_interval: float | None = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            dsn: libpq connection string passed to ``psycopg2.connect``.
+            connect: Zero-arg factory used instead of ``dsn``.
+            min_size: Connections opened up front.
+            max_size: Upper bound on open connections.
+            timeout: Seconds :meth:`getconn` waits for a free connection;
+                ``None`` waits forever.
+            health_check_interval: Idle seconds after which a connection is
+                pinged before reuse; ``None`` only checks ``closed``.
+            clock: Monotonic time source (overridable for tests).
+        """
+        if (dsn is None) == (connect is None):
+            raise ValueError("Pass exactly one of dsn or connect")
+        if max_size < 1 or not 0 <= min_size <= max_size:
+            raise ValueError("Require 0 <= min_size <= max_size and max_size >= 1")
+        self.open_connection: Callable[[], Any] = connect or (lambda: psycopg2.connect(dsn))
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.health_check_interval = health_check_interval
+        self.clock = clock
+
+        self._cond = threading.Condition()
+        self._idle: list[tuple[Any, float]] = []
+        self._size = 0
+        self._closed = False
+        for _ in range(min_size):
+            self._size += 1
+            self._idle.append((self.open_connection(), clock()))
+
+    @property
+    def size(self) -> int:
+        """Number of open connections, idle or borrowed."""
+        return self._size
+
+    def getconn(self) -> Any:
+        """Borrow a healthy connection, opening one if the pool has room."""
+        deadline = None if self.timeout is None else self.clock() + self.timeout
+        while True:
+            with self._cond:
+                conn: Any = None
+                idle_since = 0.0
+                while conn is None:
+                    if self._closed:
+                        raise RuntimeError("Connection pool is closed")
+                    if self._idle:
+                        conn, idle_since = self._idle.pop()
+                    elif self._size < self.max_size:
+                        self._size += 1
+                        break
+                    else:
+                        remaining = None if deadline is None else deadline - self.clock()
+                        if remaining is not None and remaining <= 0:
+                            raise PoolTimeout(f"No connection available within {self.timeout}s")
+                        self._cond.wait(remaining)
+            if conn is None:
+                try:
+                    return self.open_connection()
+                except BaseException:
+                    self._forget()
+                    raise
+            if self._healthy(conn, idle_since):
+                return conn
+            logger.warning("Discarding unhealthy pooled connection")
+            self._discard(conn)
+
+    def putconn(self, conn: Any, *, close: bool = False) -> None:
+        """Return ``conn``; ``close=True`` (or a broken connection) discards it."""
+        if close or self._closed or conn.closed:
+            self._discard(conn)
+            return
+        try:
+            if conn.get_transaction_status() != extensions.TRANSACTION_STATUS_IDLE:
+                conn.rollback()
+        except CONNECTION_ERRORS:
+            self._discard(conn)
+            return
+        with self._cond:
+            self._idle.append((conn, self.clock()))
+            self._cond.notify()
+
+    @contextmanager
+    def connection(self) -> Iterator[Any]:
+        """Borrow a connection for the ``with`` block.
+
+        It is discarded instead of returned when the block raises one of
+        :data:`CONNECTION_ERRORS`.
+        """
+        conn = self.getconn()
+        try:
+            yield conn
+        except CONNECTION_ERRORS:
+            self.putconn(conn, close=True)
+            raise
+        except BaseException:
+            self.putconn(conn)
+            raise
+        self.putconn(conn)
+
+    def closeall(self) -> None:
+        """Close idle connections and refuse further borrows."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._cond.notify_all()
+        for conn, _ in idle:
+            self._discard(conn)
+
+    def _healthy(self, conn: Any, idle_since: float) -> bool:
+        if conn.closed:
+            return False
+        interval = self.health_check_interval
+        if interval is None or self.clock() - idle_since < interval:
+            return True
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+            conn.rollback()
+        except CONNECTION_ERRORS:
+            return False
+        return True
+
+    def _discard(self, conn: Any) -> None:
+        try:
+            conn.close()
+        except Exception:  # pragma: no cover - closing a dead socket
+            logger.debug("Ignoring error while closing a pooled connection", exc_info=True)
+        self._forget()
+
+    def _forget(self) -> None:
+        with self._cond:
+            self._size -= 1
+            self._cond.notify()
@@ -0,0 +1,241 @@
+"""Pace inserts, updates and deletes against target rates and load profiles."""
+
+from __future__ import annotations
+
+import logging
+import math
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Sequence
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+OPERATIONS = ("insert", "update", "delete")
+# Absorbs float drift from summing many small refills.
+_EPSILON = 1e-9
+
+
+class LoadProfile(ABC):
+    """Target rate (operations per second) as a function of elapsed seconds."""
+
+    @abstractmethod
+    def rate_at(self, elapsed: float) -> float:
+        """Return the target rate ``elapsed`` seconds into the run."""
+
+
+class ConstantProfile(LoadProfile):
+    """A flat target rate."""
+
+    def __init__(self, rate: float):
+        if rate < 0:
+            raise ValueError("rate must not be negative")
+        self.rate = rate
+
+    def rate_at(self, elapsed: float) -> float:
+        return self.rate
+
+
+class RampProfile(LoadProfile):
+    """Linear ramp from ``start`` to ``end`` over ``duration`` seconds, then hold."""
+
+    def __init__(self, start: float, end: float, duration: float):
+        if duration <= 0:
+            raise ValueError("duration must be positive")
+        if start < 0 or end < 0:
+            raise ValueError("rates must not be negative")
+        self.start = start
+        self.end = end
+        self.duration = duration
+
+    def rate_at(self, elapsed: float) -> float:
+        progress = min(1.0, max(0.0, elapsed / self.duration))
+        return self.start + (self.end - self.start) * progress
+
+
+class StepProfile(LoadProfile):
+    """Piecewise-constant rate: ``steps`` is a list of ``(from_second, rate)``."""
+
+    def __init__(self, steps: Sequence[tuple[float, float]]):
+        if not steps:
+            raise ValueError("StepProfile requires at least one step")
+        self.steps = sorted(steps)
+        if any(rate < 0 for _, rate in self.steps):
+            raise ValueError("rates must not be negative")
+
+    def rate_at(self, elapsed: float) -> float:
+        rate = 0.0
+        for start, step_rate in self.steps:
+            if elapsed < start:
+                break
+            rate = step_rate
+        return rate
+
+
+class SineProfile(LoadProfile):
+    """Rate oscillating around ``mean`` by ``amplitude`` every ``period`` seconds."""
+
+    def __init__(self, mean: float, amplitude: float, period: float):
+        if period <= 0:
+            raise ValueError("period must be positive")
+        if amplitude < 0 or mean - amplitude < 0:
+            raise ValueError("Require 0 <= amplitude <= mean")
+        self.mean = mean
+        self.amplitude = amplitude
+        self.period = period
+
+    def rate_at(self, elapsed: float) -> float:
+        return self.mean + self.amplitude * math.sin(2 * math.pi * elapsed / self.period)
+
+
+class TokenBucket:
+    """Token bucket refilled at a (possibly time-varying) profile rate.
+
+    The bucket holds at most ``burst_seconds`` worth of tokens at the current
+    rate, but always enough to satisfy the largest single request so a full
+    batch can be admitted.
+    """
+
+    def __init__(
+        self,
+        profile: LoadProfile,
+        *,
+        burst_seconds: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Any] = time.sleep,
+    ):
+        self.profile = profile
+        self.burst_seconds = burst_seconds
+        self.clock = clock
+        self.sleep = sleep
+        self.reset()
+
+    def reset(self) -> None:
+        """Empty the bucket and restart the profile clock."""
+        self.started_at = self.clock()
+        self.tokens = 0.0
+        self.target_total = 0.0
+        self.granted = 0
+        self._updated_at = self.started_at
+
+    def _refill(self, capacity: float) -> float:
+        now = self.clock()
+        elapsed = now - self.started_at
+        rate = self.profile.rate_at(elapsed)
+        added = rate * (now - self._updated_at)
+        self._updated_at = now
+        self.target_total += added
+        self.tokens = min(max(capacity, rate * self.burst_seconds), self.tokens + added)
+        return rate
+
+    def acquire(self, count: int) -> float:
+        """Block until ``count`` tokens are available; return seconds waited."""
+        waited = 0.0
+        while True:
+            rate = self._refill(count)
+            if self.tokens + _EPSILON >= count:
+                self.tokens = max(0.0, self.tokens - count)
+                self.granted += count
+                return waited
+            # Re-evaluate at least every 100ms so profile changes take effect.
+            delay = 0.1 if rate <= 0 else min(0.1, (count - self.tokens) / rate)
+            self.sleep(delay)
+            waited += delay
+
+    def take_available(self, limit: int) -> int:
+        """Take up to ``limit`` whole tokens without blocking."""
+        self._refill(0)
+        count = min(limit, int(self.tokens + _EPSILON))
+        self.tokens = max(0.0, self.tokens - count)
+        self.granted += count
+        return count
+
+
+class RateController:
+    """Independent token buckets for inserts, updates and deletes.
+
+    Targets may be plain numbers (operations per second) or
+    :class:`LoadProfile` instances.  Inserts are paced by blocking before each
+    batch; updates and deletes take whatever budget accrued since the previous
+    batch, so each stream holds its own rate without stalling the others.
+    Operations without a target are unpaced.
+    """
+
+    def __init__(
+        self,
+        *,
+        inserts: float | LoadProfile | None = None,
+        updates: float | LoadProfile | None = None,
+        deletes: float | LoadProfile | None = None,
+        burst_seconds: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Any] = time.sleep,
+    ):
+        """
+        Args:
+            inserts: Target inserted rows per second.
+            updates: Target updated rows per second.
+            deletes: Target deleted rows per second.
+            burst_seconds: How many seconds of budget a bucket may bank.
+            clock: Monotonic clock, injectable for tests.
+            sleep: Sleep function, injectable for tests.
+        """
+        self.clock = clock
+        self.started_at = clock()
+        self.buckets: dict[str, TokenBucket] = {}
+        for operation, target in zip(OPERATIONS, (inserts, updates, deletes), strict=True):
+            if target is None:
+                continue
+            profile = target if isinstance(target, LoadProfile) else ConstantProfile(target)
+            self.buckets[operation] = TokenBucket(
+                profile, burst_seconds=burst_seconds, clock=clock, sleep=sleep
+            )
+        self.completed = dict.fromkeys(OPERATIONS, 0)
+        self.throttled_seconds = 0.0
+
+    def start(self) -> None:
+        """Restart all profiles and counters; called when a run begins."""
+        self.started_at = self.clock()
+        for bucket in self.buckets.values():
+            bucket.reset()
+        self.completed = dict.fromkeys(OPERATIONS, 0)
+        self.throttled_seconds = 0.0
+
+    def paces(self, operation: str) -> bool:
+        return operation in self.buckets
+
+    def acquire(self, operation: str, count: int) -> None:
+        """Block until ``count`` operations of ``operation`` are allowed."""
+        bucket = self.buckets.get(operation)
+        if bucket is not None:
+            self.throttled_seconds += bucket.acquire(count)
+
+    def available(self, operation: str, limit: int) -> int:
+        """Return how many of ``limit`` ``operation`` rows may run now."""
+        bucket = self.buckets.get(operation)
+        return limit if bucket is None else bucket.take_available(limit)
+
+    def record(self, operation: str, count: int) -> None:
+        """Record ``count`` completed operations for the achieved-rate report."""
+        self.completed[operation] += count
+
+    def report(self) -> dict[str, dict[str, float]]:
+        """Return target vs achieved rate per operation since construction.
+
+        ``target_rate`` is the profile averaged over the run so far; a
+        ``ratio`` persistently below 1 means the database (or consumer) could
+        not keep up with the requested load.
+        """
+        elapsed = self.clock() - self.started_at
+        report: dict[str, dict[str, float]] = {}
+        for operation in OPERATIONS:
+            bucket = self.buckets.get(operation)
+            achieved = self.completed[operation] / elapsed if elapsed > 0 else 0.0
+            entry = {"completed": float(self.completed[operation]), "achieved_rate": achieved}
+            if bucket is not None:
+                target = bucket.target_total / elapsed if elapsed > 0 else 0.0
+                entry["target_rate"] = target
+                entry["current_target"] = bucket.profile.rate_at(elapsed)
+                entry["ratio"] = achieved / target if target else 0.0
+            report[operation] = entry
+        return report
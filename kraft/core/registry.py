@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
+from typing import Any, overload
 
 from kraft.core.column import ColumnDefinition
 
 _REGISTRY: dict[str, ColumnDefinition] = {}
 
 
+@overload
 def register_column(
     *,
     name: str,
@@ -16,13 +18,45 @@ def register_column(
     constraints: str | None = None,
     reserved: bool = False,
     protected: bool = False,
-) -> Callable[[Callable[[], object]], Callable[[], object]]:
+    generator: None = None,
+    batch_generator: Callable[[int], Sequence[Any]] | None = None,
+) -> Callable[[Callable[[], object]], Callable[[], object]]: ...
+
+
+@overload
+def register_column(
+    *,
+    name: str,
+    sql_type: str,
+    constraints: str | None = None,
+    reserved: bool = False,
+    protected: bool = False,
+    generator: Callable[[], object],
+    batch_generator: Callable[[int], Sequence[Any]] | None = None,
+) -> Callable[[], object]: ...
+
+
+def register_column(
+    *,
+    name: str,
+    sql_type: str,
+    constraints: str | None = None,
+    reserved: bool = False,
+    protected: bool = False,
+    generator: Callable[[], object] | None = None,
+    batch_generator: Callable[[int], Sequence[Any]] | None = None,
+) -> Callable[[Callable[[], object]], Callable[[], object]] | Callable[[], object]:
     """Register a reusable column generator via decorator syntax.
 
+    Passing ``generator`` registers the column immediately (no decorator
+    needed), which pairs well with the batch-capable generators in
+    :mod:`kraft.generators`.
+
     Example:
         >>> @register_column(name="sku", sql_type="TEXT")
         ... def sku():
         ...     return secrets.token_hex(4)
+        >>> register_column(name="id", sql_type="UUID", generator=UUIDGenerator())
 
     Args:
         name: Registry key and SQL column name.
@@ -30,6 +64,10 @@ def register_column(
         constraints: Optional constraint snippet appended to DDL.
         reserved: Whether the column should start inactive.
         protected: Whether the column may be dropped.
+        generator: Optional generator to register directly; the generator is
+            returned instead of a decorator.
+        batch_generator: Optional ``n -> values`` callable for columnar
+            generation (see :class:`ColumnDefinition`).
     """
 
     def decorator(func: Callable[[], object]) -> Callable[[], object]:
@@ -40,9 +78,12 @@ def register_column(
             constraints=constraints,
             reserved=reserved,
             protected=protected,
+            batch_generator=batch_generator,
         )
         return func
 
+    if generator is not None:
+        return decorator(generator)
     return decorator
 
 
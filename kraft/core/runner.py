@@ -3,17 +3,31 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Iterable
+import queue
+import random
+import signal
+import threading
+import time
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import replace
+from typing import Any
 
-from kraft.core.batch import BatchGenerator
+from kraft.core.batch import BatchGenerator, ColumnarBatch
 from kraft.core.column import ColumnDefinition
 from kraft.core.evolution import EvolutionController
+from kraft.core.metrics import Metrics
 from kraft.core.mutator import MutationEngine
+from kraft.core.parallel import _build_column, _column_specs
+from kraft.core.rate import RateController
 from kraft.core.registry import get_registered_columns
-from kraft.core.schema import SchemaManager
+from kraft.core.schema import SchemaManager, _NonNullGenerator, _NullableGenerator
+from kraft.core.seed import RandomStreams
 
 logger = logging.getLogger(__name__)
 
+Batch = list[dict[str, object]] | ColumnarBatch
+
 
 class SimulationRunner:
     """Coordinate batch generation, mutations, and schema evolution."""
@@ -23,18 +37,29 @@ class SimulationRunner:
         schema_manager: SchemaManager,
         mutator: MutationEngine,
         *,
-        total_records: int = 10_000,
+        total_records: int | None = 10_000,
         batch_size: int = 500,
         batch_generator: BatchGenerator | None = None,
         evolution_controller: EvolutionController | None = None,
         column_registry: dict[str, ColumnDefinition] | None = None,
         protected_columns: Iterable[str] | None = None,
+        columnar: bool = False,
+        pipeline_depth: int = 0,
+        rate_controller: RateController | None = None,
+        duration: float | None = None,
+        progress_interval: float | None = None,
+        handle_signals: bool = False,
+        concurrent_evolution: bool = False,
+        metrics: Metrics | None = None,
+        seed: int | str | None = None,
     ):
         """
         Args:
             schema_manager: Manages physical table schema and evolution history.
             mutator: Performs inserts/updates/deletes for each batch.
-            total_records: Total number of synthetic records to emit.
+            total_records: Total number of synthetic records to emit; the last
+                batch is shortened to hit it exactly.  ``None`` streams until
+                ``duration`` elapses or :meth:`stop` is called.
             batch_size: Number of rows generated per iteration.
             batch_generator: Optional generator instance; a new one will be
                 created automatically when omitted.
@@ -42,9 +67,56 @@ class SimulationRunner:
                 or drop columns.
             column_registry: Optional registry snapshot to seed new generators.
             protected_columns: Additional columns that should never be dropped.
+            columnar: When ``True`` batches are generated as
+                :class:`ColumnarBatch` objects and handed to the mutator without
+                materializing per-row dictionaries.
+            pipeline_depth: When greater than zero, batches are generated on a
+                background thread up to this many batches ahead of the writer,
+                overlapping generation with database round trips.
+            rate_controller: Optional :class:`RateController` pacing inserts,
+                updates and deletes.  When it targets updates or deletes those
+                replace :meth:`MutationEngine.maybe_mutate_batch`, drawing ids
+                from the engine's key index or the batch just inserted.
+            duration: Optional wall-clock limit in seconds.  The run stops
+                after the batch in flight when the deadline passes.
+            progress_interval: Log a progress line (see :meth:`progress`) at
+                most every this many seconds.
+            handle_signals: Install ``SIGINT``/``SIGTERM`` handlers for the
+                duration of :meth:`run` that request a graceful :meth:`stop`.
+                Only effective when ``run`` is called from the main thread.
+            concurrent_evolution: Run evolution on a background thread (ideally
+                with a pooled ``SchemaManager`` connection and a
+                :class:`~kraft.core.ddl.LockPolicy`) so batches keep flowing
+                while DDL waits for its lock.  An interval that comes up while
+                the previous evolution is still running is skipped.
+            metrics: Optional :class:`~kraft.core.metrics.Metrics` recorder.
+                The runner times the ``generate`` phase, hands the recorder
+                to a mutator and schema manager that have none, emits a
+                snapshot per the recorder's interval and a final one when the
+                run finishes.
+            seed: Make the run reproducible.  Column generators from
+                :mod:`kraft.generators`, the mutator, its strategy and key
+                index, the evolution controller and the schema manager each
+                get an independent :class:`~kraft.core.seed.RandomStreams`
+                stream (unless configured with their own ``rng``), and
+                :meth:`run` seeds the ``random`` module for plain column
+                callables.  With ``pipeline_depth`` the writer's update
+                values come from forks of the column generators on their own
+                ``updates`` stream, and the generating thread waits for each
+                evolution check instead of running ahead of it.
         """
+        if batch_size <= 0 and (total_records is None or total_records > 0):
+            raise ValueError("batch_size must be positive")
         self.schema_manager = schema_manager
         self.mutator = mutator
+        if isinstance(mutator, MutationEngine) and mutator.schema_manager is None:
+            # Evolution bumps the schema version, which invalidates cached statements.
+            mutator.schema_manager = schema_manager
+        if metrics is not None:
+            if isinstance(mutator, MutationEngine) and mutator.metrics is None:
+                mutator.metrics = metrics
+            if isinstance(schema_manager, SchemaManager) and schema_manager.metrics is None:
+                schema_manager.metrics = metrics
         self.total_records = total_records
         self.batch_size = batch_size
         self.batch_generator = batch_generator or BatchGenerator(
@@ -53,35 +125,447 @@ class SimulationRunner:
         self.evolution_controller = evolution_controller
         self.column_registry = column_registry or get_registered_columns()
         self.protected_columns = set(protected_columns or [])
+        self.columnar = columnar
+        self.pipeline_depth = pipeline_depth
+        self.rate_controller = rate_controller
+        self.duration = duration
+        self.progress_interval = progress_interval
+        self.handle_signals = handle_signals
+        self.concurrent_evolution = concurrent_evolution
+        self.metrics = metrics
+        self.realigned_batches = 0
+        self.streams = RandomStreams(seed) if seed is not None else None
+        if self.streams is not None:
+            registry = schema_manager.columns if isinstance(schema_manager, SchemaManager) else {}
+            self.streams.bind(
+                columns={**registry, **self.batch_generator.schema},
+                engine=mutator,
+                controller=evolution_controller,
+                manager=schema_manager,
+            )
 
-        self.total_batches = (
-            total_records // batch_size if batch_size else 0
-        )
+        self.total_batches: int | None = None
+        if total_records is not None:
+            self.total_batches = -(-total_records // batch_size) if total_records > 0 else 0
+        self.batches_completed = 0
+        self.rows_written = 0
+        self._stop_requested = threading.Event()
+        self._started_at: float | None = None
+        self._deadline: float | None = None
+        self._next_progress = 0.0
+        self._evolution_thread: threading.Thread | None = None
+        self._evolution_error: BaseException | None = None
+        # Pipelined mode: the writer's own generator forks, by original column name.
+        self._writer_forks: dict[str, ColumnDefinition] | None = None
+        self._writer_nulls: Any = random
+        self._writer_columns: tuple[dict[str, ColumnDefinition], ...] = ({}, {})
 
     def run(self) -> None:
         """Execute the simulation loop."""
-        if self.total_batches <= 0:
+        if self.total_batches == 0:
             return
 
         logger.info(
-            "Starting simulation: %d records across %d batches",
-            self.total_records,
-            self.total_batches,
+            "Starting simulation: %s records across %s batches%s",
+            self.total_records if self.total_records is not None else "unbounded",
+            self.total_batches if self.total_batches is not None else "unbounded",
+            f" for at most {self.duration}s" if self.duration is not None else "",
+        )
+        if self.streams is not None:
+            logger.info("Seeded run: seed=%s", self.streams.seed)
+            self.streams.seed_global()
+        self._stop_requested.clear()
+        self._started_at = time.monotonic()
+        self._deadline = self._started_at + self.duration if self.duration is not None else None
+        self._next_progress = self._started_at + (self.progress_interval or 0.0)
+        if self.rate_controller:
+            self.rate_controller.start()
+        if self.metrics is not None:
+            self.metrics.start()
+
+        previous_handlers = self._install_signal_handlers() if self.handle_signals else {}
+        try:
+            if self.pipeline_depth:
+                self._run_pipelined()
+            else:
+                for batch_num, size in self._batch_plan():
+                    self._refresh_generator_schema()
+                    rows = self._generate_rows(self.batch_generator, size)
+                    self._process_batch(batch_num, rows)
+        finally:
+            for signum, handler in previous_handlers.items():
+                signal.signal(signum, handler)
+            if self._evolution_thread is not None:
+                self._evolution_thread.join()
+        self._raise_evolution_error()
+        self.mutator.flush()
+        if self.metrics is not None:
+            self.metrics.emit()
+        logger.info("Simulation finished. Counters: %s", self.mutator.get_counters())
+        if self.rate_controller:
+            logger.info("Achieved rates: %s", self.rate_controller.report())
+
+    def stop(self) -> None:
+        """Ask a running simulation to finish after the batch in flight.
+
+        Safe to call from another thread or a signal handler.
+        """
+        self._stop_requested.set()
+
+    def progress(self) -> dict[str, Any]:
+        """Return a snapshot of batches, rows, throughput and mutation counters."""
+        elapsed = time.monotonic() - self._started_at if self._started_at is not None else 0.0
+        return {
+            "batches": self.batches_completed,
+            "rows": self.rows_written,
+            "elapsed_seconds": elapsed,
+            "rows_per_second": self.rows_written / elapsed if elapsed > 0 else 0.0,
+            **self.mutator.get_counters(),
+        }
+
+    def _batch_plan(self) -> Iterator[tuple[int, int]]:
+        """Yield ``(batch_num, size)`` until records, deadline or a stop request run out.
+
+        Only counters are kept between batches, so unbounded runs use constant
+        memory.
+        """
+        remaining = self.total_records
+        batch_num = 0
+        while not self._should_stop():
+            size = self.batch_size
+            if remaining is not None:
+                if remaining <= 0:
+                    return
+                size = min(size, remaining)
+                remaining -= size
+            batch_num += 1
+            yield batch_num, size
+
+    def _should_stop(self) -> bool:
+        if self._stop_requested.is_set():
+            return True
+        if self._deadline is not None and time.monotonic() >= self._deadline:
+            logger.info("Simulation deadline reached")
+            self._stop_requested.set()
+            return True
+        return False
+
+    def _install_signal_handlers(self) -> dict[int, Any]:
+        if threading.current_thread() is not threading.main_thread():
+            logger.debug("Not in the main thread; leaving signal handlers untouched")
+            return {}
+
+        def request_stop(signum: int, frame: Any) -> None:
+            logger.warning(
+                "Received %s; stopping after the current batch", signal.Signals(signum).name
+            )
+            self.stop()
+
+        previous: dict[int, Any] = {}
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            previous[signum] = signal.getsignal(signum)
+            signal.signal(signum, request_stop)
+        return previous
+
+    def _generate_rows(self, generator: BatchGenerator, size: int) -> Batch:
+        metrics = self.metrics
+        started = time.perf_counter() if metrics is not None else 0.0
+        rows: Batch = (
+            generator.generate_columnar(size) if self.columnar else generator.generate_batch(size)
         )
-        for batch_num in range(1, self.total_batches + 1):
-            self.batch_generator.schema = self.schema_manager.get_active_columns()
-            rows = self.batch_generator.generate_batch(self.batch_size)
+        if metrics is not None:
+            metrics.observe("generate", time.perf_counter() - started)
+        return rows
+
+    def _process_batch(self, batch_num: int, rows: Batch) -> None:
+        """Write one batch, mutate a sample of it, then give evolution a chance."""
+        if self.concurrent_evolution:
+            self._raise_evolution_error()
+            # Hold the schema steady from alignment until the batch is written,
+            # so a background drop never removes a column this batch references.
+            with self._schema_locked():
+                rows = self._align_batch(rows, self._active_columns())
+                self._write_batch(rows)
+        else:
+            self._write_batch(rows)
+        self.batches_completed += 1
+        self.rows_written += len(rows)
+        logger.debug("Completed batch %d/%s", batch_num, self.total_batches or "-")
+        if self.progress_interval is not None:
+            now = time.monotonic()
+            if now >= self._next_progress:
+                self._next_progress = now + self.progress_interval
+                logger.info("Progress: %s", self.progress())
+        if self.metrics is not None:
+            self.metrics.maybe_emit()
 
+        if self.evolution_controller and self.concurrent_evolution:
+            self._evolve_in_background(batch_num)
+        elif self.evolution_controller:
+            if batch_num % self.evolution_controller.evolution_interval == 0:
+                # DDL may run on another session; never let it wait on our locks.
+                self.mutator.flush()
+            result = self.evolution_controller.evolve(batch_num)
+            if result and result.startswith("[v"):
+                self._refresh_generator_schema()
+
+    def _write_batch(self, rows: Batch) -> None:
+        controller = self.rate_controller
+        if controller:
+            controller.acquire("insert", len(rows))
+            inserted_ids = self.mutator.insert_batch(rows)
+            controller.record("insert", len(inserted_ids))
+            self._mutate_paced(controller, inserted_ids)
+        else:
             inserted_ids = self.mutator.insert_batch(rows)
             self.mutator.maybe_mutate_batch(inserted_ids)
-            logger.debug("Completed batch %d/%d", batch_num, self.total_batches)
+        self.mutator.end_batch(len(rows))
 
-            if self.evolution_controller:
-                result = self.evolution_controller.evolve(batch_num)
-                if result and "Dropped column" in result:
-                    self._refresh_generator_schema()
-        logger.info("Simulation finished. Counters: %s", self.mutator.get_counters())
+    @contextmanager
+    def _schema_locked(self) -> Iterator[None]:
+        """Hold the schema manager's lock without deadlocking against its DDL.
+
+        Evolution holds the lock while a rename's ``ALTER TABLE`` waits for the
+        table lock, which an open :class:`~kraft.core.transaction.TransactionPolicy`
+        transaction of this writer may hold.  If the lock is taken, commit
+        first so the DDL can finish, then wait.
+        """
+        lock = self.schema_manager.lock
+        if not lock.acquire(blocking=False):
+            self.mutator.flush()
+            lock.acquire()
+        try:
+            yield
+        finally:
+            lock.release()
+
+    def _evolve_in_background(self, batch_num: int) -> None:
+        """Hand this batch's evolution attempt to a background thread."""
+        assert self.evolution_controller is not None
+        if batch_num % self.evolution_controller.evolution_interval != 0:
+            return
+        if self._evolution_thread is not None and self._evolution_thread.is_alive():
+            logger.debug("Previous evolution still running; skipping batch %d", batch_num)
+            return
+        self._evolution_thread = threading.Thread(
+            target=self._evolve, args=(batch_num,), name="kraft-evolution", daemon=True
+        )
+        self._evolution_thread.start()
+
+    def _evolve(self, batch_num: int) -> None:
+        assert self.evolution_controller is not None
+        try:
+            self.evolution_controller.evolve(batch_num)
+        except BaseException as exc:
+            self._evolution_error = exc
+
+    def _raise_evolution_error(self) -> None:
+        error, self._evolution_error = self._evolution_error, None
+        if error is not None:
+            raise error
+
+    def _mutate_paced(self, controller: RateController, ids: Sequence[object]) -> None:
+        """Spend the update/delete budget accrued since the previous batch."""
+        if not (controller.paces("update") or controller.paces("delete")):
+            updated, deleted = self.mutator.maybe_mutate_batch(ids)
+        else:
+            index = self.mutator.key_index
+            limit = len(index) if index is not None else len(ids)
+            updated = deleted = 0
+            if controller.paces("update"):
+                count = controller.available("update", limit)
+                if count:
+                    updated = self.mutator.mutate("update", count, ids)
+            if controller.paces("delete"):
+                count = controller.available("delete", limit)
+                if count:
+                    deleted = self.mutator.mutate("delete", count, ids)
+        controller.record("update", updated)
+        controller.record("delete", deleted)
 
     def _refresh_generator_schema(self) -> None:
         """Point the batch generator at the latest active column set."""
-        self.batch_generator.schema = self.schema_manager.get_active_columns()
+        self.batch_generator.schema = self._active_columns()
+
+    def _active_columns(self) -> dict[str, ColumnDefinition]:
+        """Return the active columns as the writing thread should generate them.
+
+        In pipelined mode the producer thread draws insert values from the
+        schema manager's generators, so the writer's update and realignment
+        values come from forks of them (see :meth:`ValueGenerator.fork`)
+        seeded from the ``updates`` stream.  Each column is forked once and
+        rebuilt around its fork as evolution changes its type or nullability.
+        """
+        active = self.schema_manager.get_active_columns()
+        forks = self._writer_forks
+        if forks is None:
+            return active
+        seen, built = self._writer_columns
+        if seen.keys() == active.keys() and all(seen[n] is c for n, c in active.items()):
+            return built
+        updates = self.streams.spawn("updates") if self.streams is not None else None
+        built = {}
+        for name, spec in _column_specs(self.schema_manager, active).items():
+            origin = spec[0]
+            if origin not in forks:
+                seed = updates.seed_for("column", origin) if updates is not None else None
+                forks[origin] = _fork_column(active[name], seed)
+            built[name] = _build_column(forks[origin], name, spec, self._writer_nulls)
+        self._writer_columns = (active, built)
+        return built
+
+    # ------------------------------------------------------------------ #
+    #   Pipelined mode                                                   #
+    # ------------------------------------------------------------------ #
+    def _run_pipelined(self) -> None:
+        """Generate batches on a producer thread while this thread writes them.
+
+        The bounded queue provides backpressure: generation stays at most
+        ``pipeline_depth`` batches ahead of the writer.  Batches generated for a
+        schema that evolved in the meantime are realigned before writing.
+        """
+        batches: queue.Queue[tuple[int, Batch] | BaseException | None] = queue.Queue(
+            maxsize=self.pipeline_depth
+        )
+        if isinstance(self.schema_manager, SchemaManager):
+            self._writer_forks = {}
+            self._writer_columns = ({}, {})
+            if self.streams is not None:
+                self._writer_nulls = self.streams.spawn("updates").random("nulls")
+        stop = threading.Event()
+        written = _Watermark()
+        producer = threading.Thread(
+            target=self._produce,
+            args=(batches, stop, written),
+            name="kraft-generator",
+            daemon=True,
+        )
+        producer.start()
+        try:
+            while True:
+                item = batches.get()
+                if item is None:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                if self._should_stop():
+                    break
+                batch_num, rows = item
+                self._refresh_generator_schema()
+                rows = self._align_batch(rows, self.batch_generator.schema)
+                self._process_batch(batch_num, rows)
+                written.advance(batch_num)
+        finally:
+            stop.set()
+            producer.join()
+
+    def _produce(
+        self,
+        batches: queue.Queue[tuple[int, Batch] | BaseException | None],
+        stop: threading.Event,
+        written: _Watermark,
+    ) -> None:
+        generator = BatchGenerator(schema=self.schema_manager.get_active_columns())
+        try:
+            for batch_num, size in self._batch_plan():
+                if self._evolves_before(batch_num) and not written.wait(batch_num - 1, stop):
+                    return
+                generator.schema = self.schema_manager.get_active_columns()
+                rows = self._generate_rows(generator, size)
+                if not self._offer(batches, (batch_num, rows), stop):
+                    return
+            self._offer(batches, None, stop)
+        except BaseException as exc:
+            self._offer(batches, exc, stop)
+
+    def _evolves_before(self, batch_num: int) -> bool:
+        """Whether a seeded pipelined run must let evolution finish before ``batch_num``.
+
+        Otherwise whether the batch sees the evolved schema (and which of its
+        columns the writer regenerates) would depend on thread timing.
+        Unseeded runs keep generating ahead and realign stale batches.
+        """
+        controller = self.evolution_controller
+        return (
+            self.streams is not None
+            and controller is not None
+            and not self.concurrent_evolution
+            and batch_num > 1
+            and (batch_num - 1) % controller.evolution_interval == 0
+        )
+
+    @staticmethod
+    def _offer(batches: queue.Queue[Any], item: Any, stop: threading.Event) -> bool:
+        """Block until ``item`` is queued; give up once the writer has stopped."""
+        while not stop.is_set():
+            try:
+                batches.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _align_batch(self, rows: Batch, active: dict[str, ColumnDefinition]) -> Batch:
+        """Reshape a batch generated for an older schema to the active columns.
+
+        Dropped columns are removed and newly added ones are generated, so a
+        stale batch never references a column that no longer exists.
+        """
+        names = rows.column_names if isinstance(rows, ColumnarBatch) else list(rows[0])
+        if set(names) == set(active):
+            return rows
+
+        missing = [name for name in active if name not in names]
+        stale = [name for name in names if name not in active]
+        self.realigned_batches += 1
+        logger.debug("Realigning batch: +%s -%s", missing, stale)
+        filled = {name: active[name].generate_many(len(rows)) for name in missing}
+        if isinstance(rows, ColumnarBatch):
+            columns = {name: values for name, values in rows.columns.items() if name in active}
+            columns.update(filled)
+            return ColumnarBatch(columns)
+        for index, row in enumerate(rows):
+            for name in stale:
+                del row[name]
+            for name, values in filled.items():
+                row[name] = values[index]
+        return rows
+
+
+class _Watermark:
+    """The last batch the writer finished, for the producer thread to wait on."""
+
+    def __init__(self) -> None:
+        self._batch = 0
+        self._changed = threading.Condition()
+
+    def advance(self, batch_num: int) -> None:
+        with self._changed:
+            self._batch = batch_num
+            self._changed.notify_all()
+
+    def wait(self, batch_num: int, stop: threading.Event) -> bool:
+        """Block until ``batch_num`` is written; ``False`` if the writer stopped first."""
+        with self._changed:
+            while self._batch < batch_num:
+                if stop.is_set():
+                    return False
+                self._changed.wait(0.1)
+        return True
+
+
+def _fork_column(column: ColumnDefinition, seed: int | None) -> ColumnDefinition:
+    """Return ``column``'s innermost definition with forks of its generators."""
+    while isinstance(column.generator, _NonNullGenerator | _NullableGenerator):
+        column = column.generator.column
+    return replace(
+        column,
+        generator=_fork(column.generator, seed),
+        batch_generator=_fork(column.batch_generator, seed),
+    )
+
+
+def _fork(generator: Any, seed: int | None) -> Any:
+    # Plain callables have no state of their own to split.
+    fork = getattr(generator, "fork", None)
+    return fork(seed) if fork is not None else generator
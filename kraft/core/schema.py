@@ -3,12 +3,46 @@
 from __future__ import annotations
 
 import logging
+import random
+import re
+import threading
+import time
+from collections.abc import Iterable, Iterator, KeysView, Sequence
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import replace
+from itertools import islice
 from typing import Any
 
+import psycopg2
+from psycopg2 import errors, extensions
+
 from kraft.core.column import ColumnDefinition
+from kraft.core.ddl import LockPolicy
+from kraft.core.metrics import Metrics
+from kraft.core.pool import ConnectionPool
 
 logger = logging.getLogger(__name__)
 
+ALTERATIONS = ("widen", "rename", "set_default", "set_not_null", "drop_not_null")
+
+# Type changes that keep every existing value; INT -> BIGINT rewrites the table,
+# VARCHAR(n) -> TEXT only touches the catalog.
+_WIDENINGS = {
+    "SMALLINT": "INT",
+    "INT2": "INT",
+    "INT": "BIGINT",
+    "INTEGER": "BIGINT",
+    "INT4": "BIGINT",
+    "REAL": "DOUBLE PRECISION",
+    "FLOAT4": "DOUBLE PRECISION",
+}
+_VARCHAR = re.compile(r"(?:VARCHAR|CHARACTER VARYING) ?\( ?\d+ ?\)")
+_NOT_NULL = re.compile(r"\bNOT\s+NULL\b", re.IGNORECASE)
+_FILENODE_SQL = "SELECT pg_relation_filenode(%s::regclass);"
+# Every this many versions the full active column set is stored; versions in
+# between are rebuilt from the preceding snapshot and the per-version deltas.
+_CHECKPOINT_INTERVAL = 64
+
 
 class SchemaManager:
     """Create, drop, and evolve a table schema from declarative column metadata."""
@@ -20,30 +54,71 @@ class SchemaManager:
         schema: str,
         table_name: str,
         columns: dict[str, ColumnDefinition],
+        lock_policy: LockPolicy | None = None,
+        null_fraction: float = 0.1,
+        metrics: Metrics | None = None,
+        rng: random.Random | None = None,
     ):
         """
         Args:
-            conn: psycopg2 connection object with privileges to run DDL.
+            conn: psycopg2 connection object with privileges to run DDL, or a
+                :class:`ConnectionPool` to borrow a connection per statement
+                (keeping DDL off the sessions that run DML).
             schema: Database schema (namespace) for the managed table.
             table_name: Target table name.
             columns: Mapping of column name to definition including reserved or
                 protected flags.
+            lock_policy: Optional :class:`LockPolicy` bounding how long each
+                DDL statement waits for its table lock before it is retried.
+            null_fraction: Share of ``None`` values a column's generator yields
+                after evolution drops its ``NOT NULL`` constraint.
+            metrics: Optional :class:`Metrics` recorder; each DDL statement's
+                ``waited_seconds`` is observed as the ``ddl`` phase.
+            rng: Random source deciding which values become ``None`` after
+                ``DROP NOT NULL`` (defaults to the ``random`` module).
         """
         self.conn = conn
         self.schema = schema
         self.table_name = table_name
         self.columns = columns
+        self.lock_policy = lock_policy
+        self.null_fraction = null_fraction
+        self.metrics = metrics
+        self.rng: Any = rng or random
+        # Held by writers from schema snapshot to write, and by evolution
+        # while it changes the active columns (see SimulationRunner).
+        self.lock = threading.RLock()
+        self.ddl_log: list[dict[str, Any]] = []
+        # Renamed column -> the name it was registered under.
+        self.original_names: dict[str, str] = {}
 
         self.active_columns: dict[str, ColumnDefinition] = {
             name: col for name, col in columns.items() if not col.reserved
         }
+        # Candidate indexes (insertion-ordered sets) kept in step with every
+        # change, so evolution never rescans the registry.
+        self._dormant = dict.fromkeys(name for name, col in columns.items() if col.reserved)
+        self._droppable = dict.fromkeys(
+            name for name, col in self.active_columns.items() if not col.protected
+        )
+        self._tombstones: dict[str, None] = {}
+        self._candidates: dict[str, tuple[str, ...]] = {}
+
         self.schema_version = 1
-        self.schema_history: list[set[str]] = [set(self.active_columns)]
+        self._active_names = set(self.active_columns)
+        self._checkpoints = {1: frozenset(self._active_names)}
+        self._deltas: list[tuple[tuple[str, ...], tuple[str, ...]]] = []
 
     # ------------------------------------------------------------------ #
     #   Table lifecycle helpers                                          #
     # ------------------------------------------------------------------ #
     def get_active_columns(self) -> dict[str, ColumnDefinition]:
+        """Return the active column mapping.
+
+        The mapping is replaced (never mutated) when the schema evolves, so a
+        returned snapshot stays consistent even while another thread evolves
+        the schema.  Re-fetch it to observe changes.
+        """
         return self.active_columns
 
     def get_create_table_sql(self) -> str:
@@ -58,79 +133,519 @@ class SchemaManager:
     def create_table(self) -> None:
         """Execute ``CREATE TABLE IF NOT EXISTS`` using the active columns."""
         logger.info("Ensuring table %s.%s exists", self.schema, self.table_name)
-        with self.conn.cursor() as cur:
-            cur.execute(self.get_create_table_sql())
-            self.conn.commit()
+        self._execute(self.get_create_table_sql())
 
     def drop_table(self) -> None:
         """Drop the managed table if it exists."""
         ddl = f"DROP TABLE IF EXISTS {self.schema}.{self.table_name};"
         logger.info("Dropping table %s.%s if it exists", self.schema, self.table_name)
-        with self.conn.cursor() as cur:
-            cur.execute(ddl)
-            self.conn.commit()
+        self._execute(ddl)
 
     # ------------------------------------------------------------------ #
     #   Schema evolution helpers                                         #
     # ------------------------------------------------------------------ #
     def add_column(self) -> str | None:
-        candidates = [
-            name
-            for name, col in self.columns.items()
-            if col.reserved and name not in self.active_columns
-        ]
-        if not candidates:
-            return None
-
-        chosen = candidates[0]
-        definition = self.columns[chosen]
-        ddl = (
-            f"ALTER TABLE {self.schema}.{self.table_name} "
-            f"ADD COLUMN {definition.ddl()};"
-        )
-        logger.info("Adding reserved column '%s' to %s.%s", chosen, self.schema, self.table_name)
-        with self.conn.cursor() as cur:
-            cur.execute(ddl)
-            self.conn.commit()
-
-        self.active_columns[chosen] = definition
-        self._bump_version()
-        return chosen
+        """Promote the first dormant (reserved, never dropped) column; return its name."""
+        added = self.alter_columns(add=1)["add"]
+        return added[0] if added else None
 
     def drop_column(self) -> str | None:
-        candidates = [
-            name
-            for name, col in self.active_columns.items()
-            if not col.protected
+        """Drop the first unprotected active column; return its name."""
+        dropped = self.alter_columns(drop=1)["drop"]
+        return dropped[0] if dropped else None
+
+    @property
+    def dormant_columns(self) -> KeysView[str]:
+        """Reserved columns that are not active, in the order they will be added."""
+        return self._dormant.keys()
+
+    @property
+    def droppable_columns(self) -> KeysView[str]:
+        """Active unprotected columns, in the order they will be dropped."""
+        return self._droppable.keys()
+
+    @property
+    def tombstoned_columns(self) -> KeysView[str]:
+        """Columns dropped by evolution; they are never added back."""
+        return self._tombstones.keys()
+
+    @property
+    def schema_history(self) -> list[set[str]]:
+        """Active column names of every version so far, oldest first."""
+        return [self.columns_at(version) for version in range(1, self.schema_version + 1)]
+
+    def columns_at(self, version: int) -> set[str]:
+        """Reconstruct the active column names of schema ``version``."""
+        if not 1 <= version <= self.schema_version:
+            raise ValueError(f"Unknown schema version {version!r}")
+        base = max(1, version - version % _CHECKPOINT_INTERVAL)
+        names = set(self._checkpoints[base])
+        for added, removed in self._deltas[base - 1 : version - 1]:
+            names.difference_update(removed)
+            names.update(added)
+        return names
+
+    def alteration_candidates(self, operation: str) -> Sequence[str]:
+        """Return the active columns ``operation`` could currently change, in schema order.
+
+        Results are cached until the schema version changes.
+        """
+        if operation == "drop":
+            return tuple(self._droppable)
+        cached = self._candidates.get(operation)
+        if cached is None:
+            cached = self._candidates[operation] = tuple(self._scan_candidates(operation))
+        return cached
+
+    def _scan_candidates(self, operation: str) -> list[str]:
+        active = self.active_columns
+        if operation == "widen":
+            return [name for name, col in active.items() if _widened_type(col.sql_type)]
+        unprotected = {
+            name: col
+            for name, col in active.items()
+            if not col.protected and "PRIMARY KEY" not in (col.constraints or "").upper()
+        }
+        if operation == "rename":
+            return list(unprotected)
+        if operation == "set_default":
+            return [
+                name
+                for name, col in unprotected.items()
+                if "DEFAULT" not in (col.constraints or "").upper()
+            ]
+        if operation == "set_not_null":
+            return [name for name, col in unprotected.items() if not _is_not_null(col)]
+        if operation == "drop_not_null":
+            return [name for name, col in unprotected.items() if _is_not_null(col)]
+        raise ValueError(f"Unknown column operation {operation!r}")
+
+    def alter_columns(
+        self,
+        *,
+        add: int = 0,
+        drop: int = 0,
+        widen: int = 0,
+        rename: int = 0,
+        set_default: int = 0,
+        set_not_null: int = 0,
+        drop_not_null: int = 0,
+    ) -> dict[str, list[str]]:
+        """Apply several column changes in one transaction.
+
+        Each argument caps how many columns that operation changes:
+
+        * ``add`` promotes dormant reserved columns that were never dropped.
+        * ``drop`` removes unprotected columns.
+        * ``widen`` moves ``SMALLINT``/``INT``/``REAL``/``VARCHAR(n)`` columns
+          to a wider type.
+        * ``rename`` renames unprotected columns to ``<name>_v<version>``.
+        * ``set_default`` adds a default drawn from the column's generator.
+        * ``set_not_null`` backfills NULLs and adds ``NOT NULL``; the generator
+          stops yielding ``None``.
+        * ``drop_not_null`` removes ``NOT NULL``; the generator then yields
+          ``None`` for ``null_fraction`` of its values.
+
+        Everything except renames shares a single ``ALTER TABLE`` statement.
+        Renames (which PostgreSQL cannot combine with other actions) and the
+        ``SET NOT NULL`` backfill run as extra statements in the same
+        transaction.  A column takes part in at most one operation per call.
+        When the transaction changes existing columns, :attr:`ddl_log` also
+        records whether PostgreSQL rewrote the table (``rewrote_table``).
+
+        Returns:
+            The changed column names per operation, with renames given as
+            ``"old -> new"``.  Every list is empty when nothing qualified.
+        """
+        counts = {
+            "add": add,
+            "drop": drop,
+            "widen": widen,
+            "rename": rename,
+            "set_default": set_default,
+            "set_not_null": set_not_null,
+            "drop_not_null": drop_not_null,
+        }
+        if any(count < 0 for count in counts.values()):
+            raise ValueError("Column change counts must not be negative")
+
+        active = self.active_columns
+        used: set[str] = set()
+
+        def pick(operation: str) -> list[str]:
+            if not counts[operation]:
+                return []
+            candidates: Iterable[str] = (
+                self._droppable if operation == "drop" else self.alteration_candidates(operation)
+            )
+            unused = (name for name in candidates if name not in used)
+            chosen = list(islice(unused, counts[operation]))
+            used.update(chosen)
+            return chosen
+
+        def pick_literals(operation: str) -> dict[str, tuple[Any, str]]:
+            chosen: dict[str, tuple[Any, str]] = {}
+            if not counts[operation]:
+                return chosen
+            for name in self.alteration_candidates(operation):
+                if len(chosen) == counts[operation]:
+                    break
+                if name in used:
+                    continue
+                value = active[name].generate()
+                literal = _sql_literal(value)
+                if literal is not None:
+                    chosen[name] = (value, literal)
+                    used.add(name)
+            return chosen
+
+        added = list(islice(self._dormant, add))
+        dropped = pick("drop")
+        widened = {
+            name: wider for name in pick("widen") if (wider := _widened_type(active[name].sql_type))
+        }
+        renamed = pick("rename")
+        defaults = pick_literals("set_default")
+        fills = pick_literals("set_not_null")
+        relaxed = pick("drop_not_null")
+        changes = {
+            "add": added,
+            "drop": dropped,
+            "widen": list(widened),
+            "rename": [],
+            "set_default": list(defaults),
+            "set_not_null": list(fills),
+            "drop_not_null": relaxed,
+        }
+        if not any(changes.values()) and not renamed:
+            return changes
+
+        new_names: dict[str, str] = {}
+        for name in renamed:
+            new_name = f"{name}_v{self.schema_version + 1}"
+            while new_name in self.columns:
+                new_name += "_"
+            new_names[name] = new_name
+        changes["rename"] = [f"{old} -> {new}" for old, new in new_names.items()]
+
+        relation = f"{self.schema}.{self.table_name}"
+        clauses = [f"ADD COLUMN {self.columns[name].ddl()}" for name in added]
+        clauses += [f"DROP COLUMN {name}" for name in dropped]
+        clauses += [f"ALTER COLUMN {name} TYPE {wider}" for name, wider in widened.items()]
+        clauses += [
+            f"ALTER COLUMN {name} SET DEFAULT {literal}" for name, (_, literal) in defaults.items()
+        ]
+        clauses += [f"ALTER COLUMN {name} SET NOT NULL" for name in fills]
+        clauses += [f"ALTER COLUMN {name} DROP NOT NULL" for name in relaxed]
+        statements = []
+        if fills:
+            # Keep writers from inserting NULLs between the backfill and SET NOT NULL.
+            statements.append(f"LOCK TABLE {relation} IN ACCESS EXCLUSIVE MODE")
+            statements += [
+                f"UPDATE {relation} SET {name} = {literal} WHERE {name} IS NULL"
+                for name, (_, literal) in fills.items()
+            ]
+        if clauses:
+            statements.append(f"ALTER TABLE {relation} {', '.join(clauses)}")
+        statements += [
+            f"ALTER TABLE {relation} RENAME COLUMN {old} TO {new}" for old, new in new_names.items()
         ]
-        if not candidates:
-            return None
+        ddl = "; ".join(statements) + ";"
+        for operation, names in changes.items():
+            for name in names:
+                if operation == "add":
+                    logger.info(
+                        "Adding reserved column '%s' to %s.%s", name, self.schema, self.table_name
+                    )
+                elif operation == "drop":
+                    logger.warning(
+                        "Dropping column '%s' from %s.%s", name, self.schema, self.table_name
+                    )
+                else:
+                    logger.info("Column %s on %s: %s", operation, relation, name)
 
-        chosen = candidates[0]
-        ddl = (
-            f"ALTER TABLE {self.schema}.{self.table_name} "
-            f"DROP COLUMN {chosen};"
-        )
-        logger.warning("Dropping column '%s' from %s.%s", chosen, self.schema, self.table_name)
-        with self.conn.cursor() as cur:
-            cur.execute(ddl)
-            self.conn.commit()
+        if dropped or fills:
+            # Hide dropped columns and stop generating NULLs before the DDL so
+            # writers never send what the new schema rejects.  This is not a
+            # schema version of its own; the event commits one version below.
+            with self.lock:
+                self._replace_columns(
+                    {
+                        name: replace(
+                            active[name],
+                            constraints=_add_constraint(active[name].constraints, "NOT NULL"),
+                            generator=_NonNullGenerator(active[name], value),
+                            batch_generator=None,
+                        )
+                        for name, (value, _) in fills.items()
+                    },
+                    removed=dropped,
+                )
 
-        del self.active_columns[chosen]
-        self._bump_version()
-        return chosen
+        # Writers must not use the old names once a rename commits.  The runner
+        # commits its open transaction before waiting for this lock, so the
+        # DDL never waits on table locks held by a writer blocked on it.
+        guard: AbstractContextManager[Any] = self.lock if new_names else nullcontext()
+        with guard:
+            try:
+                self._execute(ddl, track_rewrite=bool(widened or defaults or fills or relaxed))
+            except BaseException:
+                if dropped or fills:
+                    with self.lock:
+                        self._replace_columns({name: active[name] for name in fills}, added=dropped)
+                raise
+
+            updates = {
+                name: replace(active[name], sql_type=wider) for name, wider in widened.items()
+            }
+            updates.update(
+                (
+                    name,
+                    replace(
+                        active[name],
+                        constraints=_add_constraint(active[name].constraints, f"DEFAULT {literal}"),
+                    ),
+                )
+                for name, (_, literal) in defaults.items()
+            )
+            updates.update(
+                (
+                    name,
+                    replace(
+                        active[name],
+                        constraints=_NOT_NULL.sub("", active[name].constraints or "").strip()
+                        or None,
+                        generator=_NullableGenerator(active[name], self.null_fraction, self.rng),
+                        batch_generator=None,
+                    ),
+                )
+                for name in relaxed
+            )
+            updates.update(
+                (name, replace(active[name], name=new_name)) for name, new_name in new_names.items()
+            )
+            with self.lock:
+                for old, new in new_names.items():
+                    self.original_names[new] = self.original_names.pop(old, old)
+                self._replace_columns(updates, added=added, renamed=new_names)
+                self._bump_version(
+                    added=[*added, *new_names.values()], removed=[*dropped, *new_names]
+                )
+        return changes
 
     def register_column(self, name: str, definition: ColumnDefinition) -> bool:
         """Add a brand new column definition to the registry."""
         if name in self.columns:
             return False
         self.columns[name] = definition
-        if not definition.reserved:
-            self.active_columns[name] = definition
-            self._bump_version()
+        if definition.reserved:
+            self._dormant[name] = None
+        else:
+            with self.lock:
+                self._replace_columns({}, added=[name])
+                self._bump_version(added=[name])
         return True
 
-    def _bump_version(self) -> None:
-        """Increment the schema version and record the active column set."""
+    @contextmanager
+    def connection(self) -> Iterator[Any]:
+        """Yield the manager's connection, borrowing one when ``conn`` is a pool."""
+        if isinstance(self.conn, ConnectionPool):
+            with self.conn.connection() as conn:
+                yield conn
+        else:
+            yield self.conn
+
+    def _replace_columns(
+        self,
+        updates: dict[str, ColumnDefinition],
+        *,
+        added: Sequence[str] = (),
+        removed: Sequence[str] = (),
+        renamed: dict[str, str] | None = None,
+    ) -> None:
+        """Apply a change to the registry, active set and candidate indexes.
+
+        The schema version is left alone; callers commit one version per
+        evolution event with :meth:`_bump_version`.  ``updates`` maps current
+        names to new definitions.  ``removed``
+        columns only leave the active set.  The registry is updated in place
+        (callers may hold it); the active mapping is replaced, as
+        :meth:`get_active_columns` promises.
+        """
+        renamed = renamed or {}
+        if renamed:
+            registry = {
+                renamed.get(name, name): updates.get(name, col)
+                for name, col in self.columns.items()
+            }
+            self.columns.clear()
+            self.columns.update(registry)
+        else:
+            self.columns.update(updates)
+        if renamed:
+            active = {
+                renamed.get(name, name): updates.get(name, col)
+                for name, col in self.active_columns.items()
+            }
+        else:
+            active = dict(self.active_columns)
+            active.update(updates)
+        for name in removed:
+            del active[name]
+        active.update((name, self.columns[name]) for name in added)
+        self.active_columns = active
+
+        for name in removed:
+            self._droppable.pop(name, None)
+            self._tombstones[name] = None
+        for old, new in renamed.items():
+            if old in self._droppable:
+                del self._droppable[old]
+                self._droppable[new] = None
+        for name in added:
+            self._dormant.pop(name, None)
+            self._tombstones.pop(name, None)
+            if not self.columns[name].protected:
+                self._droppable[name] = None
+        self._candidates.clear()
+
+    def _execute(self, statement: str, *, track_rewrite: bool = False) -> None:
+        """Run and commit one DDL statement, retrying lock timeouts per the policy.
+
+        Every statement is recorded in :attr:`ddl_log` with its attempts,
+        ``waited_seconds`` (start to finish, including backoff) and
+        ``blocked_seconds`` (time spent executing, i.e. queued for or holding
+        the table lock, during which writers to the table were stalled).
+        With ``track_rewrite`` the entry also notes whether the table's file
+        node changed, i.e. whether PostgreSQL rewrote every row.
+        """
+        policy = self.lock_policy
+        started = time.monotonic()
+        blocked = 0.0
+        attempt = 0
+        filenodes: tuple[Any, Any] | None = None
+        while True:
+            attempt += 1
+            attempt_started = time.monotonic()
+            timed_out: errors.LockNotAvailable | None = None
+            with self.connection() as conn:
+                try:
+                    with conn.cursor() as cur:
+                        if policy:
+                            cur.execute(policy.timeout_sql())
+                        if track_rewrite:
+                            cur.execute(_FILENODE_SQL, (f"{self.schema}.{self.table_name}",))
+                            before = cur.fetchone()[0]
+                        cur.execute(statement)
+                        if track_rewrite:
+                            cur.execute(_FILENODE_SQL, (f"{self.schema}.{self.table_name}",))
+                            filenodes = (before, cur.fetchone()[0])
+                    conn.commit()
+                except errors.LockNotAvailable as exc:
+                    conn.rollback()
+                    timed_out = exc
+            blocked += time.monotonic() - attempt_started
+            if timed_out is None or policy is None or attempt >= policy.max_attempts:
+                break
+            delay = policy.delay(attempt)
+            logger.warning(
+                "DDL lock not available after %.2fs (attempt %d/%d); retrying in %.2fs",
+                policy.lock_timeout,
+                attempt,
+                policy.max_attempts,
+                delay,
+            )
+            policy.sleep(delay)
+
+        waited = time.monotonic() - started
+        entry = {
+            "statement": statement,
+            "attempts": attempt,
+            "succeeded": timed_out is None,
+            "waited_seconds": waited,
+            "blocked_seconds": blocked,
+        }
+        if filenodes is not None:
+            entry["rewrote_table"] = filenodes[0] != filenodes[1]
+        self.ddl_log.append(entry)
+        if self.metrics is not None:
+            self.metrics.observe("ddl", waited)
+        if timed_out is not None:
+            raise timed_out
+
+    def _bump_version(self, *, added: Iterable[str] = (), removed: Iterable[str] = ()) -> None:
+        """Increment the schema version, recording how the active column names changed."""
+        delta = (tuple(added), tuple(removed))
+        self._active_names.difference_update(delta[1])
+        self._active_names.update(delta[0])
+        self._deltas.append(delta)
+        self._candidates.clear()
         self.schema_version += 1
-        self.schema_history.append(set(self.active_columns))
+        if self.schema_version % _CHECKPOINT_INTERVAL == 0:
+            self._checkpoints[self.schema_version] = frozenset(self._active_names)
+
+
+def _widened_type(sql_type: str) -> str | None:
+    """Return the wider type ``sql_type`` can change to without losing data."""
+    normalized = " ".join(sql_type.upper().split())
+    if _VARCHAR.fullmatch(normalized):
+        return "TEXT"
+    return _WIDENINGS.get(normalized)
+
+
+def _is_not_null(column: ColumnDefinition) -> bool:
+    return bool(_NOT_NULL.search(column.constraints or ""))
+
+
+def _add_constraint(constraints: str | None, fragment: str) -> str:
+    return f"{constraints.strip()} {fragment}" if constraints else fragment
+
+
+def _sql_literal(value: Any) -> str | None:
+    """Render ``value`` as a SQL literal, or ``None`` when it cannot be inlined."""
+    if value is None:
+        return None
+    try:
+        adapted = extensions.adapt(value)
+        if isinstance(adapted, extensions.QuotedString):
+            # The literal becomes part of a str statement the driver encodes later.
+            adapted.encoding = "utf-8"
+        return str(adapted.getquoted().decode("utf-8"))
+    except (psycopg2.ProgrammingError, UnicodeEncodeError):
+        return None
+
+
+class _NonNullGenerator:
+    """Generator used after ``SET NOT NULL``: ``None`` becomes the backfill value."""
+
+    def __init__(self, column: ColumnDefinition, fill: Any):
+        self.column = column
+        self.fill = fill
+
+    def __call__(self) -> Any:
+        value = self.column.generate()
+        return self.fill if value is None else value
+
+    def generate_many(self, count: int) -> list[Any]:
+        fill = self.fill
+        return [fill if value is None else value for value in self.column.generate_many(count)]
+
+
+class _NullableGenerator:
+    """Generator used after ``DROP NOT NULL``: a share of values become ``None``."""
+
+    def __init__(self, column: ColumnDefinition, null_fraction: float, rng: Any = random):
+        self.column = column
+        self.null_fraction = null_fraction
+        self.rng = rng
+
+    def __call__(self) -> Any:
+        return None if self.rng.random() < self.null_fraction else self.column.generate()
+
+    def generate_many(self, count: int) -> list[Any]:
+        fraction = self.null_fraction
+        rng = self.rng
+        return [
+            None if rng.random() < fraction else value
+            for value in self.column.generate_many(count)
+        ]
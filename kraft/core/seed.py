@@ -0,0 +1,107 @@
+"""Seedable, splittable random streams for reproducible simulations."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import random
+import secrets
+import sys
+from collections.abc import Mapping
+from typing import Any
+
+from kraft.core.column import ColumnDefinition
+
+logger = logging.getLogger(__name__)
+
+
+class RandomStreams:
+    """Derive independent random streams from one seed.
+
+    Every stream is addressed by a path of names, e.g. ``("column", "price")``
+    or, below a :meth:`spawn`-ed child, ``("worker", 3, "column", "price")``.
+    A stream's seed is a hash of the root seed and its path, so it does not
+    depend on which other streams exist, in which order they are drawn from,
+    or in which process they live.  The same seed therefore reproduces the
+    same data however a run is scheduled.
+
+    Pass ``seed`` to :class:`~kraft.core.runner.SimulationRunner`,
+    :class:`~kraft.core.parallel.ParallelSimulationRunner` or
+    :class:`~kraft.core.workload.Workload` to seed a whole run; they call
+    :meth:`bind` on their components.
+    """
+
+    def __init__(self, seed: int | str | None = None, *, path: tuple[str, ...] = ()):
+        """
+        Args:
+            seed: Root seed; ``None`` draws a fresh one, kept in :attr:`seed`
+                so the run can be replayed.
+            path: Names prefixed to every stream (see :meth:`spawn`).
+        """
+        self.seed = seed if seed is not None else secrets.randbits(64)
+        self.path = path
+
+    def spawn(self, *names: object) -> RandomStreams:
+        """Return the subtree of streams below ``names``, e.g. one per worker."""
+        return RandomStreams(self.seed, path=self.path + tuple(map(str, names)))
+
+    def seed_for(self, *names: object) -> int:
+        """Return the 64-bit seed of the stream at ``names``."""
+        key = "/".join((str(self.seed), *self.path, *map(str, names)))
+        return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big")
+
+    def random(self, *names: object) -> random.Random:
+        """Return a fresh :class:`random.Random` for the stream at ``names``."""
+        return random.Random(self.seed_for(*names))
+
+    def seed_columns(self, columns: Mapping[str, ColumnDefinition]) -> None:
+        """Reseed each column's generators that support it, one stream per column.
+
+        Generators from :mod:`kraft.generators` (and any object with a
+        ``reseed(seed)`` method) are reseeded; plain callables are left alone.
+        """
+        for name, column in columns.items():
+            for generator in (column.generator, column.batch_generator):
+                reseed = getattr(generator, "reseed", None)
+                if reseed is not None:
+                    reseed(self.seed_for("column", name))
+
+    def seed_global(self) -> None:
+        """Seed the ``random`` module (and NumPy's legacy global state, if loaded).
+
+        Makes column callables built on the module-level functions
+        reproducible, at the price of touching process-wide state.
+        """
+        random.seed(self.seed_for("global"))
+        numpy = sys.modules.get("numpy")
+        if numpy is not None:
+            numpy.random.seed(self.seed_for("global", "numpy") % 2**32)
+
+    def bind(
+        self,
+        *,
+        columns: Mapping[str, ColumnDefinition] | None = None,
+        engine: Any = None,
+        controller: Any = None,
+        manager: Any = None,
+    ) -> None:
+        """Seed ``columns`` and give each component its own stream.
+
+        Components still drawing from the ``random`` module receive
+        ``mutations``, ``strategy``, ``keys``, ``evolution`` and ``nulls``
+        streams; ones configured with their own ``rng`` keep it.
+        """
+        if columns is not None:
+            self.seed_columns(columns)
+        targets = []
+        if engine is not None:
+            targets += [
+                (engine, "mutations"),
+                (getattr(engine, "strategy", None), "strategy"),
+                (getattr(engine, "key_index", None), "keys"),
+            ]
+        targets += [(controller, "evolution"), (manager, "nulls")]
+        for target, name in targets:
+            if target is not None and getattr(target, "rng", None) is random:
+                target.rng = self.random(name)
+        logger.debug("Bound random streams %s of seed %s", "/".join(self.path), self.seed)
@@ -0,0 +1,137 @@
+"""Mutation strategies: how many updates and deletes follow each inserted batch."""
+
+from __future__ import annotations
+
+import random
+from abc import ABC, abstractmethod
+from typing import Any
+
+_EPSILON = 1e-9
+
+
+class MutationStrategy(ABC):
+    """Decide the update/delete volume that follows every inserted batch.
+
+    Subclasses implement :meth:`plan`.  The shared options shape how the
+    engine executes the plan: ``update_batch_size`` and ``delete_batch_size``
+    cap the ids sent in one statement (``None`` sends them all at once), and
+    ``columns_per_update`` sets how many columns each updated row changes.
+    Strategies that draw random numbers use ``rng`` (defaults to the
+    ``random`` module).
+    """
+
+    def __init__(
+        self,
+        *,
+        update_batch_size: int | None = None,
+        delete_batch_size: int | None = None,
+        columns_per_update: int = 1,
+        rng: random.Random | None = None,
+    ):
+        for name, value in (
+            ("update_batch_size", update_batch_size),
+            ("delete_batch_size", delete_batch_size),
+        ):
+            if value is not None and value < 1:
+                raise ValueError(f"{name} must be at least 1, got {value!r}")
+        if columns_per_update < 1:
+            raise ValueError(f"columns_per_update must be at least 1, got {columns_per_update!r}")
+        self.update_batch_size = update_batch_size
+        self.delete_batch_size = delete_batch_size
+        self.columns_per_update = columns_per_update
+        self.rng: Any = rng or random
+
+    @abstractmethod
+    def plan(self, inserted: int) -> tuple[int, int]:
+        """Return ``(updates, deletes)`` to run after ``inserted`` rows were written."""
+
+    def batch_size(self, operation: str) -> int | None:
+        """Return the per-statement id cap for ``update`` or ``delete``."""
+        if operation == "update":
+            return self.update_batch_size
+        if operation == "delete":
+            return self.delete_batch_size
+        raise ValueError(f"operation must be 'update' or 'delete', got {operation!r}")
+
+
+class RandomStrategy(MutationStrategy):
+    """Coin-flip mutations: maybe mutate, then either update or delete a sample.
+
+    This is the engine's default behaviour.
+    """
+
+    def __init__(
+        self,
+        mutation_probability: float = 0.5,
+        update_ratio: float = 0.5,
+        sample_fraction: float = 0.25,
+        **options: Any,
+    ):
+        """
+        Args:
+            mutation_probability: Chance that a batch is mutated at all.
+            update_ratio: Share of mutations that are updates rather than
+                deletes.
+            sample_fraction: Fraction of the inserted rows touched by each
+                mutation (at least one row).
+            **options: Shared :class:`MutationStrategy` options.
+        """
+        super().__init__(**options)
+        for name, value in (
+            ("mutation_probability", mutation_probability),
+            ("update_ratio", update_ratio),
+            ("sample_fraction", sample_fraction),
+        ):
+            if not 0.0 <= value <= 1.0:
+                raise ValueError(f"{name} must be between 0 and 1, got {value!r}")
+        self.mutation_probability = mutation_probability
+        self.update_ratio = update_ratio
+        self.sample_fraction = sample_fraction
+
+    def plan(self, inserted: int) -> tuple[int, int]:
+        if not inserted or self.rng.random() > self.mutation_probability:
+            return 0, 0
+        size = max(1, int(inserted * self.sample_fraction))
+        if self.rng.random() < self.update_ratio:
+            return size, 0
+        return 0, size
+
+
+class MixStrategy(MutationStrategy):
+    """Hold a fixed ``inserts:updates:deletes`` ratio across the whole run.
+
+    ``MixStrategy(5, 90, 5)`` issues 18 updates and one delete per inserted
+    row, i.e. 90% of all operations are updates.  Fractional remainders carry
+    over between batches, so the long-run mix is exact even when a single
+    batch is too small to express it.  Pair it with a
+    :class:`~kraft.core.keys.LiveKeyIndex` when updates or deletes outnumber
+    inserts; without one, targets are capped at the batch just inserted.
+    """
+
+    def __init__(self, inserts: float, updates: float, deletes: float, **options: Any):
+        """
+        Args:
+            inserts: Insert weight; must be positive.
+            updates: Update weight.
+            deletes: Delete weight.
+            **options: Shared :class:`MutationStrategy` options.
+        """
+        super().__init__(**options)
+        if inserts <= 0:
+            raise ValueError("inserts must be positive")
+        if updates < 0 or deletes < 0:
+            raise ValueError("updates and deletes must not be negative")
+        self.inserts = inserts
+        self.updates = updates
+        self.deletes = deletes
+        self._owed_updates = 0.0
+        self._owed_deletes = 0.0
+
+    def plan(self, inserted: int) -> tuple[int, int]:
+        self._owed_updates += inserted * self.updates / self.inserts
+        self._owed_deletes += inserted * self.deletes / self.inserts
+        updates = int(self._owed_updates + _EPSILON)
+        deletes = int(self._owed_deletes + _EPSILON)
+        self._owed_updates -= updates
+        self._owed_deletes -= deletes
+        return updates, deletes
@@ -0,0 +1,85 @@
+"""Commit granularity for :class:`~kraft.core.mutator.MutationEngine`."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+
+
+class TransactionPolicy:
+    """Decide when the statements of consecutive batches are committed.
+
+    Without a policy the engine commits after every statement group, so each
+    batch costs several commits.  With one, the engine keeps a transaction
+    open across the insert and mutations of a batch and commits at a batch
+    boundary once any threshold is reached:
+
+    * ``every_batches`` - after this many batches.
+    * ``every_rows`` - after this many inserted rows.
+    * ``every_seconds`` - once the open transaction is this old.
+
+    With no threshold set every batch is its own transaction.  Batches are
+    never split, so a transaction always holds whole batches.
+    """
+
+    def __init__(
+        self,
+        *,
+        every_batches: int | None = None,
+        every_rows: int | None = None,
+        every_seconds: float | None = None,
+        synchronous_commit: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            every_batches: Commit after this many batches.
+            every_rows: Commit after this many inserted rows.
+            every_seconds: Commit once the transaction has been open this long.
+            synchronous_commit: ``False`` runs each transaction with
+                ``SET LOCAL synchronous_commit TO off``, trading durability of
+                the last few commits for throughput.
+            clock: Monotonic time source (overridable for tests).
+        """
+        for name, value in (
+            ("every_batches", every_batches),
+            ("every_rows", every_rows),
+            ("every_seconds", every_seconds),
+        ):
+            if value is not None and value <= 0:
+                raise ValueError(f"{name} must be positive, got {value!r}")
+        if every_batches is None and every_rows is None and every_seconds is None:
+            every_batches = 1
+        self.every_batches = every_batches
+        self.every_rows = every_rows
+        self.every_seconds = every_seconds
+        self.synchronous_commit = synchronous_commit
+        self.clock = clock
+        self._batches = 0
+        self._rows = 0
+        self._opened_at: float | None = None
+
+    def begin(self) -> None:
+        """Note that a transaction was opened, starting the time window."""
+        if self._opened_at is None:
+            self._opened_at = self.clock()
+
+    def record(self, rows: int) -> bool:
+        """Count a finished batch of ``rows`` and return whether to commit now."""
+        self._batches += 1
+        self._rows += rows
+        if self.every_batches is not None and self._batches >= self.every_batches:
+            return True
+        if self.every_rows is not None and self._rows >= self.every_rows:
+            return True
+        return (
+            self.every_seconds is not None
+            and self._opened_at is not None
+            and self.clock() - self._opened_at >= self.every_seconds
+        )
+
+    def reset(self) -> None:
+        """Forget the batches and rows of the transaction that was just committed."""
+        self._batches = 0
+        self._rows = 0
+        self._opened_at = None
@@ -0,0 +1,223 @@
+"""Prebuilt, memory-mapped value pools for columns that are expensive to generate."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import mmap
+import os
+import pickle
+import struct
+from array import array
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import replace
+from pathlib import Path
+from typing import Any
+
+from kraft.core.column import ColumnDefinition
+from kraft.generators import ValueGenerator
+
+logger = logging.getLogger(__name__)
+
+_MAGIC = b"KRAFTPOOL\x01"
+# magic, encoding, padding to an 8-byte boundary, value count
+_HEADER = struct.Struct("=10sB5xQ")
+_ENCODINGS = ("utf-8", "pickle")
+
+
+class ValuePool:
+    """A read-only file of precomputed values, indexed without loading it.
+
+    The file holds a header, an array of ``count + 1`` byte offsets and the
+    encoded values back to back.  It is memory-mapped, so opening it is
+    instant, only the pages holding sampled values are read, and processes
+    forked from the one that opened it (see
+    :class:`~kraft.core.parallel.ParallelSimulationRunner`) share the same
+    page cache instead of holding a copy each.
+
+    Pools of strings store UTF-8 text; any other values are pickled, so only
+    open pool files you built yourself.  Offsets use the machine's native
+    byte order: pools are local caches, not an interchange format.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]):
+        """
+        Args:
+            path: Pool file written by :meth:`build`.
+        """
+        self.path = Path(path)
+        with self.path.open("rb") as handle:
+            self._mmap = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mmap) < _HEADER.size:
+            raise ValueError(f"{self.path} is not a Kraft value pool")
+        magic, encoding, count = _HEADER.unpack_from(self._mmap)
+        if magic != _MAGIC or encoding >= len(_ENCODINGS):
+            raise ValueError(f"{self.path} is not a Kraft value pool")
+        self.encoding = _ENCODINGS[encoding]
+        self.count: int = count
+        self._view = view = memoryview(self._mmap)
+        self._offsets = view[_HEADER.size : _HEADER.size + 8 * (count + 1)].cast("Q")
+        self._data = view[_HEADER.size + 8 * (count + 1) :]
+
+    @classmethod
+    def build(cls, path: str | os.PathLike[str], values: Iterable[Any]) -> ValuePool:
+        """Write ``values`` to ``path`` and open the result.
+
+        The file is written next to ``path`` and renamed into place, so
+        concurrent readers never observe a partial pool.
+        """
+        values = list(values)
+        if not values:
+            raise ValueError("A value pool needs at least one value")
+        if all(isinstance(value, str) for value in values):
+            encoding = 0
+            encoded = [value.encode("utf-8") for value in values]
+        else:
+            encoding = 1
+            encoded = [pickle.dumps(value, pickle.HIGHEST_PROTOCOL) for value in values]
+        offsets = array("Q", [0])
+        for item in encoded:
+            offsets.append(offsets[-1] + len(item))
+
+        target = Path(path)
+        staging = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+        with staging.open("wb") as handle:
+            handle.write(_HEADER.pack(_MAGIC, encoding, len(values)))
+            handle.write(offsets.tobytes())
+            handle.write(b"".join(encoded))
+        os.replace(staging, target)
+        return cls(target)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index: int) -> Any:
+        if not -self.count <= index < self.count:
+            raise IndexError(f"pool index {index} out of range")
+        return self.take([index % self.count])[0]
+
+    def take(self, indices: Iterable[int]) -> list[Any]:
+        """Return the values at ``indices`` (each in ``range(len(self))``)."""
+        offsets, data = self._offsets, self._data
+        spans = [(offsets[i], offsets[i + 1]) for i in indices]
+        if self.encoding == "utf-8":
+            return [str(data[start:end], "utf-8") for start, end in spans]
+        return [pickle.loads(data[start:end]) for start, end in spans]
+
+    def close(self) -> None:
+        """Unmap the file."""
+        self._offsets.release()
+        self._data.release()
+        self._view.release()
+        self._mmap.close()
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Reopen by path rather than copying the mapping into the pickle.
+        return (ValuePool, (str(self.path),))
+
+
+class PooledGenerator(ValueGenerator):
+    """Draw values uniformly, with replacement, from a :class:`ValuePool`.
+
+    Generating a value costs one random index and one slice of the mapped
+    file, whatever the column's original generator did.  Seeding, sharding
+    and :class:`~kraft.core.seed.RandomStreams` apply to the index stream.
+    """
+
+    def __init__(self, pool: ValuePool, *, seed: int | None = None):
+        """
+        Args:
+            pool: Values to draw from.
+            seed: Optional seed for reproducible output.
+        """
+        super().__init__(seed=seed)
+        self.pool = pool
+
+    def __call__(self) -> Any:
+        return self.pool.take([self._random.randrange(len(self.pool))])[0]
+
+    def generate_many(self, count: int) -> list[Any]:
+        size = len(self.pool)
+        if self._np_random is not None:
+            indices = self._np_random.integers(0, size, size=count).tolist()
+        else:
+            indices = self._random.choices(range(size), k=count)
+        return self.pool.take(indices)
+
+
+def pool_key(column: ColumnDefinition, size: int) -> str:
+    """Return a stable key for ``column``'s pool of ``size`` values.
+
+    The key covers the column's name and type and its generator's class and
+    public configuration (recursively, e.g. the fields of a
+    :class:`~kraft.generators.JSONGenerator`), so changing any of them builds a
+    new pool.  Plain callables are identified by module and qualified name
+    only; change ``size`` or delete the pool after editing one.
+    """
+    description = [column.name, column.sql_type, size, _describe(column.generator)]
+    if column.batch_generator is not None:
+        description.append(_describe(column.batch_generator))
+    digest = hashlib.blake2b(repr(description).encode(), digest_size=8)
+    return digest.hexdigest()
+
+
+def _describe(value: Any) -> Any:
+    if isinstance(value, ValueGenerator):
+        state = {
+            key: _describe(item)
+            for key, item in sorted(vars(value).items())
+            if not key.startswith("_")
+        }
+        return (type(value).__module__, type(value).__qualname__, state)
+    if isinstance(value, Mapping):
+        return {str(key): _describe(item) for key, item in value.items()}
+    if isinstance(value, list | tuple):
+        return [_describe(item) for item in value]
+    if isinstance(value, str | bytes | int | float | bool) or value is None:
+        return value
+    if callable(value):
+        return (getattr(value, "__module__", None), getattr(value, "__qualname__", repr(value)))
+    return repr(value)
+
+
+def pooled_columns(
+    columns: Mapping[str, ColumnDefinition],
+    names: Sequence[str],
+    directory: str | os.PathLike[str],
+    *,
+    size: int = 100_000,
+) -> dict[str, ColumnDefinition]:
+    """Return ``columns`` with the ``names`` columns drawing from value pools.
+
+    Each named column's pool lives in ``directory`` under its
+    :func:`pool_key`; it is built from the column's generator on first use and
+    reopened by later runs.  Pooled values repeat, so never pool keys or other
+    columns that must be unique.
+
+    Args:
+        columns: Column registry, e.g. the one handed to
+            :class:`~kraft.core.schema.SchemaManager`.
+        names: Columns to pool.
+        directory: Cache directory for pool files (created if missing).
+        size: Number of distinct values per pool.
+    """
+    if size <= 0:
+        raise ValueError(f"size must be positive, got {size!r}")
+    unknown = set(names) - set(columns)
+    if unknown:
+        raise ValueError(f"Unknown columns: {sorted(unknown)}")
+    cache = Path(directory)
+    cache.mkdir(parents=True, exist_ok=True)
+
+    pooled = dict(columns)
+    for name in names:
+        column = columns[name]
+        path = cache / f"{name}-{pool_key(column, size)}.kpool"
+        if path.exists():
+            pool = ValuePool(path)
+        else:
+            logger.info("Building a pool of %d values for column %s", size, name)
+            pool = ValuePool.build(path, column.generate_many(size))
+        pooled[name] = replace(column, generator=PooledGenerator(pool), batch_generator=None)
+    return pooled
+
@@ -0,0 +1,297 @@
+"""Drive many tables from one process over a shared set of connections."""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from kraft.core.batch import BatchGenerator
+from kraft.core.column import ColumnDefinition
+from kraft.core.evolution import EvolutionController
+from kraft.core.mutator import MutationEngine
+from kraft.core.pool import ConnectionPool
+from kraft.core.schema import SchemaManager
+from kraft.core.seed import RandomStreams
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TableSpec:
+    """Declarative description of one table in a :class:`Workload`."""
+
+    name: str
+    columns: dict[str, ColumnDefinition]
+    schema: str = "public"
+    total_records: int = 10_000
+    batch_size: int = 500
+    primary_key: str = "id"
+    update_column: str | None = None
+    mutation_probability: float = 0.5
+    update_ratio: float = 0.5
+    columnar: bool = False
+    evolution: dict[str, Any] | None = None
+    engine_options: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def total_batches(self) -> int:
+        if self.total_records <= 0 or self.batch_size <= 0:
+            return 0
+        return -(-self.total_records // self.batch_size)
+
+
+@dataclass
+class TableStats:
+    """Per-table progress and throughput collected while a workload runs."""
+
+    batches: int = 0
+    busy_seconds: float = 0.0
+    started_at: float | None = None
+    finished_at: float | None = None
+
+    def elapsed(self) -> float:
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.perf_counter()) - self.started_at
+
+
+class _TableState:
+    """Runtime objects for one table; only one worker touches it at a time."""
+
+    def __init__(self, spec: TableSpec):
+        self.spec = spec
+        self.manager = SchemaManager(
+            None, schema=spec.schema, table_name=spec.name, columns=dict(spec.columns)
+        )
+        self.generator = BatchGenerator(schema=self.manager.get_active_columns())
+        self.engine = MutationEngine(
+            None,
+            schema=spec.schema,
+            table_name=spec.name,
+            primary_key=spec.primary_key,
+            update_column=spec.update_column,
+            generator=self.generator,
+            mutation_probability=spec.mutation_probability,
+            update_ratio=spec.update_ratio,
+            schema_manager=self.manager,
+            **spec.engine_options,
+        )
+        self.evolution = (
+            EvolutionController(self.manager, **spec.evolution)
+            if spec.evolution is not None
+            else None
+        )
+        self.stats = TableStats()
+        self.created = False
+
+    @property
+    def done(self) -> bool:
+        return self.stats.batches >= self.spec.total_batches
+
+    def bind(self, conn: Any) -> None:
+        """Point the schema manager and engine at the borrowing worker's connection."""
+        self.manager.conn = conn
+        self.engine.conn = conn
+
+
+class Workload:
+    """Schedule many :class:`TableSpec` tables over a fixed pool of worker threads.
+
+    Each worker opens a single connection through ``connect`` and repeatedly
+    takes the next table from a shared round-robin queue, runs exactly one batch
+    (insert, sampled mutation, evolution check) and puts the table back at the
+    end of the queue.  Tables therefore advance fairly regardless of how many
+    there are, while the process holds only ``workers`` connections.  A table
+    is never processed by two workers at once, so per-table state needs no
+    locking.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], Any] | ConnectionPool,
+        tables: Iterable[TableSpec],
+        *,
+        workers: int = 4,
+        recreate_tables: bool = False,
+        seed: int | str | None = None,
+    ):
+        """
+        Args:
+            connect: Zero-arg callable returning a new psycopg2 connection,
+                called once per worker thread, or a :class:`ConnectionPool`
+                each worker borrows its connection from.
+            tables: Table specifications to drive.  Names must be unique
+                within a schema.
+            workers: Number of worker threads (and connections).
+            recreate_tables: Drop each table before creating it.
+            seed: Make each table's data reproducible.  Table ``schema.name``
+                draws its column, mutation and evolution streams from the
+                :class:`~kraft.core.seed.RandomStreams` subtree
+                ``("table", "schema.name")``, independent of how worker
+                threads interleave.  Plain column callables built on the
+                ``random`` module are shared across threads and stay
+                unseeded.
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.connect = connect
+        self.workers = workers
+        self.recreate_tables = recreate_tables
+        self.streams = RandomStreams(seed) if seed is not None else None
+        self.tables: dict[str, _TableState] = {}
+        for spec in tables:
+            key = f"{spec.schema}.{spec.name}"
+            if key in self.tables:
+                raise ValueError(f"Duplicate table spec for {key}")
+            state = self.tables[key] = _TableState(spec)
+            if self.streams is not None:
+                self.streams.spawn("table", key).bind(
+                    columns=state.manager.columns,
+                    engine=state.engine,
+                    controller=state.evolution,
+                    manager=state.manager,
+                )
+
+    def run(self) -> None:
+        """Run every table to completion."""
+        pending: queue.Queue[_TableState | None] = queue.Queue()
+        active = [state for state in self.tables.values() if not state.done]
+        if not active:
+            return
+        for state in active:
+            pending.put(state)
+
+        remaining = [len(active)]
+        lock = threading.Lock()
+        errors: list[BaseException] = []
+        threads = [
+            threading.Thread(
+                target=self._work,
+                args=(pending, remaining, lock, errors),
+                name=f"kraft-workload-{index}",
+                daemon=True,
+            )
+            for index in range(min(self.workers, len(active)))
+        ]
+        logger.info(
+            "Starting workload: %d tables on %d workers", len(active), len(threads)
+        )
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if errors:
+            raise errors[0]
+        logger.info("Workload finished. Counters: %s", self.get_counters())
+
+    def _work(
+        self,
+        pending: queue.Queue[_TableState | None],
+        remaining: list[int],
+        lock: threading.Lock,
+        errors: list[BaseException],
+    ) -> None:
+        conn = None
+        pool: ConnectionPool | None = None
+        try:
+            if isinstance(self.connect, ConnectionPool):
+                pool = self.connect
+                conn = pool.getconn()
+            else:
+                conn = self.connect()
+            while True:
+                state = pending.get()
+                if state is None:
+                    break
+                self._run_batch(state, conn)
+                if not state.done:
+                    pending.put(state)
+                    continue
+                with lock:
+                    remaining[0] -= 1
+                    finished = remaining[0] == 0
+                if finished:
+                    for _ in range(self.workers):
+                        pending.put(None)
+        except BaseException as exc:
+            with lock:
+                errors.append(exc)
+            # Unblock the other workers; they exit at their next ``get``.
+            for _ in range(self.workers):
+                pending.put(None)
+        finally:
+            if conn is not None and pool is not None:
+                pool.putconn(conn)
+            elif conn is not None and hasattr(conn, "close"):
+                conn.close()
+
+    def _run_batch(self, state: _TableState, conn: Any) -> None:
+        """Run the next batch of ``state`` on ``conn``."""
+        spec, stats = state.spec, state.stats
+        state.bind(conn)
+        start = time.perf_counter()
+        if stats.started_at is None:
+            stats.started_at = start
+        if not state.created:
+            if self.recreate_tables:
+                state.manager.drop_table()
+            state.manager.create_table()
+            state.created = True
+
+        state.generator.schema = state.manager.get_active_columns()
+        size = min(spec.batch_size, spec.total_records - stats.batches * spec.batch_size)
+        if spec.columnar:
+            rows: Any = state.generator.generate_columnar(size)
+        else:
+            rows = state.generator.generate_batch(size)
+        inserted_ids = state.engine.insert_batch(rows)
+        state.engine.maybe_mutate_batch(inserted_ids)
+        # The next turn may run on another worker's connection, so a table's
+        # transaction never outlives its turn.
+        state.engine.end_batch(len(rows))
+        state.engine.flush()
+        stats.batches += 1
+        if state.evolution:
+            state.evolution.evolve(stats.batches)
+
+        end = time.perf_counter()
+        stats.busy_seconds += end - start
+        if state.done:
+            stats.finished_at = end
+
+    # ------------------------------------------------------------------ #
+    #   Reporting                                                        #
+    # ------------------------------------------------------------------ #
+    def get_counters(self) -> dict[str, int]:
+        """Return mutation counters summed across tables."""
+        totals = {"total_inserts": 0, "total_updates": 0, "total_deletes": 0}
+        for state in self.tables.values():
+            for key, value in state.engine.get_counters().items():
+                totals[key] += value
+        return totals
+
+    def report(self) -> dict[str, dict[str, Any]]:
+        """Return per-table counters and throughput keyed by ``schema.table``.
+
+        ``rows_per_second`` counts inserted rows over the table's wall-clock
+        span, which includes time spent waiting for a worker; ``busy_seconds``
+        is the time workers actually spent on the table.
+        """
+        report: dict[str, dict[str, Any]] = {}
+        for key, state in self.tables.items():
+            counters = state.engine.get_counters()
+            elapsed = state.stats.elapsed()
+            report[key] = {
+                **counters,
+                "batches": state.stats.batches,
+                "schema_version": state.manager.schema_version,
+                "busy_seconds": state.stats.busy_seconds,
+                "elapsed_seconds": elapsed,
+                "rows_per_second": counters["total_inserts"] / elapsed if elapsed else 0.0,
+            }
+        return report
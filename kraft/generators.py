@@ -0,0 +1,470 @@
+"""Batch-capable value generators for common PostgreSQL column types.
+
+Every generator is a zero-arg callable (usable as ``ColumnDefinition.generator``)
+drawing one value directly, and also exposes ``generate_many(count)``, which
+produces a whole column from a single block of randomness.
+:class:`~kraft.core.column.ColumnDefinition` picks up ``generate_many``
+automatically, so columns declared with these generators take the fast path in
+:meth:`BatchGenerator.generate_columnar` without a separate ``batch_generator``.
+
+NumPy is used when installed and falls back to the standard library otherwise;
+the two backends produce different (but individually reproducible) streams for
+the same ``seed``.
+
+Example:
+    >>> from kraft import ColumnDefinition
+    >>> from kraft.generators import ChoiceGenerator, UUIDGenerator
+    >>> columns = {
+    ...     "id": ColumnDefinition("id", "UUID", UUIDGenerator(), protected=True),
+    ...     "region": ColumnDefinition("region", "TEXT", ChoiceGenerator(["NA", "EU"])),
+    ... }
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import random
+import string
+import uuid
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Mapping, Sequence
+from datetime import datetime, timedelta
+from itertools import accumulate
+from typing import Any
+
+
+def _load_numpy() -> Any:
+    try:
+        import numpy
+    except ImportError:  # pragma: no cover - depends on the environment
+        return None
+    return numpy
+
+
+np = _load_numpy()
+
+DISTRIBUTIONS = ("uniform", "normal", "lognormal", "exponential")
+_INT64_MIN = -(2**63)
+_INT64_MAX = 2**63 - 1
+
+
+class ValueGenerator(ABC):
+    """Base class for generators that can emit a single value or a whole column."""
+
+    def __init__(self, *, seed: int | None = None):
+        """
+        Args:
+            seed: Optional seed for reproducible output.
+        """
+        self.seed = seed
+        self._random = random.Random(seed)
+        self._np_random = np.random.default_rng(seed) if np is not None else None
+
+    def __call__(self) -> Any:
+        """Return one value.
+
+        Falls back to a one-element batch; subclasses override it with a
+        direct scalar draw, since row-at-a-time callers invoke it per cell.
+        """
+        return self.generate_many(1)[0]
+
+    @abstractmethod
+    def generate_many(self, count: int) -> list[Any]:
+        """Return ``count`` values as driver-friendly Python objects."""
+
+    def reseed(self, seed: int | None) -> None:
+        """Restart this generator's random streams from ``seed``."""
+        self.seed = seed
+        self._random = random.Random(seed)
+        self._np_random = np.random.default_rng(seed) if np is not None else None
+
+    def fork(self, seed: int | None) -> ValueGenerator:
+        """Return a copy drawing from its own stream, for use on another thread.
+
+        The copy is reseeded from ``seed`` (fresh entropy when ``None``) and
+        shares no random state with this generator.
+        """
+        clone = copy.copy(self)
+        clone.reseed(seed)
+        return clone
+
+    def shard(self, index: int, count: int) -> None:
+        """Re-key this generator for worker ``index`` of ``count``.
+
+        Forked workers inherit identical RNG state; sharding gives each one an
+        independent stream (derived from ``seed`` when set, fresh entropy
+        otherwise) so parallel runs do not emit duplicate values.
+        """
+        if self.seed is None:
+            self._random = random.Random()
+            self._np_random = np.random.default_rng() if np is not None else None
+        else:
+            self._random = random.Random(f"{self.seed}:{index}")
+            self._np_random = np.random.default_rng([self.seed, index]) if np is not None else None
+
+
+class UUIDGenerator(ValueGenerator):
+    """Random version-4 UUIDs rendered as strings, built from one random block."""
+
+    def __call__(self) -> str:
+        return str(uuid.UUID(bytes=self._random.randbytes(16), version=4))
+
+    def generate_many(self, count: int) -> list[str]:
+        block = bytearray(self._random.randbytes(16 * count))
+        block[6::16] = bytes(byte & 0x0F | 0x40 for byte in block[6::16])
+        block[8::16] = bytes(byte & 0x3F | 0x80 for byte in block[8::16])
+        digits = block.hex()
+        return [
+            f"{digits[i:i + 8]}-{digits[i + 8:i + 12]}-{digits[i + 12:i + 16]}-"
+            f"{digits[i + 16:i + 20]}-{digits[i + 20:i + 32]}"
+            for i in range(0, 32 * count, 32)
+        ]
+
+
+class SerialGenerator(ValueGenerator):
+    """Monotonic integers, suitable for ``INT``/``BIGINT`` primary keys."""
+
+    def __init__(self, start: int = 1, *, step: int = 1):
+        """
+        Args:
+            start: First value emitted.
+            step: Increment between consecutive values.
+        """
+        super().__init__()
+        self.next_value = start
+        self.step = step
+
+    def __call__(self) -> int:
+        value = self.next_value
+        self.next_value = value + self.step
+        return value
+
+    def generate_many(self, count: int) -> list[int]:
+        start = self.next_value
+        self.next_value = start + count * self.step
+        return list(range(start, self.next_value, self.step))
+
+    def fork(self, seed: int | None) -> ValueGenerator:
+        """Return this generator: a copy would repeat the sequence."""
+        return self
+
+    def shard(self, index: int, count: int) -> None:
+        """Interleave the sequence so worker ``index`` of ``count`` never collides."""
+        self.next_value += index * self.step
+        self.step *= count
+
+
+class IntegerGenerator(ValueGenerator):
+    """Uniform integers in the inclusive range ``[low, high]``."""
+
+    def __init__(self, low: int = 0, high: int = 2**31 - 1, *, seed: int | None = None):
+        """
+        Args:
+            low: Smallest value (inclusive).
+            high: Largest value (inclusive).  Use ``2**63 - 1`` for ``BIGINT``.
+            seed: Optional seed for reproducible output.
+        """
+        if low > high:
+            raise ValueError("low must not exceed high")
+        super().__init__(seed=seed)
+        self.low = low
+        self.high = high
+
+    def __call__(self) -> int:
+        return self._random.randint(self.low, self.high)
+
+    def generate_many(self, count: int) -> list[int]:
+        if self._np_random is not None and self.low >= _INT64_MIN and self.high < _INT64_MAX:
+            values = self._np_random.integers(self.low, self.high + 1, size=count, dtype="int64")
+            return list(values.tolist())
+        if self.high - self.low < 2**53:
+            return self._random.choices(range(self.low, self.high + 1), k=count)
+        return [self._random.randint(self.low, self.high) for _ in range(count)]
+
+
+class FloatGenerator(ValueGenerator):
+    """Floats drawn from a uniform, normal, lognormal or exponential distribution."""
+
+    def __init__(
+        self,
+        distribution: str = "uniform",
+        *,
+        low: float = 0.0,
+        high: float = 1.0,
+        mean: float | None = None,
+        stddev: float = 1.0,
+        precision: int | None = None,
+        seed: int | None = None,
+    ):
+        """
+        Args:
+            distribution: One of ``uniform``, ``normal``, ``lognormal`` or
+                ``exponential``.
+            low: Lower bound for ``uniform``.
+            high: Upper bound for ``uniform``.
+            mean: Mean for ``normal``/``exponential``; mean of the underlying
+                normal for ``lognormal``.  Defaults to ``1.0`` for
+                ``exponential``, which requires a positive mean, and ``0.0``
+                otherwise.
+            stddev: Standard deviation for ``normal``/``lognormal``.
+            precision: Optional number of decimal places to round to.
+            seed: Optional seed for reproducible output.
+        """
+        if distribution not in DISTRIBUTIONS:
+            raise ValueError(f"distribution must be one of {DISTRIBUTIONS}, got {distribution!r}")
+        if mean is None:
+            mean = 1.0 if distribution == "exponential" else 0.0
+        if distribution == "exponential" and mean <= 0:
+            raise ValueError(f"exponential mean must be positive, got {mean!r}")
+        if distribution in ("normal", "lognormal") and stddev < 0:
+            raise ValueError(f"stddev must not be negative, got {stddev!r}")
+        super().__init__(seed=seed)
+        self.distribution = distribution
+        self.low = low
+        self.high = high
+        self.mean = mean
+        self.stddev = stddev
+        self.precision = precision
+
+    def __call__(self) -> float:
+        r = self._random
+        if self.distribution == "uniform":
+            value = self.low + (self.high - self.low) * r.random()
+        elif self.distribution == "normal":
+            value = r.gauss(self.mean, self.stddev)
+        elif self.distribution == "lognormal":
+            value = r.lognormvariate(self.mean, self.stddev)
+        else:
+            value = r.expovariate(1.0 / self.mean)
+        return value if self.precision is None else round(value, self.precision)
+
+    def generate_many(self, count: int) -> list[float]:
+        values = self._draw(count)
+        if self.precision is not None:
+            digits = self.precision
+            return [round(value, digits) for value in values]
+        return values
+
+    def _draw(self, count: int) -> list[float]:
+        rng = self._np_random
+        if rng is not None:
+            if self.distribution == "uniform":
+                array = rng.uniform(self.low, self.high, count)
+            elif self.distribution == "normal":
+                array = rng.normal(self.mean, self.stddev, count)
+            elif self.distribution == "lognormal":
+                array = rng.lognormal(self.mean, self.stddev, count)
+            else:
+                array = rng.exponential(self.mean, count)
+            return list(array.tolist())
+
+        r = self._random
+        if self.distribution == "uniform":
+            span = self.high - self.low
+            return [self.low + span * r.random() for _ in range(count)]
+        if self.distribution == "normal":
+            return [r.gauss(self.mean, self.stddev) for _ in range(count)]
+        if self.distribution == "lognormal":
+            return [r.lognormvariate(self.mean, self.stddev) for _ in range(count)]
+        rate = 1.0 / self.mean
+        return [r.expovariate(rate) for _ in range(count)]
+
+
+class ChoiceGenerator(ValueGenerator):
+    """Categorical values with optional weights."""
+
+    def __init__(
+        self,
+        values: Sequence[Any],
+        weights: Sequence[float] | None = None,
+        *,
+        seed: int | None = None,
+    ):
+        """
+        Args:
+            values: Candidate values.
+            weights: Optional relative weights (same length as ``values``).
+            seed: Optional seed for reproducible output.
+        """
+        if not values:
+            raise ValueError("ChoiceGenerator requires at least one value")
+        if weights is not None and len(weights) != len(values):
+            raise ValueError("weights must match the number of values")
+        super().__init__(seed=seed)
+        self.values = list(values)
+        self.weights = list(weights) if weights is not None else None
+        self._cum_weights = list(accumulate(self.weights)) if self.weights else None
+
+    def __call__(self) -> Any:
+        if self._cum_weights is None:
+            return self._random.choice(self.values)
+        return self._random.choices(self.values, cum_weights=self._cum_weights)[0]
+
+    def generate_many(self, count: int) -> list[Any]:
+        return self._random.choices(self.values, cum_weights=self._cum_weights, k=count)
+
+
+class TimestampGenerator(ValueGenerator):
+    """Uniform ``datetime`` values within ``[start, end)``."""
+
+    def __init__(self, start: datetime, end: datetime, *, seed: int | None = None):
+        """
+        Args:
+            start: Window start (inclusive).  Timezone-aware bounds produce
+                aware values suitable for ``TIMESTAMPTZ``.
+            end: Window end (exclusive).
+            seed: Optional seed for reproducible output.
+        """
+        if end <= start:
+            raise ValueError("end must be after start")
+        super().__init__(seed=seed)
+        self.start = start
+        self.end = end
+        self._span_us = (end - start) // timedelta(microseconds=1)
+
+    def __call__(self) -> datetime:
+        return self.start + timedelta(microseconds=self._random.randrange(self._span_us))
+
+    def generate_many(self, count: int) -> list[datetime]:
+        if self._np_random is not None and self.start.tzinfo is None:
+            micros = self._np_random.integers(0, self._span_us, size=count)
+            base = np.datetime64(self.start, "us")
+            return list((base + micros.astype("timedelta64[us]")).tolist())
+        offsets = self._random.choices(range(self._span_us), k=count)
+        start = self.start
+        return [start + timedelta(microseconds=offset) for offset in offsets]
+
+
+class TextGenerator(ValueGenerator):
+    """Random strings whose length falls in ``[min_length, max_length]``.
+
+    Characters are produced by translating one random byte block through the
+    alphabet, so the alphabet must be ASCII and at most 256 characters long.
+    Bytes past the largest multiple of the alphabet size are dropped and
+    redrawn, so every character is equally likely.
+    """
+
+    def __init__(
+        self,
+        min_length: int = 8,
+        max_length: int = 32,
+        *,
+        alphabet: str = string.ascii_letters + string.digits,
+        seed: int | None = None,
+    ):
+        """
+        Args:
+            min_length: Shortest string length.
+            max_length: Longest string length.
+            alphabet: Characters to draw from.
+            seed: Optional seed for reproducible output.
+        """
+        if not 0 <= min_length <= max_length:
+            raise ValueError("Require 0 <= min_length <= max_length")
+        if not alphabet or len(alphabet) > 256 or not alphabet.isascii():
+            raise ValueError("alphabet must contain 1-256 ASCII characters")
+        super().__init__(seed=seed)
+        self.min_length = min_length
+        self.max_length = max_length
+        self.alphabet = alphabet
+        encoded = alphabet.encode("ascii")
+        self._table = bytes(encoded[i % len(encoded)] for i in range(256))
+        self._rejected = bytes(range(256 - 256 % len(encoded), 256))
+
+    def __call__(self) -> str:
+        length = self._random.randint(self.min_length, self.max_length)
+        return "".join(self._random.choices(self.alphabet, k=length))
+
+    def generate_many(self, count: int) -> list[str]:
+        lengths = self._random.choices(range(self.min_length, self.max_length + 1), k=count)
+        offsets = list(accumulate(lengths, initial=0))
+        text = self._characters(offsets[-1])
+        return [text[offsets[i] : offsets[i + 1]] for i in range(count)]
+
+
+    def _characters(self, total: int) -> str:
+        chunks = []
+        missing = total
+        while missing:
+            chunk = self._random.randbytes(missing).translate(self._table, self._rejected)
+            chunks.append(chunk)
+            missing -= len(chunk)
+        return b"".join(chunks).decode("ascii")
+
+
+class JSONGenerator(ValueGenerator):
+    """JSON documents assembled from per-field generators.
+
+    Documents are returned as JSON text, which PostgreSQL accepts for both
+    ``JSON`` and ``JSONB`` columns and which every insert path can send as-is.
+    """
+
+    def __init__(self, fields: Mapping[str, Callable[[], Any] | Any]):
+        """
+        Args:
+            fields: Mapping of key to a generator (anything callable, ideally a
+                :class:`ValueGenerator`) or a constant value.  Use a nested
+                :class:`JSONGenerator` for sub-documents.
+        """
+        super().__init__()
+        self.fields = dict(fields)
+
+    def __call__(self) -> str:
+        return _dumps(self.generate_document())
+
+    def generate_many(self, count: int) -> list[str]:
+        return [_dumps(document) for document in self.generate_documents(count)]
+
+    def reseed(self, seed: int | None) -> None:
+        """Reseed every field generator from its own stream derived from ``seed``."""
+        super().reseed(seed)
+        for key, spec in self.fields.items():
+            if isinstance(spec, ValueGenerator):
+                derived = random.Random(f"{seed}:{key}").getrandbits(64)
+                spec.reseed(None if seed is None else derived)
+
+    def fork(self, seed: int | None) -> ValueGenerator:
+        clone = copy.copy(self)
+        clone.fields = {
+            key: spec.fork(None) if isinstance(spec, ValueGenerator) else spec
+            for key, spec in self.fields.items()
+        }
+        clone.reseed(seed)
+        return clone
+
+    def shard(self, index: int, count: int) -> None:
+        for spec in self.fields.values():
+            if isinstance(spec, ValueGenerator):
+                spec.shard(index, count)
+
+    def generate_document(self) -> dict[str, Any]:
+        """Return one document as a dictionary (before JSON encoding)."""
+        return {key: _field_value(spec) for key, spec in self.fields.items()}
+
+    def generate_documents(self, count: int) -> list[dict[str, Any]]:
+        """Return ``count`` documents as dictionaries (before JSON encoding)."""
+        keys = list(self.fields)
+        columns = [_field_values(spec, count) for spec in self.fields.values()]
+        return [dict(zip(keys, values, strict=True)) for values in zip(*columns, strict=True)]
+
+
+_dumps = json.JSONEncoder(default=str, separators=(",", ":")).encode
+
+
+def _field_value(spec: Any) -> Any:
+    if isinstance(spec, JSONGenerator):
+        return spec.generate_document()
+    if callable(spec):
+        return spec()
+    return spec
+
+
+def _field_values(spec: Any, count: int) -> list[Any]:
+    if isinstance(spec, JSONGenerator):
+        return list(spec.generate_documents(count))
+    if isinstance(spec, ValueGenerator):
+        return spec.generate_many(count)
+    if callable(spec):
+        return [spec() for _ in range(count)]
+    return [spec] * count
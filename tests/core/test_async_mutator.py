@@ -0,0 +1,250 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from kraft.core.async_mutator import AsyncMutationEngine
+from kraft.core.batch import BatchGenerator, ColumnarBatch
+from kraft.core.column import ColumnDefinition
+from kraft.core.metrics import Metrics
+from kraft.core.strategy import MixStrategy
+from kraft.core.transaction import TransactionPolicy
+
+
+class _AsyncContext:
+    def __init__(self, value):
+        self.value = value
+
+    async def __aenter__(self):
+        return self.value
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+def _mock_pool():
+    pool = MagicMock()
+    conn = MagicMock()
+    conn.commit = AsyncMock()
+    cursor = MagicMock()
+    cursor.execute = AsyncMock()
+    copy = MagicMock()
+    copy.write = AsyncMock()
+    pool.connection.side_effect = lambda: _AsyncContext(conn)
+    pool.getconn = AsyncMock(return_value=conn)
+    pool.putconn = AsyncMock()
+    conn.cursor.side_effect = lambda: _AsyncContext(cursor)
+    cursor.copy.side_effect = lambda query: _AsyncContext(copy)
+    return pool, conn, cursor, copy
+
+
+def test_insert_batch_sends_multi_row_values():
+    pool, conn, cursor, _ = _mock_pool()
+    engine = AsyncMutationEngine(pool, schema="public", table_name="events")
+
+    rows = [{"id": "1", "value": 10}, {"id": "2", "value": 20}]
+    inserted = asyncio.run(engine.insert_batch(rows))
+
+    assert inserted == ["1", "2"]
+    assert engine.total_inserts == 2
+    query, params = cursor.execute.call_args[0]
+    assert query == (
+        'INSERT INTO "public"."events" ("id", "value") VALUES (%s, %s), (%s, %s)'
+    )
+    assert params == ["1", 10, "2", 20]
+    conn.commit.assert_awaited_once()
+
+
+def test_insert_batch_pages_under_parameter_limit():
+    pool, _, cursor, _ = _mock_pool()
+    engine = AsyncMutationEngine(pool, schema="public", table_name="events")
+
+    with patch("kraft.core.async_mutator.MAX_PARAMETERS", 4):
+        asyncio.run(engine.insert_batch(ColumnarBatch({"id": list("abcde"), "v": [1] * 5})))
+
+    assert [len(call[0][1]) for call in cursor.execute.call_args_list] == [4, 4, 2]
+
+
+def test_insert_batch_copy_mode_streams_buffer():
+    pool, _, cursor, copy = _mock_pool()
+    engine = AsyncMutationEngine(pool, schema="public", table_name="events", insert_mode="copy")
+
+    asyncio.run(engine.insert_batch(ColumnarBatch({"id": ["1", "2"], "value": [10, None]})))
+
+    cursor.copy.assert_called_once_with(
+        'COPY "public"."events" ("id", "value") FROM STDIN WITH (FORMAT text)'
+    )
+    copy.write.assert_awaited_once_with(b"1\t10\n2\t\\N\n")
+    cursor.execute.assert_not_called()
+
+
+def test_binary_copy_falls_back_to_values():
+    pool, _, cursor, _ = _mock_pool()
+    schema = {"id": ColumnDefinition("id", "UUID", lambda: "a")}
+    engine = AsyncMutationEngine(
+        pool,
+        schema="public",
+        table_name="events",
+        generator=BatchGenerator(schema=schema),
+        insert_mode="copy",
+        copy_format="binary",
+    )
+
+    asyncio.run(engine.insert_batch([{"id": "not-a-uuid"}]))
+
+    cursor.copy.assert_not_called()
+    cursor.execute.assert_awaited_once()
+
+
+def test_rejects_unknown_modes():
+    with pytest.raises(ValueError):
+        AsyncMutationEngine(MagicMock(), schema="public", table_name="t", insert_mode="bulk")
+    with pytest.raises(ValueError):
+        AsyncMutationEngine(MagicMock(), schema="public", table_name="t", update_mode="merge")
+
+
+def test_batch_update_mode_casts_values():
+    pool, _, cursor, _ = _mock_pool()
+    schema = {
+        "id": ColumnDefinition("id", "UUID", lambda: "id"),
+        "amount": ColumnDefinition("amount", "NUMERIC(10,2)", lambda: 1.5),
+    }
+    engine = AsyncMutationEngine(
+        pool,
+        schema="public",
+        table_name="events",
+        update_column="updated_at",
+        generator=BatchGenerator(schema=schema),
+        update_mode="batch",
+    )
+
+    assert asyncio.run(engine._update_records(["a", "b"])) == 2
+
+    query, params = cursor.execute.call_args[0]
+    assert query == (
+        'UPDATE "public"."events" AS t SET "amount" = v.value::NUMERIC(10,2), '
+        '"updated_at" = now() FROM (VALUES (%s, %s), (%s, %s)) AS v(pk, value) '
+        'WHERE t."id" = v.pk::UUID'
+    )
+    assert params == ["a", 1.5, "b", 1.5]
+
+
+def test_maybe_mutate_batch_deletes_sample():
+    pool, conn, cursor, _ = _mock_pool()
+    engine = AsyncMutationEngine(pool, schema="public", table_name="events")
+
+    with (
+        patch("kraft.core.async_mutator.random.random", side_effect=[0.1, 0.9]),
+        patch("kraft.core.async_mutator.random.sample", side_effect=lambda ids, k: ids[:k]),
+    ):
+        result = asyncio.run(engine.maybe_mutate_batch(["1", "2", "3", "4"]))
+
+    assert result == (0, 1)
+    assert engine.get_counters() == {"total_inserts": 0, "total_updates": 0, "total_deletes": 1}
+    query, params = cursor.execute.call_args[0]
+    assert query == 'DELETE FROM "public"."events" WHERE "id" = ANY(%s)'
+    assert params == (["1"],)
+    conn.commit.assert_awaited_once()
+
+
+def test_multi_column_updates_share_one_statement():
+    pool, _, cursor, _ = _mock_pool()
+    schema = {
+        "id": ColumnDefinition("id", "UUID", lambda: "id"),
+        "amount": ColumnDefinition("amount", "NUMERIC(10,2)", lambda: 1.5),
+        "note": ColumnDefinition("note", "TEXT", lambda: "x"),
+    }
+    engine = AsyncMutationEngine(
+        pool,
+        schema="public",
+        table_name="events",
+        generator=BatchGenerator(schema=schema),
+        update_mode="batch",
+        strategy=MixStrategy(1, 1, 0, columns_per_update=2),
+    )
+
+    assert asyncio.run(engine._update_records(["a"])) == 1
+
+    query, params = cursor.execute.call_args[0]
+    assert query == (
+        'UPDATE "public"."events" AS t SET "amount" = v.value1::NUMERIC(10,2), '
+        '"note" = v.value2::TEXT FROM (VALUES (%s, %s, %s)) AS v(pk, value1, value2) '
+        'WHERE t."id" = v.pk::UUID'
+    )
+    assert params == ["a", 1.5, "x"]
+
+
+def test_transaction_policy_holds_a_connection_until_a_batch_boundary():
+    pool, conn, cursor, _ = _mock_pool()
+    engine = AsyncMutationEngine(
+        pool,
+        schema="public",
+        table_name="events",
+        transaction_policy=TransactionPolicy(every_batches=2, synchronous_commit=False),
+    )
+
+    async def run():
+        await engine.insert_batch([{"id": "1"}, {"id": "2"}])
+        await engine.delete_rows(["1"])
+        assert await engine.end_batch(2) is False
+        conn.commit.assert_not_awaited()
+        assert await engine.end_batch(1) is True
+        await engine.flush()
+
+    asyncio.run(run())
+
+    pool.connection.assert_not_called()
+    pool.getconn.assert_awaited_once()
+    pool.putconn.assert_awaited_once_with(conn)
+    conn.commit.assert_awaited_once()
+    assert cursor.execute.call_args_list[0].args == ("SET LOCAL synchronous_commit TO off",)
+    assert cursor.execute.await_count == 3
+
+
+def test_failed_statement_returns_the_held_connection():
+    pool, conn, cursor, _ = _mock_pool()
+    cursor.execute.side_effect = [None, RuntimeError("boom")]
+    engine = AsyncMutationEngine(
+        pool, schema="public", table_name="events", transaction_policy=TransactionPolicy()
+    )
+
+    asyncio.run(engine.insert_batch([{"id": "1"}]))
+    with pytest.raises(RuntimeError):
+        asyncio.run(engine.delete_rows(["1"]))
+
+    pool.putconn.assert_awaited_once_with(conn)
+    conn.commit.assert_not_awaited()
+    assert engine._conn is None
+
+
+def test_metrics_time_phases_and_count_payload():
+    pool, _, _, _ = _mock_pool()
+    metrics = Metrics(interval=None)
+    generator = BatchGenerator(
+        schema={
+            "id": ColumnDefinition("id", "TEXT", lambda: "id", protected=True),
+            "value": ColumnDefinition("value", "INT", lambda: 7),
+        }
+    )
+    engine = AsyncMutationEngine(
+        pool,
+        schema="public",
+        table_name="events",
+        generator=generator,
+        insert_mode="copy",
+        metrics=metrics,
+    )
+
+    async def run():
+        await engine.insert_batch([{"id": "1", "value": 10}, {"id": "2", "value": None}])
+        await engine.update_rows(["1"])
+        await engine.delete_rows(["2"])
+
+    asyncio.run(run())
+
+    snapshot = metrics.snapshot()
+    assert snapshot["rows"] == {"insert": 2, "update": 1, "delete": 1}
+    assert snapshot["bytes"] == len(b"1\t10\n2\t\\N\n")
+    counts = {phase: summary["count"] for phase, summary in snapshot["phases"].items()}
+    assert counts["insert"] == counts["update"] == counts["delete"] == 1
+    assert counts["commit"] == 3
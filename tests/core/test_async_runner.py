@@ -0,0 +1,83 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from kraft.core.async_runner import AsyncSimulationRunner
+from kraft.core.column import ColumnDefinition
+
+
+def _schema_manager_with_columns():
+    manager = MagicMock()
+    manager.get_active_columns.return_value = {
+        "id": ColumnDefinition("id", "UUID", lambda: "id"),
+        "name": ColumnDefinition("name", "TEXT", lambda: "Alice"),
+    }
+    return manager
+
+
+def _async_mutator():
+    mutator = MagicMock()
+    mutator.insert_batch = AsyncMock(return_value=["1", "2"])
+    mutator.maybe_mutate_batch = AsyncMock(return_value=(0, 0))
+    mutator.end_batch = AsyncMock(return_value=False)
+    mutator.flush = AsyncMock()
+    return mutator
+
+
+def test_async_runner_processes_batches_and_evolves():
+    mutator = _async_mutator()
+    evolution = MagicMock()
+    runner = AsyncSimulationRunner(
+        _schema_manager_with_columns(),
+        mutator,
+        total_records=4,
+        batch_size=2,
+        evolution_controller=evolution,
+    )
+
+    asyncio.run(runner.run())
+
+    assert mutator.insert_batch.await_count == 2
+    assert mutator.maybe_mutate_batch.await_count == 2
+    assert [call.args[0] for call in mutator.end_batch.call_args_list] == [2, 2]
+    assert [call.args[0] for call in evolution.evolve.call_args_list] == [1, 2]
+    mutator.flush.assert_awaited()
+
+
+def test_async_runners_share_the_event_loop():
+    mutators = [_async_mutator() for _ in range(3)]
+    runners = [
+        AsyncSimulationRunner(
+            _schema_manager_with_columns(), mutator, total_records=6, batch_size=2, columnar=True
+        )
+        for mutator in mutators
+    ]
+
+    async def main():
+        await asyncio.gather(*(runner.run() for runner in runners))
+
+    asyncio.run(main())
+
+    assert [mutator.insert_batch.await_count for mutator in mutators] == [3, 3, 3]
+
+
+def test_async_runner_handles_zero_records():
+    mutator = _async_mutator()
+    runner = AsyncSimulationRunner(
+        _schema_manager_with_columns(), mutator, total_records=0, batch_size=500
+    )
+
+    asyncio.run(runner.run())
+
+    mutator.insert_batch.assert_not_awaited()
+
+
+def test_async_runner_writes_a_short_final_batch():
+    mutator = _async_mutator()
+    runner = AsyncSimulationRunner(
+        _schema_manager_with_columns(), mutator, total_records=5, batch_size=2
+    )
+
+    asyncio.run(runner.run())
+
+    assert runner.total_batches == 3
+    assert [len(call.args[0]) for call in mutator.insert_batch.await_args_list] == [2, 2, 1]
@@ -2,7 +2,7 @@ from unittest.mock import patch
 
 import pytest
 
-from kraft.core.batch import BatchGenerator
+from kraft.core.batch import BatchGenerator, ColumnarBatch
 from kraft.core.column import ColumnDefinition
 
 
@@ -56,3 +56,23 @@ def test_get_modifiable_columns_skips_reserved_protected_and_excluded():
     }
     generator = BatchGenerator(schema=schema)
     assert set(generator.get_modifiable_columns(exclude=["quantity"])) == {"price"}
+
+
+def test_generate_columnar_builds_column_lists():
+    schema = {
+        "id": ColumnDefinition("id", "INT", lambda: 0, batch_generator=lambda n: list(range(n))),
+        "name": ColumnDefinition("name", "TEXT", lambda: "Alice"),
+    }
+    batch = BatchGenerator(schema=schema).generate_columnar(3)
+
+    assert isinstance(batch, ColumnarBatch)
+    assert len(batch) == 3
+    assert batch.column_names == ["id", "name"]
+    assert batch.column("id") == [0, 1, 2]
+    assert list(batch.rows()) == [(0, "Alice"), (1, "Alice"), (2, "Alice")]
+    assert batch.to_rows()[1] == {"id": 1, "name": "Alice"}
+
+
+def test_columnar_batch_rejects_ragged_columns():
+    with pytest.raises(ValueError):
+        ColumnarBatch({"a": [1, 2], "b": [1]})
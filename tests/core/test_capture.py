@@ -0,0 +1,251 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from kraft.core.batch import BatchGenerator
+from kraft.core.capture import (
+    CaptureEngine,
+    CaptureFrame,
+    CaptureSchemaManager,
+    CaptureWriter,
+    Replayer,
+    read_capture,
+)
+from kraft.core.column import ColumnDefinition
+from kraft.core.evolution import EvolutionController
+from kraft.core.keys import LiveKeyIndex
+from kraft.core.runner import SimulationRunner
+from kraft.core.strategy import MixStrategy
+from kraft.generators import IntegerGenerator, TextGenerator, UUIDGenerator
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def _mock_conn():
+    conn = MagicMock()
+    cursor = MagicMock()
+    conn.cursor.return_value.__enter__.return_value = cursor
+    return conn, cursor
+
+
+def _columns():
+    return {
+        "id": ColumnDefinition("id", "UUID", UUIDGenerator(), protected=True),
+        "name": ColumnDefinition("name", "TEXT", TextGenerator(4, 8)),
+        "score": ColumnDefinition("score", "INT", IntegerGenerator(0, 100)),
+        "extra": ColumnDefinition("extra", "INT", IntegerGenerator(0, 9), reserved=True),
+    }
+
+
+def _capture(path, *, seed=3):
+    with CaptureWriter(str(path)) as writer:
+        manager = CaptureSchemaManager(
+            writer, schema="public", table_name="events", columns=_columns()
+        )
+        manager.create_table()
+        generator = BatchGenerator(schema=manager.get_active_columns())
+        engine = CaptureEngine(
+            writer,
+            schema="public",
+            table_name="events",
+            generator=generator,
+            update_column=None,
+            key_index=LiveKeyIndex(),
+            strategy=MixStrategy(4, 2, 1),
+        )
+        controller = EvolutionController(
+            manager, evolution_interval=2, evolution_probability=1.0, add_probability=1.0
+        )
+        runner = SimulationRunner(
+            manager,
+            engine,
+            total_records=12,
+            batch_size=4,
+            batch_generator=generator,
+            evolution_controller=controller,
+            seed=seed,
+        )
+        runner.run()
+    return engine, manager
+
+
+def test_capture_records_every_operation_without_a_connection(tmp_path):
+    engine, manager = _capture(tmp_path / "run.kcap")
+
+    frames = list(read_capture(str(tmp_path / "run.kcap")))
+    kinds = [frame.kind for frame in frames]
+
+    assert kinds[0] == "ddl"
+    assert frames[0].meta["statement"].startswith("CREATE TABLE")
+    assert kinds.count("batch") == 3
+    inserts = [frame for frame in frames if frame.kind == "insert"]
+    assert sum(frame.meta["rows"] for frame in inserts) == engine.total_inserts == 12
+    assert inserts[0].body.count(b"\n") == 4
+    updates = [frame for frame in frames if frame.kind == "update"]
+    assert sum(frame.meta["rows"] for frame in updates) == engine.total_updates
+    deletes = [frame for frame in frames if frame.kind == "delete"]
+    assert sum(frame.meta["rows"] for frame in deletes) == engine.total_deletes == 3
+    evolution = [frame for frame in frames[1:] if frame.kind == "ddl"]
+    assert evolution and evolution[0].meta["version"] == 1
+    assert "ADD COLUMN" in evolution[0].meta["statement"]
+    assert manager.schema_version == 2
+    assert all(frame.offset >= 0 for frame in frames)
+
+
+def test_capture_is_reproducible_with_a_seed(tmp_path):
+    _capture(tmp_path / "a.kcap")
+    _capture(tmp_path / "b.kcap")
+
+    first = [(f.kind, f.meta, f.body) for f in read_capture(str(tmp_path / "a.kcap"))]
+    second = [(f.kind, f.meta, f.body) for f in read_capture(str(tmp_path / "b.kcap"))]
+    assert first == second
+
+
+def test_ddl_frames_carry_the_version_their_event_started_from(tmp_path):
+    path = tmp_path / "run.kcap"
+    columns = _columns()
+    columns["note"] = ColumnDefinition("note", "TEXT", TextGenerator(1, 2), reserved=True)
+    with CaptureWriter(str(path)) as writer:
+        manager = CaptureSchemaManager(
+            writer, schema="public", table_name="events", columns=columns
+        )
+        manager.alter_columns(drop=1)
+        manager.alter_columns(add=1, drop=1)
+        manager.alter_columns(add=1)
+
+    frames = list(read_capture(str(path)))
+
+    assert [frame.meta["version"] for frame in frames] == [1, 2, 3]
+    assert "DROP COLUMN name" in frames[0].meta["statement"]
+    assert "ADD COLUMN extra" in frames[1].meta["statement"]
+    assert "DROP COLUMN score" in frames[1].meta["statement"]
+    assert manager.schema_version == 4
+
+
+def test_rows_copy_cannot_encode_are_captured_and_replayed_as_values(tmp_path):
+    path = tmp_path / "run.kcap"
+    columns = {
+        "id": ColumnDefinition("id", "INT", lambda: 1, protected=True),
+        "tags": ColumnDefinition("tags", "INT[]", lambda: [1, 2]),
+        "label": ColumnDefinition("label", "TEXT", lambda: "héllo ☃"),
+    }
+    with CaptureWriter(str(path)) as writer:
+        engine = CaptureEngine(
+            writer,
+            schema="public",
+            table_name="events",
+            generator=BatchGenerator(schema=columns),
+        )
+        engine.insert_batch([{"id": 1, "tags": [1, 2], "label": "héllo ☃"}])
+
+    (frame,) = read_capture(str(path))
+    conn, cursor = _mock_conn()
+    Replayer(conn, str(path)).apply(frame)
+
+    assert frame.meta["format"] == "values"
+    assert frame.body.decode() == "(1, ARRAY[1,2], 'héllo ☃')"
+    cursor.copy_expert.assert_not_called()
+    statement = repr(cursor.execute.call_args.args[0])
+    assert "INSERT INTO" in statement and "ARRAY[1,2]" in statement
+
+
+def test_read_capture_rejects_foreign_and_truncated_files(tmp_path):
+    foreign = tmp_path / "foreign.kcap"
+    foreign.write_bytes(b"COPY")
+    with pytest.raises(ValueError, match="not a Kraft capture"):
+        list(read_capture(str(foreign)))
+
+    path = tmp_path / "run.kcap"
+    with CaptureWriter(str(path)) as writer:
+        writer.write("batch", {"rows": 1})
+    path.write_bytes(path.read_bytes() + b"\x00\x01")
+    with pytest.raises(ValueError, match="truncated"):
+        list(read_capture(str(path)))
+
+
+def test_writer_validates_compression_level(tmp_path):
+    with pytest.raises(ValueError):
+        CaptureWriter(str(tmp_path / "run.kcap"), compression_level=10)
+
+
+def test_replayer_streams_frames_through_bulk_paths(tmp_path):
+    path = tmp_path / "run.kcap"
+    _capture(path)
+    conn, cursor = _mock_conn()
+    copied = []
+    cursor.copy_expert.side_effect = lambda query, buffer: copied.append(buffer.read())
+
+    counters = Replayer(conn, str(path)).run()
+
+    assert counters["inserts"] == 12
+    assert counters["deletes"] == 3
+    assert counters["batches"] == 3
+    assert counters["ddl"] == 2
+    statements = [str(call.args[0]) for call in cursor.execute.call_args_list]
+    assert statements[0].startswith("CREATE TABLE")
+    assert statements.count("DROP TABLE kraft_replay") == len(
+        [f for f in read_capture(str(path)) if f.kind in ("update", "delete")]
+    )
+    assert b"".join(copied).count(b"\n") >= 12
+    assert conn.commit.call_count >= counters["batches"] + counters["ddl"]
+
+
+def test_replayer_waits_for_recorded_offsets_at_original_pacing(tmp_path):
+    path = tmp_path / "run.kcap"
+    writer_clock = FakeClock()
+    with CaptureWriter(str(path), clock=writer_clock) as writer:
+        for offset in (0.0, 2.0, 5.0):
+            writer_clock.now = offset
+            writer.write("batch", {"rows": 1})
+    conn, _ = _mock_conn()
+    clock = FakeClock()
+    waits = []
+
+    def sleep(seconds):
+        waits.append(seconds)
+        clock.sleep(seconds)
+
+    Replayer(conn, str(path), pacing="original", speed=2.0, clock=clock, sleep=sleep).run()
+
+    assert waits == [1.0, 1.5]
+
+
+def test_replayer_validates_options(tmp_path):
+    with pytest.raises(ValueError):
+        Replayer(MagicMock(), str(tmp_path / "run.kcap"), pacing="fast")
+    with pytest.raises(ValueError):
+        Replayer(MagicMock(), str(tmp_path / "run.kcap"), speed=0)
+
+
+def test_replayed_update_sets_columns_and_bumps_update_column():
+    frame = CaptureFrame(
+        "update",
+        0.0,
+        {
+            "schema": "public",
+            "table": "events",
+            "columns": ["name"],
+            "rows": 1,
+            "primary_key": "id",
+            "update_column": "updated_at",
+        },
+        b"1\tbob\n",
+    )
+    conn, cursor = _mock_conn()
+
+    Replayer(conn, "unused").apply(frame)
+
+    assert cursor.execute.call_count == 3
+    statement = repr(cursor.execute.call_args_list[1].args[0])
+    assert "Identifier('updated_at')" in statement
+    assert "now()" in statement
+    assert cursor.copy_expert.call_args.args[1].read() == b"1\tbob\n"
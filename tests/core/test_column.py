@@ -1,3 +1,5 @@
+import pytest
+
 from kraft.core.column import ColumnDefinition
 
 
@@ -28,3 +30,33 @@ def test_column_definition_renders_valid_ddl():
     )
 
     assert col.ddl() == "created_at TIMESTAMP DEFAULT now()"
+
+
+def test_generate_many_falls_back_to_scalar_generator():
+    col = ColumnDefinition(name="qty", sql_type="INT", generator=lambda: 3)
+    assert col.generate_many(3) == [3, 3, 3]
+
+
+def test_generate_many_prefers_batch_generator():
+    class FakeArray:
+        def __init__(self, values):
+            self.values = values
+
+        def tolist(self):
+            return list(self.values)
+
+    col = ColumnDefinition(
+        name="qty",
+        sql_type="INT",
+        generator=lambda: 0,
+        batch_generator=lambda n: FakeArray(range(n)),
+    )
+    assert col.generate_many(4) == [0, 1, 2, 3]
+
+
+def test_generate_many_rejects_wrong_length():
+    col = ColumnDefinition(
+        name="qty", sql_type="INT", generator=lambda: 0, batch_generator=lambda n: [1]
+    )
+    with pytest.raises(ValueError):
+        col.generate_many(2)
@@ -0,0 +1,63 @@
+import struct
+import uuid
+from datetime import datetime
+
+import pytest
+
+from kraft.core.copy_codec import (
+    CopyEncodingError,
+    base_type,
+    binary_encoder,
+    encode_binary,
+    encode_text,
+)
+
+
+def test_base_type_strips_parameters():
+    assert base_type("varchar(32)") == "VARCHAR"
+    assert base_type(" numeric (10, 2) ") == "NUMERIC"
+
+
+def test_encode_text_escapes_specials_and_nulls():
+    buffer = encode_text([("a\tb", None, True, 3), ("line\nbreak\\", 1.5, False, 0)])
+    assert buffer.getvalue() == b"a\\tb\t\\N\tt\t3\nline\\nbreak\\\\\t1.5\tf\t0\n"
+
+
+def test_encode_text_renders_json_only_for_json_columns():
+    buffer = encode_text([({"k": "v"},)], ["JSONB"])
+    assert buffer.getvalue() == b'{"k": "v"}\n'
+    with pytest.raises(CopyEncodingError):
+        encode_text([([1, 2],)], ["INT[]"])
+
+
+def test_encode_binary_layout():
+    row_id = uuid.uuid4()
+    buffer = encode_binary([(str(row_id), 7, None)], ["UUID", "INT", "TEXT"]).getvalue()
+
+    assert buffer.startswith(b"PGCOPY\n\xff\r\n\x00")
+    body = buffer[19:]
+    assert struct.unpack("!h", body[:2]) == (3,)
+    assert body[2:6] == struct.pack("!i", 16)
+    assert body[6:22] == row_id.bytes
+    assert body[22:30] == struct.pack("!ii", 4, 7)
+    assert body[30:34] == struct.pack("!i", -1)
+    assert body[34:] == struct.pack("!h", -1)
+
+
+def test_encode_binary_timestamp_offsets_from_postgres_epoch():
+    buffer = encode_binary([(datetime(2000, 1, 1, 0, 0, 1),)], ["TIMESTAMP"]).getvalue()
+    assert buffer[19 + 2 + 4 : 19 + 2 + 4 + 8] == struct.pack("!q", 1_000_000)
+
+
+@pytest.mark.parametrize(
+    ("sql_type", "value"),
+    [("TIMESTAMP", "now()"), ("INT", "7"), ("INT", True), ("NUMERIC", 1), (None, 1)],
+)
+def test_encode_binary_rejects_values_it_cannot_encode(sql_type, value):
+    with pytest.raises(CopyEncodingError):
+        encode_binary([(value,)], [sql_type])
+
+
+def test_binary_encoder_rejects_out_of_range_ints():
+    with pytest.raises(CopyEncodingError):
+        binary_encoder("SMALLINT")(70_000)
@@ -0,0 +1,28 @@
+import pytest
+
+from kraft.core.ddl import LockPolicy
+
+
+def test_lock_policy_renders_timeout_in_milliseconds():
+    assert LockPolicy(lock_timeout=0.25).timeout_sql() == "SET LOCAL lock_timeout = '250ms'"
+
+
+def test_lock_policy_backs_off_exponentially_up_to_the_cap():
+    policy = LockPolicy(backoff=0.5, max_backoff=3.0, jitter=False)
+
+    assert [policy.delay(attempt) for attempt in range(1, 5)] == [0.5, 1.0, 2.0, 3.0]
+
+
+def test_lock_policy_jitter_shortens_pauses():
+    policy = LockPolicy(backoff=1.0)
+
+    assert all(0.5 <= policy.delay(1) <= 1.0 for _ in range(50))
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{"lock_timeout": 0}, {"max_attempts": 0}, {"backoff": -1.0}],
+)
+def test_lock_policy_validates_options(options):
+    with pytest.raises(ValueError):
+        LockPolicy(**options)
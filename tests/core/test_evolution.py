@@ -1,5 +1,8 @@
 from unittest.mock import MagicMock, patch
 
+import pytest
+from psycopg2 import errors
+
 from kraft.core.column import ColumnDefinition
 from kraft.core.evolution import EvolutionController
 from kraft.core.schema import SchemaManager
@@ -62,3 +65,61 @@ def test_evolution_controller_respects_interval():
 
     assert controller.evolve(batch_number=1) is None
     assert controller.evolve(batch_number=2) is None
+
+
+def test_evolution_is_skipped_when_the_table_lock_is_unavailable():
+    manager = _make_schema_manager()
+    manager.add_column = MagicMock(side_effect=errors.LockNotAvailable())
+    controller = EvolutionController(
+        manager, evolution_interval=1, evolution_probability=1.0, add_probability=1.0
+    )
+
+    assert controller.evolve(batch_number=1).startswith("Evolution skipped")
+    assert controller.num_additions == 0
+    assert controller.evolution_log == []
+
+
+@patch("kraft.core.evolution.random.random", return_value=0.0)
+def test_wide_evolution_batches_changes_into_one_statement(mock_random):
+    manager = _make_schema_manager()
+    cursor = manager.conn.cursor.return_value.__enter__.return_value
+    controller = EvolutionController(
+        manager, evolution_interval=1, evolution_probability=1.0, add_probability=1.0, width=3
+    )
+
+    message = controller.evolve(batch_number=1)
+
+    assert message == "[v2] Added columns: age, email; Dropped column: name"
+    cursor.execute.assert_called_once()
+    assert controller.num_additions == 2
+    assert controller.evolution_log[-1]["action"] == "alter"
+
+    message = controller.evolve(batch_number=2)
+    assert message == "[v3] Dropped columns: age, email"
+    assert controller.summary()["dropped_columns"] == ["age", "email", "name"]
+
+
+@patch("kraft.core.evolution.random.random", return_value=0.0)
+@patch("kraft.core.evolution.random.choice", side_effect=lambda seq: seq[0])
+def test_evolution_alters_existing_columns(mock_choice, mock_random):
+    manager = _make_schema_manager()
+    controller = EvolutionController(
+        manager,
+        evolution_interval=1,
+        evolution_probability=1.0,
+        alter_probability=1.0,
+        alterations=("rename", "widen"),
+        max_alterations=1,
+    )
+
+    assert controller.evolve(batch_number=1) == "[v2] Renamed column: name -> name_v2"
+    assert "name_v2" in manager.get_active_columns()
+    assert controller.summary()["alterations"] == 1
+
+    # The alteration budget is spent, so the next event falls back to add/drop.
+    assert controller.evolve(batch_number=2).startswith("[v3] Added column")
+
+
+def test_evolution_rejects_unknown_alterations():
+    with pytest.raises(ValueError):
+        EvolutionController(_make_schema_manager(), alterations=("truncate",))
@@ -0,0 +1,102 @@
+import random
+import uuid
+from collections import Counter
+
+import pytest
+
+from kraft.core.keys import IntKeys, LiveKeyIndex, UUIDKeys, key_array
+
+
+def test_sample_positions_are_distinct_and_in_range():
+    index = LiveKeyIndex(range(100), rng=random.Random(1))
+
+    positions = index.sample_positions(30)
+
+    assert len(set(positions)) == 30
+    assert all(0 <= position < 100 for position in positions)
+    assert index.sample_positions(500) and len(index.sample_positions(500)) == 100
+    assert LiveKeyIndex().sample(3) == []
+
+
+def test_remove_positions_swaps_last_keys_into_place():
+    index = LiveKeyIndex(["a", "b", "c", "d", "e"])
+
+    index.remove_positions([1, 4, 3])
+
+    assert len(index) == 2
+    assert sorted(index.keys_at(range(len(index)))) == ["a", "c"]
+
+
+def test_removed_keys_are_never_sampled_again():
+    index = LiveKeyIndex(range(1_000), rng=random.Random(7))
+    removed = set()
+    for _ in range(20):
+        positions = index.sample_positions(25)
+        removed.update(index.keys_at(positions))
+        index.remove_positions(positions)
+
+    live = set(index.keys_at(range(len(index))))
+    assert len(index) == 500
+    assert live.isdisjoint(removed)
+    assert live | removed == set(range(1_000))
+
+
+@pytest.mark.parametrize(("skew", "hot"), [("zipf", range(0, 100)), ("recent", range(900, 1000))])
+def test_skewed_sampling_prefers_hot_keys(skew, hot):
+    index = LiveKeyIndex(range(1_000), skew=skew, exponent=1.2, rng=random.Random(3))
+
+    counts = Counter(key for _ in range(500) for key in index.sample(4))
+
+    hot_share = sum(counts[key] for key in hot) / sum(counts.values())
+    assert hot_share > 0.5
+
+
+def test_discard_removes_keys_by_value():
+    index = LiveKeyIndex(["a", "b", "c"])
+
+    assert index.discard(["b", "z"]) == 1
+    assert sorted(index.keys_at(range(len(index)))) == ["a", "c"]
+
+
+def test_rejects_unknown_skew():
+    with pytest.raises(ValueError):
+        LiveKeyIndex(skew="pareto")
+    with pytest.raises(ValueError):
+        LiveKeyIndex(exponent=0)
+
+
+def test_uuid_keys_pack_to_sixteen_bytes():
+    values = [str(uuid.uuid4()) for _ in range(3)]
+    keys = UUIDKeys([values[0], uuid.UUID(values[1]), uuid.UUID(values[2]).hex])
+
+    assert keys.nbytes == 48
+    assert list(keys) == values
+    assert keys[-1] == values[2]
+    keys.swap_remove(0)
+    assert list(keys) == [values[2], values[1]]
+    with pytest.raises(ValueError):
+        UUIDKeys(["not-a-uuid"])
+
+
+def test_int_keys_use_a_64_bit_array():
+    keys = IntKeys(["1", 2, 3])
+
+    assert keys.nbytes == 24
+    keys.swap_remove(1)
+    assert list(keys) == [1, 3]
+
+
+@pytest.mark.parametrize("key_type", ["object", "uuid", "int"])
+def test_index_round_trips_keys_for_each_key_type(key_type):
+    values = [str(uuid.uuid4()) for _ in range(50)] if key_type == "uuid" else list(range(50))
+    index = LiveKeyIndex(key_array(key_type, values), key_type=key_type, rng=random.Random(5))
+
+    positions = index.sample_positions(10)
+    removed = index.keys_at(positions)
+    index.remove_positions(positions)
+
+    assert len(index) == 40
+    assert sorted([*index.keys_at(range(40)), *removed]) == sorted(values)
+    assert index.discard(removed[:1]) == 0
+    with pytest.raises(ValueError):
+        key_array("decimal")
@@ -0,0 +1,117 @@
+import json
+
+import pytest
+
+from kraft.core.metrics import (
+    Histogram,
+    JSONLinesSink,
+    MemorySink,
+    Metrics,
+    MetricsSink,
+    PrometheusTextSink,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_histogram_quantiles_stay_within_one_bucket():
+    histogram = Histogram()
+    for millis in range(1, 101):
+        histogram.observe(millis / 1000)
+
+    summary = histogram.summary()
+
+    assert summary["count"] == 100
+    assert summary["min"] == pytest.approx(0.001)
+    assert summary["max"] == pytest.approx(0.1)
+    assert summary["mean"] == pytest.approx(0.0505)
+    assert 0.050 <= summary["p50"] <= 0.050 * 1.1
+    assert 0.099 <= summary["p99"] <= 0.1
+
+
+def test_histogram_handles_empty_and_tiny_observations():
+    histogram = Histogram()
+    assert histogram.quantile(0.5) == 0.0
+
+    histogram.observe(0.0)
+    assert histogram.quantile(0.99) == 0.0
+    with pytest.raises(ValueError):
+        histogram.quantile(1.5)
+
+
+def test_metrics_snapshot_reports_rates_and_phases():
+    clock = FakeClock()
+    metrics = Metrics(clock=clock)
+    metrics.observe("insert", 0.02)
+    metrics.observe("custom", 0.5)
+    metrics.add_rows("insert", 500, nbytes=4096)
+    metrics.add_rows("update", 50)
+    clock.now = 2.0
+
+    snapshot = metrics.snapshot()
+
+    assert snapshot["rows"] == {"insert": 500, "update": 50, "delete": 0}
+    assert snapshot["rows_per_second"]["insert"] == 250.0
+    assert snapshot["bytes_per_second"] == 2048.0
+    assert snapshot["phases"]["insert"]["count"] == 1
+    assert snapshot["phases"]["generate"]["count"] == 0
+    assert snapshot["phases"]["custom"]["sum"] == 0.5
+
+
+def test_maybe_emit_respects_the_interval():
+    clock = FakeClock()
+    sink = MemorySink(max_snapshots=2)
+    metrics = Metrics([sink], interval=5.0, clock=clock)
+
+    assert metrics.maybe_emit() is False
+    for now in (5.0, 6.0, 10.0, 15.0):
+        clock.now = now
+        metrics.maybe_emit()
+
+    assert [snapshot["elapsed_seconds"] for snapshot in sink.snapshots] == [10.0, 15.0]
+    assert sink.latest is sink.snapshots[-1]
+
+
+def test_metrics_requires_positive_interval():
+    with pytest.raises(ValueError):
+        Metrics(interval=0)
+
+
+def test_json_lines_sink_appends_snapshots(tmp_path):
+    path = tmp_path / "metrics.jsonl"
+    metrics = Metrics([JSONLinesSink(path)], interval=None)
+    metrics.add_rows("insert", 10)
+
+    metrics.emit()
+    metrics.emit()
+
+    lines = path.read_text().splitlines()
+    assert len(lines) == 2
+    assert json.loads(lines[0])["rows"]["insert"] == 10
+
+
+def test_prometheus_sink_replaces_the_text_file(tmp_path):
+    path = tmp_path / "kraft.prom"
+    metrics = Metrics([PrometheusTextSink(path)], interval=None)
+    metrics.observe("insert", 0.01)
+    metrics.add_rows("insert", 100, nbytes=800)
+
+    metrics.emit()
+
+    text = path.read_text()
+    assert "# TYPE kraft_phase_seconds summary" in text
+    assert 'kraft_phase_seconds_count{phase="insert"} 1' in text
+    assert 'kraft_rows_total{operation="insert"} 100' in text
+    assert "kraft_bytes_total 800" in text
+    assert not (tmp_path / "kraft.prom.tmp").exists()
+
+
+def test_base_sink_requires_emit():
+    with pytest.raises(TypeError):
+        MetricsSink()
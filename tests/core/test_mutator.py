@@ -1,8 +1,17 @@
+import uuid
 from unittest.mock import MagicMock, patch
 
-from kraft.core.batch import BatchGenerator
+import psycopg2
+import pytest
+
+from kraft.core.batch import BatchGenerator, ColumnarBatch
 from kraft.core.column import ColumnDefinition
+from kraft.core.keys import LiveKeyIndex, UUIDKeys
+from kraft.core.metrics import Metrics
 from kraft.core.mutator import MutationEngine
+from kraft.core.pool import ConnectionPool
+from kraft.core.strategy import MixStrategy
+from kraft.core.transaction import TransactionPolicy
 
 
 def _mock_conn():
@@ -34,8 +43,75 @@ def test_insert_batch_persists_rows(mock_execute_values):
     cursor.execute.assert_not_called()
 
 
-@patch("kraft.core.mutator.random.random", return_value=0.4)
-@patch("kraft.core.mutator.random.choice", side_effect=["update", "value"])
+@patch("kraft.core.mutator.execute_values")
+def test_insert_batch_copy_mode_streams_buffer(mock_execute_values):
+    conn, cursor = _mock_conn()
+    engine = MutationEngine(conn, schema="public", table_name="events", insert_mode="copy")
+
+    inserted = engine.insert_batch([{"id": "1", "value": 10}, {"id": "2", "value": None}])
+
+    assert inserted == ["1", "2"]
+    assert engine.total_inserts == 2
+    mock_execute_values.assert_not_called()
+    buffer = cursor.copy_expert.call_args[0][1]
+    assert buffer.getvalue() == b"1\t10\n2\t\\N\n"
+
+
+@patch("kraft.core.mutator.execute_values")
+def test_insert_batch_accepts_columnar_batches(mock_execute_values):
+    conn, cursor = _mock_conn()
+    engine = MutationEngine(conn, schema="public", table_name="events")
+
+    inserted = engine.insert_batch(ColumnarBatch({"id": ["1", "2"], "value": [10, 20]}))
+
+    assert inserted == ["1", "2"]
+    assert engine.total_inserts == 2
+    assert mock_execute_values.call_args[0][2] == [("1", 10), ("2", 20)]
+
+
+def test_insert_batch_copies_columnar_batches_directly():
+    conn, cursor = _mock_conn()
+    engine = MutationEngine(conn, schema="public", table_name="events", insert_mode="copy")
+
+    engine.insert_batch(ColumnarBatch({"id": ["1", "2"], "value": [10, 20]}))
+
+    assert cursor.copy_expert.call_args[0][1].getvalue() == b"1\t10\n2\t20\n"
+
+
+@patch("kraft.core.mutator.execute_values")
+def test_insert_batch_binary_copy_falls_back_to_values(mock_execute_values):
+    conn, cursor = _mock_conn()
+    schema = {
+        "id": ColumnDefinition("id", "UUID", lambda: "a"),
+        "updated_at": ColumnDefinition("updated_at", "TIMESTAMP", lambda: "now()"),
+    }
+    engine = MutationEngine(
+        conn,
+        schema="public",
+        table_name="events",
+        generator=BatchGenerator(schema=schema),
+        insert_mode="copy",
+        copy_format="binary",
+    )
+
+    engine.insert_batch([{"id": "00000000-0000-0000-0000-000000000001", "updated_at": "now()"}])
+
+    cursor.copy_expert.assert_not_called()
+    mock_execute_values.assert_called_once()
+
+
+def test_mutation_engine_rejects_unknown_insert_modes():
+    conn, _ = _mock_conn()
+    with pytest.raises(ValueError):
+        MutationEngine(conn, schema="public", table_name="events", insert_mode="bulk")
+    with pytest.raises(ValueError):
+        MutationEngine(conn, schema="public", table_name="events", copy_format="csv")
+    with pytest.raises(ValueError):
+        MutationEngine(conn, schema="public", table_name="events", update_mode="bulk")
+
+
+@patch("kraft.core.mutator.random.random", side_effect=[0.4, 0.4])
+@patch("kraft.core.mutator.random.choice", side_effect=["value"])
 @patch("kraft.core.mutator.random.sample", return_value=["a"])
 def test_maybe_mutate_batch_updates_when_triggered(mock_sample, mock_choice, mock_random):
     conn, _ = _mock_conn()
@@ -61,10 +137,9 @@ def test_maybe_mutate_batch_updates_when_triggered(mock_sample, mock_choice, moc
     assert engine.total_updates == 1
 
 
-@patch("kraft.core.mutator.random.choice", side_effect=["delete"])
-@patch("kraft.core.mutator.random.random", return_value=0.4)
+@patch("kraft.core.mutator.random.random", side_effect=[0.4, 0.6])
 @patch("kraft.core.mutator.random.sample", return_value=["b"])
-def test_maybe_mutate_batch_can_delete(mock_sample, mock_random, mock_choice):
+def test_maybe_mutate_batch_can_delete(mock_sample, mock_random):
     conn, cursor = _mock_conn()
     engine = MutationEngine(conn, schema="public", table_name="events")
 
@@ -102,6 +177,57 @@ def test_update_records_respects_modifiable_columns():
     assert cursor.execute.call_count == 2
 
 
+@patch("kraft.core.mutator.execute_values")
+@patch("kraft.core.mutator.random.choice", side_effect=["price", "quantity", "price"])
+def test_update_records_batch_mode_groups_ids_by_column(mock_choice, mock_execute_values):
+    conn, cursor = _mock_conn()
+    schema = {
+        "id": ColumnDefinition("id", "UUID", lambda: "a", protected=True),
+        "price": ColumnDefinition("price", "FLOAT", lambda: 1.0),
+        "quantity": ColumnDefinition("quantity", "INT", lambda: 7),
+    }
+    engine = MutationEngine(
+        conn,
+        schema="public",
+        table_name="events",
+        primary_key="id",
+        update_column="updated_at",
+        generator=BatchGenerator(schema=schema),
+        update_mode="batch",
+    )
+
+    assert engine._update_records(["1", "2", "3"]) == 3
+
+    cursor.execute.assert_not_called()
+    assert mock_execute_values.call_count == 2
+    price_call, quantity_call = mock_execute_values.call_args_list
+    assert price_call.args[2] == [("1", 1.0), ("3", 1.0)]
+    assert quantity_call.args[2] == [("2", 7)]
+    conn.commit.assert_called_once()
+
+
+def test_batched_update_casts_serial_keys_to_their_storage_type():
+    conn, _ = _mock_conn()
+    schema = {
+        "id": ColumnDefinition("id", "BIGSERIAL", lambda: 1, protected=True),
+        "quantity": ColumnDefinition("quantity", "serial", lambda: 1),
+    }
+    engine = MutationEngine(
+        conn,
+        schema="public",
+        table_name="events",
+        primary_key="id",
+        generator=BatchGenerator(schema=schema),
+        update_mode="batch",
+    )
+
+    query = repr(engine._batched_update_query(("quantity",)))
+
+    assert "SQL('::BIGINT')" in query
+    assert "SQL('::INTEGER')" in query
+    assert "SERIAL" not in query.upper()
+
+
 def test_delete_records_handles_empty_batches():
     conn, cursor = _mock_conn()
     engine = MutationEngine(conn, schema="public", table_name="events")
@@ -140,3 +266,259 @@ def test_get_counters_reports_totals():
         "total_updates": 3,
         "total_deletes": 1,
     }
+
+
+@patch("kraft.core.mutator.execute_values")
+def test_key_index_targets_rows_across_batches(mock_execute_values):
+    conn, cursor = _mock_conn()
+    index = LiveKeyIndex()
+    engine = MutationEngine(conn, schema="public", table_name="events", key_index=index)
+
+    engine.insert_batch([{"id": "1"}, {"id": "2"}])
+    engine.insert_batch([{"id": "3"}, {"id": "4"}])
+    assert len(index) == 4
+
+    assert engine.mutate("delete", 3) == 3
+    assert len(index) == 1
+    deleted = cursor.execute.call_args[0][1][0]
+    survivor = index.keys_at([0])[0]
+    assert sorted([*deleted, survivor]) == ["1", "2", "3", "4"]
+    assert engine.total_deletes == 3
+
+    assert engine.mutate("delete", 5) == 1
+    assert engine.mutate("delete", 5) == 0
+    with pytest.raises(ValueError):
+        engine.mutate("merge", 1)
+
+
+@patch("kraft.core.mutator.execute_values")
+def test_uuid_key_type_packs_inserted_ids(mock_execute_values):
+    conn, cursor = _mock_conn()
+    ids = [str(uuid.uuid4()) for _ in range(4)]
+    index = LiveKeyIndex(key_type="uuid")
+    engine = MutationEngine(
+        conn, schema="public", table_name="events", key_type="uuid", key_index=index
+    )
+
+    inserted = engine.insert_batch(ColumnarBatch({"id": ids, "value": [1, 2, 3, 4]}))
+
+    assert isinstance(inserted, UUIDKeys)
+    assert list(inserted) == ids
+    assert engine.mutate("delete", 4) == 4
+    assert sorted(cursor.execute.call_args[0][1][0]) == sorted(ids)
+    assert len(index) == 0
+    with pytest.raises(ValueError):
+        MutationEngine(conn, schema="public", table_name="events", key_type="bytes")
+
+
+@patch("kraft.core.mutator.execute_values")
+def test_mix_strategy_chunks_statements_and_updates_several_columns(mock_execute_values):
+    conn, cursor = _mock_conn()
+    schema = {
+        "id": ColumnDefinition("id", "TEXT", lambda: "a", protected=True),
+        "price": ColumnDefinition("price", "FLOAT", lambda: 1.0),
+        "quantity": ColumnDefinition("quantity", "INT", lambda: 7),
+    }
+    engine = MutationEngine(
+        conn,
+        schema="public",
+        table_name="events",
+        generator=BatchGenerator(schema=schema),
+        update_mode="batch",
+        key_index=LiveKeyIndex(),
+        strategy=MixStrategy(
+            1, 2, 1, update_batch_size=3, delete_batch_size=2, columns_per_update=2
+        ),
+    )
+
+    ids = engine.insert_batch([{"id": str(i)} for i in range(4)])
+    mock_execute_values.reset_mock()
+
+    assert engine.maybe_mutate_batch(ids) == (4, 4)
+
+    assert [len(call.args[2]) for call in mock_execute_values.call_args_list] == [3, 1]
+    update_call = mock_execute_values.call_args_list[0]
+    assert all(row[1:] == (1.0, 7) for row in update_call.args[2])
+    deletes = [call for call in cursor.execute.call_args_list if "DELETE" in call.args[0]]
+    assert [len(call.args[1][0]) for call in deletes] == [2, 2]
+    assert len(engine.key_index) == 0
+
+
+@patch("kraft.core.mutator.execute_values")
+def test_transaction_policy_defers_commits_to_batch_boundaries(mock_execute_values):
+    conn, cursor = _mock_conn()
+    engine = MutationEngine(
+        conn,
+        schema="public",
+        table_name="events",
+        transaction_policy=TransactionPolicy(every_batches=2, synchronous_commit=False),
+    )
+
+    engine.insert_batch([{"id": "1"}, {"id": "2"}])
+    engine.delete_rows(["1"])
+    assert engine.end_batch(2) is False
+    engine.insert_batch([{"id": "3"}])
+    conn.commit.assert_not_called()
+    assert cursor.execute.call_args_list[0].args == ("SET LOCAL synchronous_commit TO off",)
+
+    assert engine.end_batch(1) is True
+    conn.commit.assert_called_once()
+    engine.flush()
+    conn.commit.assert_called_once()
+
+    engine.insert_batch([{"id": "4"}])
+    engine.flush()
+    assert conn.commit.call_count == 2
+    assert cursor.execute.call_args_list[-1].args == ("SET LOCAL synchronous_commit TO off",)
+
+
+@patch("kraft.core.mutator.execute_values")
+def test_statement_cache_reuses_queries_until_schema_version_changes(mock_execute_values):
+    conn, _ = _mock_conn()
+    manager = MagicMock(schema_version=1)
+    engine = MutationEngine(conn, schema="public", table_name="events", schema_manager=manager)
+
+    engine.insert_batch([{"id": "1"}])
+    engine.insert_batch([{"id": "2"}])
+    first, second = (call.args[1] for call in mock_execute_values.call_args_list)
+    assert first is second
+
+    manager.schema_version = 2
+    engine.insert_batch([{"id": "3"}])
+    assert mock_execute_values.call_args.args[1] is not first
+    assert mock_execute_values.call_args.args[1] == first
+
+
+def test_prepared_statements_are_prepared_once_per_connection():
+    conn, cursor = _mock_conn()
+    schema = {
+        "id": ColumnDefinition("id", "UUID", lambda: "a", protected=True),
+        "price": ColumnDefinition("price", "FLOAT", lambda: 1.0),
+    }
+    manager = MagicMock(schema_version=1)
+    engine = MutationEngine(
+        conn,
+        schema="public",
+        table_name="events",
+        generator=BatchGenerator(schema=schema),
+        schema_manager=manager,
+        prepare_statements=True,
+    )
+
+    assert engine._update_records(["1", "2"]) == 2
+    prepare, first, second = (call.args for call in cursor.execute.call_args_list)
+    assert len(prepare) == 1
+    assert first[0] is second[0]
+    assert first[1] == (1.0, "1")
+
+    engine._delete_records(["1"])
+    assert cursor.execute.call_count == 5
+
+    manager.schema_version = 2
+    cursor.execute.reset_mock()
+    engine._delete_records(["2"])
+    # Two DEALLOCATEs, a fresh PREPARE and the EXECUTE.
+    assert cursor.execute.call_count == 4
+
+    first_conn = engine.conn
+    engine.conn, new_cursor = _mock_conn()
+    engine._delete_records(["3"])
+    assert new_cursor.execute.call_count == 2
+
+    # Back on the first connection the statement prepared there is reused.
+    cursor.execute.reset_mock()
+    engine.conn = first_conn
+    engine._delete_records(["4"])
+    assert cursor.execute.call_count == 1
+    assert "PREPARE" not in repr(cursor.execute.call_args.args[0])
+
+
+def test_schema_change_deallocates_statements_on_every_connection():
+    (first, first_cursor), (second, second_cursor) = _mock_conn(), _mock_conn()
+    manager = MagicMock(schema_version=1)
+    engine = MutationEngine(
+        first,
+        schema="public",
+        table_name="events",
+        schema_manager=manager,
+        prepare_statements=True,
+    )
+    engine._delete_records(["1"])
+    engine.conn = second
+    engine._delete_records(["2"])
+    engine.conn = first
+    engine._delete_records(["3"])
+    assert first_cursor.execute.call_count == 3
+    assert second_cursor.execute.call_count == 2
+
+    manager.schema_version = 2
+    engine._delete_records(["4"])
+    engine.conn = second
+    engine._delete_records(["5"])
+
+    def deallocated(cursor):
+        return [
+            call.args[0]
+            for call in cursor.execute.call_args_list
+            if "DEALLOCATE" in repr(call.args[0])
+        ]
+
+    assert len(deallocated(first_cursor)) == 1
+    assert len(deallocated(second_cursor)) == 1
+    assert deallocated(first_cursor) != deallocated(second_cursor)
+
+
+@patch("kraft.core.mutator.execute_values")
+def test_pooled_engine_replaces_broken_connections(mock_execute_values):
+    (healthy, _), (broken, broken_cursor) = _mock_conn(), _mock_conn()
+    healthy.closed = broken.closed = 0
+    connections = [broken, healthy]
+    pool = ConnectionPool(connect=lambda: connections.pop(0), min_size=0)
+    engine = MutationEngine(pool, schema="public", table_name="events")
+
+    broken_cursor.execute.side_effect = psycopg2.OperationalError("terminating connection")
+    with pytest.raises(psycopg2.OperationalError):
+        engine._delete_records(["1"])
+    broken.close.assert_called_once()
+
+    engine.insert_batch([{"id": "1"}])
+    assert engine.conn is healthy
+    healthy.commit.assert_called_once()
+    engine.release_connection()
+    assert pool.size == 1
+
+
+def test_metrics_time_phases_excluding_commits_and_count_payload():
+    conn, cursor = _mock_conn()
+    metrics = Metrics(interval=None)
+    generator = BatchGenerator(
+        schema={
+            "id": ColumnDefinition("id", "TEXT", lambda: "id", protected=True),
+            "value": ColumnDefinition("value", "INT", lambda: 7),
+        }
+    )
+    engine = MutationEngine(
+        conn,
+        schema="public",
+        table_name="events",
+        generator=generator,
+        insert_mode="copy",
+        metrics=metrics,
+    )
+
+    engine.insert_batch([{"id": "1", "value": 10}, {"id": "2", "value": None}])
+    engine.update_rows(["1"])
+    engine.delete_rows(["2"])
+
+    snapshot = metrics.snapshot()
+    assert snapshot["rows"] == {"insert": 2, "update": 1, "delete": 1}
+    assert snapshot["bytes"] == len(b"1\t10\n2\t\\N\n")
+    assert {phase: summary["count"] for phase, summary in snapshot["phases"].items()} == {
+        "generate": 0,
+        "insert": 1,
+        "update": 1,
+        "delete": 1,
+        "commit": 3,
+        "ddl": 0,
+    }
+    assert conn.commit.call_count == 3
@@ -0,0 +1,144 @@
+import multiprocessing
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from kraft.core.column import ColumnDefinition
+from kraft.core.parallel import (
+    ParallelSimulationRunner,
+    _build_column,
+    _column_specs,
+    _worker_main,
+)
+from kraft.core.schema import SchemaManager
+from kraft.generators import SerialGenerator
+
+
+def _mock_conn():
+    conn = MagicMock()
+    cursor = MagicMock()
+    conn.cursor.return_value.__enter__.return_value = cursor
+    return conn
+
+
+def _schema_manager():
+    columns = {
+        "id": ColumnDefinition("id", "BIGINT", SerialGenerator(1), protected=True),
+        "name": ColumnDefinition("name", "TEXT", lambda: "Alice"),
+        "age": ColumnDefinition("age", "INT", lambda: 30, reserved=True),
+    }
+    return SchemaManager(_mock_conn(), schema="public", table_name="people", columns=columns)
+
+
+def test_parallel_runner_shards_batches_across_workers():
+    runner = ParallelSimulationRunner(
+        _schema_manager(), _mock_conn, workers=3, total_records=70, batch_size=10
+    )
+    assert runner.worker_batches == [3, 2, 2]
+    assert runner.worker_records == [30, 20, 20]
+
+
+def test_parallel_runner_writes_the_remainder_in_one_short_batch():
+    runner = ParallelSimulationRunner(
+        _schema_manager(), _mock_conn, workers=3, total_records=75, batch_size=10
+    )
+    even = ParallelSimulationRunner(
+        _schema_manager(), _mock_conn, workers=2, total_records=35, batch_size=10
+    )
+
+    assert runner.worker_batches == [3, 3, 2]
+    assert runner.worker_records == [30, 25, 20]
+    assert even.worker_batches == [2, 2]
+    assert even.worker_records == [20, 15]
+
+
+def test_parallel_runner_rejects_zero_workers():
+    with pytest.raises(ValueError):
+        ParallelSimulationRunner(_schema_manager(), _mock_conn, workers=0)
+
+
+@patch("kraft.core.mutator.random.random", return_value=0.9)
+@patch("kraft.core.mutator.execute_values")
+def test_parallel_runner_aggregates_worker_counters(mock_execute_values, mock_random):
+    manager = _schema_manager()
+    evolution = MagicMock()
+    evolution.evolution_interval = 2
+
+    runner = ParallelSimulationRunner(
+        manager,
+        _mock_conn,
+        workers=2,
+        total_records=95,
+        batch_size=10,
+        evolution_controller=evolution,
+    )
+    runner.run()
+
+    assert runner.get_counters() == {"total_inserts": 95, "total_updates": 0, "total_deletes": 0}
+    assert [call.args[0] for call in evolution.evolve.call_args_list] == [2, 4, 5]
+
+
+@patch("kraft.core.mutator.random.random", return_value=0.9)
+@patch("kraft.core.mutator.execute_values")
+def test_worker_applies_active_columns_and_shards_serial_keys(mock_execute_values, mock_random):
+    manager = _schema_manager()
+    columns = dict(manager.columns)
+    commands = multiprocessing.Queue()
+    results = multiprocessing.Queue()
+    commands.put((1, _column_specs(manager)))
+    manager.add_column()
+    commands.put((1, _column_specs(manager)))
+    commands.put(None)
+
+    engine_kwargs = {"schema": "s", "table_name": "t"}
+    _worker_main(1, 2, _mock_conn, columns, engine_kwargs, 2, 4, True, None, commands, results)
+
+    assert results.get(timeout=1) == ("done", 1, 1)
+    assert results.get(timeout=1) == ("done", 1, 1)
+    assert results.get(timeout=1)[2]["total_inserts"] == 4
+    first, second = (call.args[2] for call in mock_execute_values.call_args_list)
+    assert first == [(2, "Alice"), (4, "Alice")]
+    assert second == [(6, "Alice", 30), (8, "Alice", 30)]
+
+
+@patch("kraft.core.mutator.random.random", return_value=0.9)
+@patch("kraft.core.mutator.execute_values")
+def test_workers_follow_widened_types_and_nullability(mock_execute_values, mock_random):
+    columns = {
+        "id": ColumnDefinition("id", "INT", SerialGenerator(1), protected=True),
+        "name": ColumnDefinition("name", "TEXT", lambda: "Alice", constraints="NOT NULL"),
+    }
+    manager = SchemaManager(_mock_conn(), schema="public", table_name="people", columns=columns)
+    fork_time = dict(manager.columns)
+    manager.null_fraction = 1.0
+    manager.alter_columns(widen=1, drop_not_null=1)
+    specs = _column_specs(manager)
+
+    assert specs["id"][1] == "BIGINT"
+    assert _build_column(fork_time["id"], "id", specs["id"], None).sql_type == "BIGINT"
+    assert specs["name"][2] is None
+    assert [kind for kind, _ in specs["name"][3]] == ["nullable"]
+
+    commands = multiprocessing.Queue()
+    results = multiprocessing.Queue()
+    commands.put((1, specs))
+    commands.put(None)
+    engine_kwargs = {"schema": "s", "table_name": "t"}
+    _worker_main(0, 1, _mock_conn, fork_time, engine_kwargs, 2, 2, False, None, commands, results)
+
+    assert results.get(timeout=1) == ("done", 0, 1)
+    assert mock_execute_values.call_args.args[2] == [(1, None), (2, None)]
+
+
+def test_worker_reports_failures():
+    commands = multiprocessing.Queue()
+    results = multiprocessing.Queue()
+
+    def broken_connect():
+        raise ConnectionError("boom")
+
+    _worker_main(0, 1, broken_connect, {}, {}, 1, 1, False, None, commands, results)
+
+    kind, index, payload = results.get(timeout=1)
+    assert (kind, index) == ("error", 0)
+    assert "boom" in payload
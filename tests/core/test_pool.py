@@ -0,0 +1,116 @@
+import threading
+from unittest.mock import MagicMock
+
+import psycopg2
+import pytest
+from psycopg2 import extensions
+
+from kraft.core.pool import ConnectionPool, PoolTimeout
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _factory():
+    opened = []
+
+    def connect():
+        conn = MagicMock(closed=0)
+        conn.get_transaction_status.return_value = extensions.TRANSACTION_STATUS_IDLE
+        opened.append(conn)
+        return conn
+
+    return connect, opened
+
+
+def test_pool_reuses_returned_connections():
+    connect, opened = _factory()
+    pool = ConnectionPool(connect=connect, min_size=1, max_size=2)
+
+    first = pool.getconn()
+    second = pool.getconn()
+    pool.putconn(first)
+
+    assert pool.getconn() is first
+    assert second is not first
+    assert len(opened) == pool.size == 2
+
+
+def test_pool_times_out_when_exhausted():
+    connect, _ = _factory()
+    clock = FakeClock()
+    pool = ConnectionPool(connect=connect, min_size=0, max_size=1, timeout=0, clock=clock)
+
+    pool.getconn()
+    with pytest.raises(PoolTimeout):
+        pool.getconn()
+
+
+def test_waiting_borrower_gets_returned_connection():
+    connect, _ = _factory()
+    pool = ConnectionPool(connect=connect, min_size=0, max_size=1, timeout=5)
+    conn = pool.getconn()
+    borrowed = []
+
+    waiter = threading.Thread(target=lambda: borrowed.append(pool.getconn()))
+    waiter.start()
+    pool.putconn(conn)
+    waiter.join(timeout=5)
+
+    assert borrowed == [conn]
+
+
+def test_pool_replaces_unhealthy_connections():
+    connect, opened = _factory()
+    clock = FakeClock()
+    pool = ConnectionPool(connect=connect, min_size=2, health_check_interval=10, clock=clock)
+    stale, closed = opened
+    closed.closed = 1
+    stale.cursor.return_value.__enter__.return_value.execute.side_effect = (
+        psycopg2.OperationalError("server closed the connection")
+    )
+
+    clock.now = 60
+    conn = pool.getconn()
+
+    assert conn not in (stale, closed)
+    stale.close.assert_called_once()
+    assert pool.size == 1
+
+
+def test_connection_block_discards_broken_connections():
+    connect, opened = _factory()
+    pool = ConnectionPool(connect=connect, min_size=1)
+
+    with pytest.raises(psycopg2.InterfaceError), pool.connection():
+        raise psycopg2.InterfaceError("connection already closed")
+
+    opened[0].close.assert_called_once()
+    assert pool.size == 0
+    with pool.connection() as conn:
+        assert conn is opened[1]
+
+
+def test_putconn_rolls_back_open_transactions():
+    connect, opened = _factory()
+    pool = ConnectionPool(connect=connect, min_size=1)
+    conn = pool.getconn()
+    conn.get_transaction_status.return_value = extensions.TRANSACTION_STATUS_INTRANS
+
+    pool.putconn(conn)
+
+    conn.rollback.assert_called_once()
+
+
+def test_pool_validates_arguments():
+    with pytest.raises(ValueError):
+        ConnectionPool()
+    with pytest.raises(ValueError):
+        ConnectionPool("dbname=x", connect=MagicMock())
+    with pytest.raises(ValueError):
+        ConnectionPool(connect=MagicMock(), min_size=3, max_size=2)
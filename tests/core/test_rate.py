@@ -0,0 +1,93 @@
+import pytest
+
+from kraft.core.rate import (
+    ConstantProfile,
+    LoadProfile,
+    RampProfile,
+    RateController,
+    SineProfile,
+    StepProfile,
+    TokenBucket,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def test_profiles_report_expected_rates():
+    assert ConstantProfile(10).rate_at(99) == 10
+    ramp = RampProfile(0, 100, duration=10)
+    assert [ramp.rate_at(t) for t in (0, 5, 10, 20)] == [0, 50, 100, 100]
+    steps = StepProfile([(10, 200), (0, 100)])
+    assert [steps.rate_at(t) for t in (0, 9.9, 10, 50)] == [100, 100, 200, 200]
+    sine = SineProfile(100, 50, period=4)
+    assert sine.rate_at(0) == pytest.approx(100)
+    assert sine.rate_at(1) == pytest.approx(150)
+    assert sine.rate_at(3) == pytest.approx(50)
+
+
+def test_profiles_reject_invalid_arguments():
+    with pytest.raises(ValueError):
+        ConstantProfile(-1)
+    with pytest.raises(ValueError):
+        RampProfile(0, 10, duration=0)
+    with pytest.raises(ValueError):
+        StepProfile([])
+    with pytest.raises(ValueError):
+        SineProfile(10, 20, period=1)
+
+
+def test_token_bucket_blocks_until_tokens_accrue():
+    clock = FakeClock()
+    bucket = TokenBucket(ConstantProfile(100), clock=clock, sleep=clock.sleep)
+
+    waited = sum(bucket.acquire(50) for _ in range(4))
+
+    assert clock.now == pytest.approx(2.0)
+    assert waited == pytest.approx(2.0)
+    assert bucket.granted == 200
+
+
+def test_token_bucket_take_available_never_blocks():
+    clock = FakeClock()
+    bucket = TokenBucket(ConstantProfile(10), clock=clock, sleep=clock.sleep)
+
+    assert bucket.take_available(100) == 0
+    clock.now = 0.55
+    assert bucket.take_available(100) == 5
+    clock.now = 100
+    # Banked budget is capped at ``burst_seconds`` worth of tokens.
+    assert bucket.take_available(1_000) == 10
+
+
+def test_rate_controller_reports_target_and_achieved_rates():
+    clock = FakeClock()
+    controller = RateController(inserts=100, updates=10, clock=clock, sleep=clock.sleep)
+    controller.start()
+
+    controller.acquire("insert", 100)
+    controller.record("insert", 100)
+    assert controller.available("update", 50) == 10
+    controller.record("update", 10)
+    controller.acquire("delete", 1_000)
+
+    report = controller.report()
+    assert clock.now == pytest.approx(1.0)
+    assert report["insert"]["achieved_rate"] == pytest.approx(100)
+    assert report["insert"]["ratio"] == pytest.approx(1.0)
+    assert report["update"]["target_rate"] == pytest.approx(10)
+    assert "target_rate" not in report["delete"]
+    assert controller.available("delete", 7) == 7
+
+
+def test_load_profile_subclasses_must_define_rate_at():
+    with pytest.raises(TypeError):
+        LoadProfile()
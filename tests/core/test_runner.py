@@ -1,9 +1,28 @@
+import signal
+import threading
 from unittest.mock import MagicMock
 
+import pytest
+
+from kraft.core.batch import ColumnarBatch
 from kraft.core.column import ColumnDefinition
+from kraft.core.metrics import MemorySink, Metrics
+from kraft.core.mutator import MutationEngine
+from kraft.core.rate import RateController
 from kraft.core.runner import SimulationRunner
 
 
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
 def _schema_manager_with_columns():
     manager = MagicMock()
     manager.get_active_columns.return_value = {
@@ -65,3 +84,326 @@ def test_simulation_runner_triggers_evolution():
 
     runner.run()
     assert evolution.evolve.call_count == 2
+
+
+def test_simulation_runner_can_generate_columnar_batches():
+    schema_manager = _schema_manager_with_columns()
+    mutator = MagicMock()
+    mutator.insert_batch.return_value = ["id", "id"]
+
+    runner = SimulationRunner(
+        schema_manager=schema_manager,
+        mutator=mutator,
+        total_records=4,
+        batch_size=2,
+        columnar=True,
+    )
+
+    runner.run()
+
+    batch = mutator.insert_batch.call_args[0][0]
+    assert isinstance(batch, ColumnarBatch)
+    assert batch.columns == {"id": ["id", "id"], "name": ["Alice", "Alice"]}
+
+
+def test_pipelined_runner_writes_every_batch_in_order():
+    schema_manager = _schema_manager_with_columns()
+    mutator = MagicMock()
+    mutator.insert_batch.return_value = ["1", "2"]
+    evolution = MagicMock()
+    evolution.evolve.return_value = None
+
+    runner = SimulationRunner(
+        schema_manager=schema_manager,
+        mutator=mutator,
+        evolution_controller=evolution,
+        total_records=20,
+        batch_size=2,
+        pipeline_depth=3,
+    )
+    runner.run()
+
+    assert mutator.insert_batch.call_count == 10
+    assert [call.args[0] for call in evolution.evolve.call_args_list] == list(range(1, 11))
+
+
+def test_pipelined_runner_surfaces_generation_errors():
+    schema_manager = MagicMock()
+
+    def boom():
+        raise RuntimeError("generator failed")
+
+    schema_manager.get_active_columns.return_value = {
+        "id": ColumnDefinition("id", "UUID", boom),
+    }
+    runner = SimulationRunner(
+        schema_manager=schema_manager,
+        mutator=MagicMock(),
+        total_records=4,
+        batch_size=2,
+        pipeline_depth=1,
+    )
+
+    with pytest.raises(RuntimeError, match="generator failed"):
+        runner.run()
+
+
+def test_align_batch_reshapes_stale_batches():
+    runner = SimulationRunner(
+        schema_manager=_schema_manager_with_columns(), mutator=MagicMock(), total_records=0
+    )
+    active = {
+        "id": ColumnDefinition("id", "UUID", lambda: "id"),
+        "age": ColumnDefinition("age", "INT", lambda: 30),
+    }
+
+    rows = runner._align_batch([{"id": "a", "name": "Alice"}], active)
+    columnar = runner._align_batch(ColumnarBatch({"id": ["a"], "name": ["Alice"]}), active)
+
+    assert rows == [{"id": "a", "age": 30}]
+    assert columnar.columns == {"id": ["a"], "age": [30]}
+    assert runner.realigned_batches == 2
+
+
+def test_rate_controlled_runner_paces_inserts_and_mutations():
+    clock = FakeClock()
+    controller = RateController(
+        inserts=4, updates=2, deletes=1, clock=clock, sleep=clock.sleep
+    )
+    mutator = MagicMock()
+    mutator.insert_batch.return_value = ["1", "2"]
+    mutator.key_index = None
+    mutator.mutate.side_effect = lambda operation, count, ids: count
+
+    runner = SimulationRunner(
+        schema_manager=_schema_manager_with_columns(),
+        mutator=mutator,
+        total_records=8,
+        batch_size=2,
+        rate_controller=controller,
+    )
+    runner.run()
+
+    assert clock.now == pytest.approx(2.0)
+    mutator.maybe_mutate_batch.assert_not_called()
+    assert controller.completed == {"insert": 8, "update": 4, "delete": 2}
+    assert controller.report()["insert"]["ratio"] == pytest.approx(1.0)
+
+
+def test_rate_controller_without_mutation_targets_keeps_random_mutations():
+    clock = FakeClock()
+    mutator = MagicMock()
+    mutator.insert_batch.return_value = ["1", "2"]
+    mutator.maybe_mutate_batch.return_value = (1, 0)
+
+    runner = SimulationRunner(
+        schema_manager=_schema_manager_with_columns(),
+        mutator=mutator,
+        total_records=4,
+        batch_size=2,
+        rate_controller=RateController(inserts=100, clock=clock, sleep=clock.sleep),
+    )
+    runner.run()
+
+    assert mutator.maybe_mutate_batch.call_count == 2
+    assert runner.rate_controller.completed["update"] == 2
+
+
+def test_runner_writes_final_partial_batch():
+    mutator = MagicMock()
+    mutator.insert_batch.side_effect = lambda rows: ["id"] * len(rows)
+
+    runner = SimulationRunner(
+        schema_manager=_schema_manager_with_columns(),
+        mutator=mutator,
+        total_records=5,
+        batch_size=2,
+    )
+    runner.run()
+
+    assert [len(call.args[0]) for call in mutator.insert_batch.call_args_list] == [2, 2, 1]
+    assert runner.total_batches == 3
+    assert runner.rows_written == 5
+    assert [call.args[0] for call in mutator.end_batch.call_args_list] == [2, 2, 1]
+    mutator.flush.assert_called_once()
+
+
+@pytest.mark.parametrize("pipeline_depth", [0, 2])
+def test_unbounded_runner_streams_until_stopped(pipeline_depth):
+    mutator = MagicMock()
+    mutator.get_counters.return_value = {"total_inserts": 0}
+
+    runner = SimulationRunner(
+        schema_manager=_schema_manager_with_columns(),
+        mutator=mutator,
+        total_records=None,
+        batch_size=2,
+        pipeline_depth=pipeline_depth,
+    )
+
+    def insert(rows):
+        if mutator.insert_batch.call_count == 7:
+            runner.stop()
+        return ["id"] * len(rows)
+
+    mutator.insert_batch.side_effect = insert
+    runner.run()
+
+    assert runner.total_batches is None
+    assert mutator.insert_batch.call_count == 7
+    assert runner.progress()["rows"] == 14
+
+
+def test_runner_stops_at_deadline(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr("kraft.core.runner.time.monotonic", clock)
+    mutator = MagicMock()
+    mutator.get_counters.return_value = {}
+
+    def insert(rows):
+        clock.sleep(1.0)
+        return ["id"] * len(rows)
+
+    mutator.insert_batch.side_effect = insert
+    runner = SimulationRunner(
+        schema_manager=_schema_manager_with_columns(),
+        mutator=mutator,
+        total_records=None,
+        batch_size=2,
+        duration=3.5,
+        progress_interval=1.0,
+    )
+    runner.run()
+
+    assert mutator.insert_batch.call_count == 4
+    assert runner.progress()["rows_per_second"] == pytest.approx(2.0)
+
+
+def test_runner_signal_handler_requests_graceful_stop():
+    mutator = MagicMock()
+    mutator.get_counters.return_value = {}
+
+    def insert(rows):
+        signal.raise_signal(signal.SIGINT)
+        return ["id"] * len(rows)
+
+    mutator.insert_batch.side_effect = insert
+    runner = SimulationRunner(
+        schema_manager=_schema_manager_with_columns(),
+        mutator=mutator,
+        total_records=None,
+        batch_size=2,
+        handle_signals=True,
+    )
+    previous = signal.getsignal(signal.SIGINT)
+    runner.run()
+
+    assert mutator.insert_batch.call_count == 1
+    assert signal.getsignal(signal.SIGINT) is previous
+
+
+def test_runner_requires_positive_batch_size_when_records_are_requested():
+    with pytest.raises(ValueError):
+        SimulationRunner(_schema_manager_with_columns(), MagicMock(), batch_size=0)
+
+
+def test_concurrent_evolution_runs_off_the_writer_thread():
+    schema_manager = _schema_manager_with_columns()
+    mutator = MagicMock()
+    mutator.insert_batch.return_value = ["1", "2"]
+    threads = []
+    evolution = MagicMock()
+    evolution.evolution_interval = 2
+    evolution.evolve.side_effect = lambda batch_num: threads.append(threading.current_thread())
+
+    runner = SimulationRunner(
+        schema_manager=schema_manager,
+        mutator=mutator,
+        evolution_controller=evolution,
+        total_records=8,
+        batch_size=2,
+        concurrent_evolution=True,
+    )
+    runner.run()
+
+    assert mutator.insert_batch.call_count == 4
+    assert 1 <= evolution.evolve.call_count <= 2
+    assert all(thread.name == "kraft-evolution" for thread in threads)
+    assert schema_manager.lock.acquire.call_count == 4
+    assert schema_manager.lock.release.call_count == 4
+
+
+def test_writer_commits_before_waiting_for_a_busy_schema_lock():
+    schema_manager = _schema_manager_with_columns()
+    schema_manager.lock = threading.RLock()
+    mutator = MagicMock()
+    mutator.insert_batch.return_value = ["1", "2"]
+    held = threading.Event()
+    flushed = threading.Event()
+
+    def evolution_thread():
+        # Stands in for a rename whose DDL waits on the writer's open transaction.
+        with schema_manager.lock:
+            held.set()
+            assert flushed.wait(timeout=5)
+
+    mutator.flush.side_effect = flushed.set
+    runner = SimulationRunner(
+        schema_manager=schema_manager,
+        mutator=mutator,
+        total_records=2,
+        batch_size=2,
+        concurrent_evolution=True,
+    )
+    thread = threading.Thread(target=evolution_thread)
+    thread.start()
+    held.wait(timeout=5)
+
+    runner.run()
+    thread.join(timeout=5)
+
+    assert not thread.is_alive()
+    assert mutator.insert_batch.call_count == 1
+
+
+def test_concurrent_evolution_errors_surface_on_the_writer():
+    schema_manager = _schema_manager_with_columns()
+    mutator = MagicMock()
+    mutator.insert_batch.return_value = ["1"]
+    evolution = MagicMock()
+    evolution.evolution_interval = 1
+    evolution.evolve.side_effect = RuntimeError("ddl failed")
+
+    runner = SimulationRunner(
+        schema_manager=schema_manager,
+        mutator=mutator,
+        evolution_controller=evolution,
+        total_records=1,
+        batch_size=1,
+        concurrent_evolution=True,
+    )
+
+    with pytest.raises(RuntimeError, match="ddl failed"):
+        runner.run()
+
+
+def test_runner_records_metrics_and_wires_them_into_its_components():
+    schema_manager = _schema_manager_with_columns()
+    mutator = MutationEngine(MagicMock(), schema="public", table_name="events")
+    mutator.insert_batch = MagicMock(return_value=["1", "2"])
+    mutator.maybe_mutate_batch = MagicMock(return_value=(0, 0))
+    sink = MemorySink()
+    metrics = Metrics([sink], interval=None)
+
+    runner = SimulationRunner(
+        schema_manager=schema_manager,
+        mutator=mutator,
+        total_records=4,
+        batch_size=2,
+        metrics=metrics,
+    )
+    runner.run()
+
+    assert mutator.metrics is metrics
+    assert len(sink.snapshots) == 1
+    assert sink.latest["phases"]["generate"]["count"] == 2
@@ -1,6 +1,11 @@
 from unittest.mock import MagicMock
 
+import pytest
+from psycopg2 import errors
+
 from kraft.core.column import ColumnDefinition
+from kraft.core.ddl import LockPolicy
+from kraft.core.pool import ConnectionPool
 from kraft.core.schema import SchemaManager
 
 
@@ -73,3 +78,283 @@ def test_register_column_adds_to_active_when_not_reserved():
     assert "new_col" in manager.get_active_columns()
     assert manager.schema_version == 2
 
+
+
+def test_schema_manager_borrows_pooled_connections_for_ddl():
+    conn, cursor = _mock_conn()
+    conn.closed = 0
+    pool = ConnectionPool(connect=lambda: conn, min_size=0)
+    columns = {"id": ColumnDefinition("id", "UUID", lambda: "id", protected=True)}
+    manager = SchemaManager(pool, schema="public", table_name="events", columns=columns)
+
+    manager.create_table()
+    manager.drop_table()
+
+    assert cursor.execute.call_count == 2
+    assert conn.commit.call_count == 2
+    assert pool.size == 1
+
+
+def test_schema_manager_retries_ddl_after_lock_timeouts():
+    conn, cursor = _mock_conn()
+    timeouts = iter([errors.LockNotAvailable(), None])
+
+    def execute(statement):
+        if statement.startswith("ALTER"):
+            error = next(timeouts)
+            if error:
+                raise error
+
+    cursor.execute.side_effect = execute
+    pauses = []
+    columns = {
+        "id": ColumnDefinition("id", "UUID", lambda: "id"),
+        "extra": ColumnDefinition("extra", "TEXT", lambda: "x", reserved=True),
+    }
+    manager = SchemaManager(
+        conn,
+        schema="public",
+        table_name="events",
+        columns=columns,
+        lock_policy=LockPolicy(lock_timeout=0.5, backoff=0.2, jitter=False, sleep=pauses.append),
+    )
+
+    assert manager.add_column() == "extra"
+    statements = [call.args[0] for call in cursor.execute.call_args_list]
+    assert statements.count("SET LOCAL lock_timeout = '500ms'") == 2
+    assert pauses == [0.2]
+    conn.rollback.assert_called_once()
+    [entry] = manager.ddl_log
+    assert entry["attempts"] == 2
+    assert entry["succeeded"] is True
+    assert entry["waited_seconds"] >= entry["blocked_seconds"] >= 0
+
+
+def test_drop_column_is_restored_when_ddl_gives_up():
+    conn, cursor = _mock_conn()
+    cursor.execute.side_effect = errors.LockNotAvailable()
+    columns = {
+        "id": ColumnDefinition("id", "UUID", lambda: "id", protected=True),
+        "value": ColumnDefinition("value", "INT", lambda: 1),
+    }
+    manager = SchemaManager(
+        conn,
+        schema="public",
+        table_name="events",
+        columns=columns,
+        lock_policy=LockPolicy(max_attempts=2, sleep=lambda _: None),
+    )
+
+    with pytest.raises(errors.LockNotAvailable):
+        manager.drop_column()
+
+    assert list(manager.get_active_columns()) == ["id", "value"]
+    assert manager.schema_version == 1
+    assert manager.ddl_log[-1]["attempts"] == 2
+    assert manager.ddl_log[-1]["succeeded"] is False
+
+
+def test_alter_columns_applies_adds_and_drops_in_one_statement():
+    conn, cursor = _mock_conn()
+    columns = {
+        "id": ColumnDefinition("id", "UUID", lambda: "id", protected=True),
+        "name": ColumnDefinition("name", "TEXT", lambda: "x"),
+        "age": ColumnDefinition("age", "INT", lambda: 1),
+        "email": ColumnDefinition("email", "TEXT", lambda: "e", reserved=True),
+        "phone": ColumnDefinition("phone", "TEXT", lambda: "p", reserved=True),
+    }
+    manager = SchemaManager(conn, schema="public", table_name="people", columns=columns)
+
+    changes = manager.alter_columns(add=2, drop=1)
+
+    assert changes["add"] == ["email", "phone"]
+    assert changes["drop"] == ["name"]
+    cursor.execute.assert_called_once_with(
+        "ALTER TABLE public.people ADD COLUMN email TEXT, ADD COLUMN phone TEXT, DROP COLUMN name;"
+    )
+    conn.commit.assert_called_once()
+    assert list(manager.get_active_columns()) == ["id", "age", "email", "phone"]
+    assert not any(manager.alter_columns(add=1).values())
+
+
+def test_alter_columns_commits_one_version_per_event():
+    conn, _ = _mock_conn()
+    columns = {
+        "id": ColumnDefinition("id", "INT", lambda: 1, protected=True),
+        "a": ColumnDefinition("a", "TEXT", lambda: "x"),
+        "b": ColumnDefinition("b", "SMALLINT", lambda: 1),
+        "c": ColumnDefinition("c", "TEXT", lambda: "c", reserved=True),
+    }
+    manager = SchemaManager(conn, schema="public", table_name="events", columns=columns)
+
+    changes = manager.alter_columns(add=1, drop=1, widen=1)
+
+    assert changes["add"] == ["c"] and changes["drop"] == ["a"]
+    assert manager.schema_version == 2
+    assert manager.get_active_columns()["id"].sql_type == "BIGINT"
+
+
+def test_alter_columns_widens_renames_and_changes_nullability():
+    conn, cursor = _mock_conn()
+    columns = {
+        "id": ColumnDefinition("id", "INT", lambda: 1, constraints="PRIMARY KEY"),
+        "code": ColumnDefinition("code", "VARCHAR(8)", lambda: "abc"),
+        "qty": ColumnDefinition("qty", "INT", lambda: None),
+        "note": ColumnDefinition("note", "TEXT", lambda: "n", constraints="NOT NULL"),
+        "tag": ColumnDefinition("tag", "TEXT", lambda: "t"),
+    }
+    manager = SchemaManager(
+        conn, schema="public", table_name="items", columns=columns, null_fraction=1.0
+    )
+
+    changes = manager.alter_columns(widen=2, drop_not_null=1, rename=1)
+
+    assert changes["widen"] == ["id", "code"]
+    assert changes["rename"] == ["qty -> qty_v2"]
+    assert changes["drop_not_null"] == ["note"]
+    statements = [call.args[0] for call in cursor.execute.call_args_list]
+    assert (
+        "ALTER TABLE public.items ALTER COLUMN id TYPE BIGINT, "
+        "ALTER COLUMN code TYPE TEXT, ALTER COLUMN note DROP NOT NULL; "
+        "ALTER TABLE public.items RENAME COLUMN qty TO qty_v2;"
+    ) in statements
+    assert statements.count("SELECT pg_relation_filenode(%s::regclass);") == 2
+    assert "rewrote_table" in manager.ddl_log[-1]
+
+    active = manager.get_active_columns()
+    assert list(active) == ["id", "code", "qty_v2", "note", "tag"]
+    assert active["id"].sql_type == "BIGINT"
+    assert active["qty_v2"].name == "qty_v2"
+    assert manager.original_names == {"qty_v2": "qty"}
+    assert active["note"].constraints is None
+    assert active["note"].generate_many(3) == [None, None, None]
+    assert manager.columns is columns and "qty" not in columns
+
+
+def test_set_not_null_backfills_and_stops_generating_nulls():
+    conn, cursor = _mock_conn()
+    values = iter(["first", None, "x", None, "y"])
+    columns = {
+        "id": ColumnDefinition("id", "UUID", lambda: "id", protected=True),
+        "label": ColumnDefinition("label", "TEXT", lambda: next(values)),
+    }
+    manager = SchemaManager(conn, schema="public", table_name="items", columns=columns)
+
+    changes = manager.alter_columns(set_default=1)
+    assert changes["set_default"] == ["label"]
+    assert manager.alter_columns(set_not_null=1)["set_not_null"] == []  # drew None
+    changes = manager.alter_columns(set_not_null=1)
+
+    assert changes["set_not_null"] == ["label"]
+    statements = [call.args[0] for call in cursor.execute.call_args_list]
+    assert (
+        "LOCK TABLE public.items IN ACCESS EXCLUSIVE MODE; "
+        "UPDATE public.items SET label = 'x' WHERE label IS NULL; "
+        "ALTER TABLE public.items ALTER COLUMN label SET NOT NULL;"
+    ) in statements
+    label = manager.get_active_columns()["label"]
+    assert label.constraints == "DEFAULT 'first' NOT NULL"
+    assert label.generate_many(2) == ["x", "y"]
+
+
+def test_defaults_outside_latin1_are_quoted_or_skipped():
+    conn, cursor = _mock_conn()
+    columns = {
+        "id": ColumnDefinition("id", "UUID", lambda: "id", protected=True),
+        "tags": ColumnDefinition("tags", "TEXT[]", lambda: ["☃"]),
+        "label": ColumnDefinition("label", "TEXT", lambda: "crème ☃"),
+    }
+    manager = SchemaManager(conn, schema="public", table_name="items", columns=columns)
+
+    changes = manager.alter_columns(set_default=2)
+
+    assert changes["set_default"] == ["label"]
+    cursor.execute.assert_any_call(
+        "ALTER TABLE public.items ALTER COLUMN label SET DEFAULT 'crème ☃';"
+    )
+
+
+def test_candidate_indexes_follow_every_change():
+    conn, _ = _mock_conn()
+    columns = {
+        "id": ColumnDefinition("id", "UUID", lambda: "id", protected=True),
+        "name": ColumnDefinition("name", "TEXT", lambda: "x"),
+        "email": ColumnDefinition("email", "TEXT", lambda: "e", reserved=True),
+        "phone": ColumnDefinition("phone", "TEXT", lambda: "p", reserved=True),
+    }
+    manager = SchemaManager(conn, schema="public", table_name="people", columns=columns)
+    assert list(manager.dormant_columns) == ["email", "phone"]
+    assert list(manager.droppable_columns) == ["name"]
+
+    manager.alter_columns(add=1, rename=1)
+    assert list(manager.dormant_columns) == ["phone"]
+    assert list(manager.droppable_columns) == ["name_v2", "email"]
+
+    manager.alter_columns(drop=1)
+    manager.register_column("fax", ColumnDefinition("fax", "TEXT", lambda: "f", reserved=True))
+    manager.register_column("age", ColumnDefinition("age", "INT", lambda: 1))
+    assert list(manager.dormant_columns) == ["phone", "fax"]
+    assert list(manager.droppable_columns) == ["email", "age"]
+    assert manager.alteration_candidates("widen") == ("age",)
+
+
+def test_schema_history_is_rebuilt_from_deltas_and_checkpoints():
+    conn, _ = _mock_conn()
+    columns = {"id": ColumnDefinition("id", "UUID", lambda: "id", protected=True)}
+    manager = SchemaManager(conn, schema="public", table_name="wide", columns=columns)
+    for index in range(150):
+        manager.register_column(f"c{index}", ColumnDefinition(f"c{index}", "INT", lambda: 1))
+        if index % 3 == 2:
+            manager.drop_column()
+
+    expected = {"id"}
+    history = [set(expected)]
+    dropped = 0
+    for index in range(150):
+        expected.add(f"c{index}")
+        history.append(set(expected))
+        if index % 3 == 2:
+            expected.discard(f"c{dropped}")
+            dropped += 1
+            history.append(set(expected))
+
+    assert manager.schema_version == len(history) == 201
+    assert manager.schema_history == history
+    assert manager.columns_at(128) == history[127]
+    assert manager.columns_at(manager.schema_version) == set(manager.get_active_columns())
+    with pytest.raises(ValueError):
+        manager.columns_at(0)
+
+
+def test_columns_at_returns_only_real_states_of_a_mixed_event():
+    conn, _ = _mock_conn()
+    columns = {
+        "id": ColumnDefinition("id", "UUID", lambda: "id", protected=True),
+        "a": ColumnDefinition("a", "TEXT", lambda: "x"),
+        "b": ColumnDefinition("b", "TEXT", lambda: "y"),
+        "c": ColumnDefinition("c", "TEXT", lambda: "z", reserved=True),
+    }
+    manager = SchemaManager(conn, schema="public", table_name="events", columns=columns)
+
+    manager.alter_columns(add=1, drop=1)
+
+    assert manager.schema_history == [{"id", "a", "b"}, {"id", "b", "c"}]
+    assert manager.columns_at(1) == {"id", "a", "b"}
+    assert manager.columns_at(2) == {"id", "b", "c"}
+    with pytest.raises(ValueError):
+        manager.columns_at(3)
+
+
+def test_dropped_columns_are_tombstoned():
+    conn, _ = _mock_conn()
+    columns = {
+        "id": ColumnDefinition("id", "UUID", lambda: "id", protected=True),
+        "extra": ColumnDefinition("extra", "TEXT", lambda: "x", reserved=True),
+    }
+    manager = SchemaManager(conn, schema="public", table_name="people", columns=columns)
+
+    assert manager.add_column() == "extra"
+    assert manager.drop_column() == "extra"
+
+    assert list(manager.tombstoned_columns) == ["extra"]
+    assert manager.add_column() is None
@@ -0,0 +1,165 @@
+import multiprocessing
+import random
+from unittest.mock import MagicMock, patch
+
+from kraft.core.batch import BatchGenerator
+from kraft.core.column import ColumnDefinition
+from kraft.core.evolution import EvolutionController
+from kraft.core.mutator import MutationEngine
+from kraft.core.parallel import _worker_main
+from kraft.core.runner import SimulationRunner
+from kraft.core.schema import SchemaManager
+from kraft.core.seed import RandomStreams
+from kraft.generators import IntegerGenerator, JSONGenerator, TextGenerator, UUIDGenerator
+
+
+def _mock_conn():
+    conn = MagicMock()
+    cursor = MagicMock()
+    conn.cursor.return_value.__enter__.return_value = cursor
+    return conn
+
+
+def _columns():
+    return {
+        "id": ColumnDefinition("id", "UUID", UUIDGenerator(), protected=True),
+        "name": ColumnDefinition("name", "TEXT", TextGenerator(4, 8)),
+        "score": ColumnDefinition("score", "INT", lambda: random.randint(0, 100)),
+        "meta": ColumnDefinition("meta", "JSONB", JSONGenerator({"n": IntegerGenerator(0, 9)})),
+        "extra": ColumnDefinition("extra", "INT", IntegerGenerator(0, 9), reserved=True),
+    }
+
+
+def test_stream_seeds_depend_only_on_seed_and_path():
+    streams = RandomStreams(42)
+
+    assert streams.seed_for("column", "a") == RandomStreams(42).seed_for("column", "a")
+    assert streams.spawn("worker", 1).seed_for("x") == RandomStreams(42).spawn(
+        "worker", "1"
+    ).seed_for("x")
+    assert streams.seed_for("column", "a") != streams.seed_for("column", "b")
+    assert streams.spawn("worker", 0).seed_for("x") != streams.spawn("worker", 1).seed_for("x")
+    assert streams.random("a").random() == RandomStreams(42).random("a").random()
+    assert isinstance(RandomStreams().seed, int)
+
+
+def test_seed_columns_reseeds_generators_and_skips_plain_callables():
+    first, second = _columns(), _columns()
+
+    RandomStreams(7).seed_columns(first)
+    RandomStreams(7).seed_columns(second)
+
+    for name in ("id", "name", "meta", "extra"):
+        assert first[name].generate_many(5) == second[name].generate_many(5)
+    assert first["id"].generate() != first["name"].generate()
+
+
+def test_bind_keeps_explicitly_configured_streams():
+    own = random.Random(1)
+    engine = MutationEngine(_mock_conn(), schema="s", table_name="t", rng=own)
+    manager = SchemaManager(_mock_conn(), schema="s", table_name="t", columns=_columns())
+    controller = EvolutionController(manager)
+
+    RandomStreams(3).bind(engine=engine, controller=controller, manager=manager)
+
+    assert engine.rng is own
+    assert engine.strategy.rng is own
+    assert isinstance(controller.rng, random.Random)
+    assert isinstance(manager.rng, random.Random) and manager.rng is not controller.rng
+
+
+def _seeded_run(seed):
+    manager = SchemaManager(_mock_conn(), schema="s", table_name="t", columns=_columns())
+    mutator = MutationEngine(_mock_conn(), schema="s", table_name="t", mutation_probability=1.0)
+    controller = EvolutionController(manager, evolution_interval=1, evolution_probability=0.5)
+    runner = SimulationRunner(
+        manager,
+        mutator,
+        total_records=40,
+        batch_size=10,
+        evolution_controller=controller,
+        seed=seed,
+    )
+    with patch("kraft.core.mutator.execute_values") as execute_values:
+        runner.run()
+    inserted = [call.args[2] for call in execute_values.call_args_list]
+    return (
+        inserted,
+        mutator.get_counters(),
+        [entry["message"] for entry in controller.evolution_log],
+    )
+
+
+def test_seeded_runs_are_reproducible():
+    assert _seeded_run(11) == _seeded_run(11)
+    assert _seeded_run(11)[0] != _seeded_run(12)[0]
+
+
+def _pipelined_run(seed):
+    columns = {name: column for name, column in _columns().items() if name != "score"}
+    manager = SchemaManager(_mock_conn(), schema="s", table_name="t", columns=columns)
+    generator = BatchGenerator(schema=manager.get_active_columns())
+    mutator = MutationEngine(
+        _mock_conn(),
+        schema="s",
+        table_name="t",
+        generator=generator,
+        mutation_probability=1.0,
+        update_mode="batch",
+    )
+    controller = EvolutionController(manager, evolution_interval=3, evolution_probability=1.0)
+    runner = SimulationRunner(
+        manager,
+        mutator,
+        total_records=60,
+        batch_size=10,
+        batch_generator=generator,
+        evolution_controller=controller,
+        pipeline_depth=2,
+        seed=seed,
+    )
+    with patch("kraft.core.mutator.execute_values") as execute_values:
+        runner.run()
+    statements = [call.args[2] for call in execute_values.call_args_list]
+    return statements, manager.columns, generator.schema
+
+
+def test_pipelined_writer_draws_update_values_from_its_own_stream():
+    statements, registry, writer = _pipelined_run(11)
+
+    assert _pipelined_run(11)[0] == statements
+    assert _pipelined_run(12)[0] != statements
+    assert len(statements) > 6
+    for name, column in writer.items():
+        assert column.generator is not registry[name].generator
+        assert column.generator.seed != registry[name].generator.seed
+
+
+def _worker_rows(index, streams):
+    commands = multiprocessing.Queue()
+    results = multiprocessing.Queue()
+    columns = _columns()
+    specs = {name: (name, columns[name].sql_type, None, ()) for name in ("id", "name", "score")}
+    commands.put((2, specs))
+    commands.put(None)
+    with patch("kraft.core.mutator.execute_values") as execute_values:
+        _worker_main(
+            index,
+            2,
+            _mock_conn,
+            columns,
+            {"schema": "s", "table_name": "t"},
+            3,
+            6,
+            False,
+            streams,
+            commands,
+            results,
+        )
+    assert results.get(timeout=1)[0] == "done"
+    return [call.args[2] for call in execute_values.call_args_list]
+
+
+def test_seeded_workers_replay_their_own_streams():
+    assert _worker_rows(0, RandomStreams(5)) == _worker_rows(0, RandomStreams(5))
+    assert _worker_rows(0, RandomStreams(5)) != _worker_rows(1, RandomStreams(5))
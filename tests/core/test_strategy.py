@@ -0,0 +1,47 @@
+from unittest.mock import patch
+
+import pytest
+
+from kraft.core.strategy import MixStrategy, MutationStrategy, RandomStrategy
+
+
+def test_mix_strategy_holds_ratio_across_batches():
+    strategy = MixStrategy(5, 90, 5)
+
+    assert strategy.plan(10) == (180, 10)
+
+    uneven = MixStrategy(3, 1, 1)
+    plans = [uneven.plan(1) for _ in range(6)]
+    assert sum(updates for updates, _ in plans) == 2
+    assert sum(deletes for _, deletes in plans) == 2
+    assert plans[0] == (0, 0)
+
+
+@patch("kraft.core.strategy.random.random", side_effect=[0.9, 0.1, 0.2, 0.1, 0.7])
+def test_random_strategy_flips_coins(mock_random):
+    strategy = RandomStrategy(mutation_probability=0.5, update_ratio=0.5, sample_fraction=0.25)
+
+    assert strategy.plan(8) == (0, 0)
+    assert strategy.plan(8) == (2, 0)
+    assert strategy.plan(8) == (0, 2)
+    assert strategy.plan(0) == (0, 0)
+
+
+def test_strategy_options_and_validation():
+    strategy = MixStrategy(1, 1, 0, update_batch_size=100, columns_per_update=3)
+
+    assert strategy.batch_size("update") == 100
+    assert strategy.batch_size("delete") is None
+    assert strategy.columns_per_update == 3
+    with pytest.raises(ValueError):
+        strategy.batch_size("merge")
+    with pytest.raises(TypeError):
+        MutationStrategy()
+    with pytest.raises(ValueError):
+        MixStrategy(0, 1, 1)
+    with pytest.raises(ValueError):
+        RandomStrategy(update_ratio=1.5)
+    with pytest.raises(ValueError):
+        RandomStrategy(delete_batch_size=0)
+    with pytest.raises(ValueError):
+        RandomStrategy(columns_per_update=0)
@@ -0,0 +1,47 @@
+import pytest
+
+from kraft.core.transaction import TransactionPolicy
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_default_policy_commits_every_batch():
+    policy = TransactionPolicy()
+
+    assert policy.every_batches == 1
+    assert policy.record(10) is True
+
+
+def test_policy_commits_on_first_threshold_reached():
+    policy = TransactionPolicy(every_batches=3, every_rows=250)
+
+    assert policy.record(100) is False
+    assert policy.record(100) is False
+    assert policy.record(100) is True
+    policy.reset()
+    assert policy.record(300) is True
+
+
+def test_policy_time_window_starts_at_begin():
+    clock = FakeClock()
+    policy = TransactionPolicy(every_seconds=5, clock=clock)
+
+    policy.begin()
+    clock.now = 4
+    assert policy.record(1) is False
+    policy.begin()
+    clock.now = 5
+    assert policy.record(1) is True
+    policy.reset()
+    assert policy.record(1) is False
+
+
+def test_policy_rejects_non_positive_thresholds():
+    with pytest.raises(ValueError):
+        TransactionPolicy(every_rows=0)
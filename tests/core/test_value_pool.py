@@ -0,0 +1,118 @@
+import pickle
+from datetime import datetime
+
+import pytest
+
+from kraft.core.column import ColumnDefinition
+from kraft.core.seed import RandomStreams
+from kraft.core.value_pool import PooledGenerator, ValuePool, pool_key, pooled_columns
+from kraft.generators import IntegerGenerator, JSONGenerator, TextGenerator, UUIDGenerator
+
+
+def _columns():
+    return {
+        "id": ColumnDefinition("id", "UUID", UUIDGenerator(), protected=True),
+        "bio": ColumnDefinition("bio", "TEXT", TextGenerator(20, 40)),
+        "doc": ColumnDefinition(
+            "doc", "JSONB", JSONGenerator({"n": IntegerGenerator(0, 9), "tag": "x"})
+        ),
+        "seen": ColumnDefinition("seen", "TIMESTAMP", datetime.now),
+    }
+
+
+def test_pool_round_trips_text_and_other_values(tmp_path):
+    text = ValuePool.build(tmp_path / "text.kpool", ["a", "héllo", ""])
+    mixed = ValuePool.build(tmp_path / "mixed.kpool", [1, None, {"a": [1, 2]}])
+
+    assert len(text) == 3
+    assert text.encoding == "utf-8"
+    assert text.take([1, 0, 1]) == ["héllo", "a", "héllo"]
+    assert text[-1] == ""
+    assert mixed.encoding == "pickle"
+    assert mixed.take([2, 1, 0]) == [{"a": [1, 2]}, None, 1]
+    with pytest.raises(IndexError):
+        text[3]
+    text.close()
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_pool_rejects_empty_values_and_foreign_files(tmp_path):
+    with pytest.raises(ValueError):
+        ValuePool.build(tmp_path / "empty.kpool", [])
+    foreign = tmp_path / "foreign.kpool"
+    foreign.write_bytes(b"not a pool at all, really not")
+    with pytest.raises(ValueError, match="not a Kraft value pool"):
+        ValuePool(foreign)
+    corrupt = tmp_path / "corrupt.kpool"
+    data = bytearray(ValuePool.build(tmp_path / "text.kpool", ["a"]).path.read_bytes())
+    data[10] = 7
+    corrupt.write_bytes(bytes(data))
+    with pytest.raises(ValueError, match="not a Kraft value pool"):
+        ValuePool(corrupt)
+
+
+def test_pool_pickles_by_path(tmp_path):
+    pool = ValuePool.build(tmp_path / "text.kpool", ["a", "b"])
+
+    restored = pickle.loads(pickle.dumps(pool))
+
+    assert restored.path == pool.path
+    assert restored.take([1]) == ["b"]
+
+
+def test_pooled_generator_samples_the_pool_reproducibly(tmp_path):
+    pool = ValuePool.build(tmp_path / "text.kpool", [f"v{i}" for i in range(50)])
+    first, second = PooledGenerator(pool, seed=4), PooledGenerator(pool, seed=4)
+
+    values = first.generate_many(200)
+
+    assert values == second.generate_many(200)
+    assert set(values) <= {f"v{i}" for i in range(50)}
+    assert len(set(values)) > 1
+    assert isinstance(first(), str)
+
+
+def test_pool_key_tracks_column_configuration():
+    columns = _columns()
+    changed = ColumnDefinition("bio", "TEXT", TextGenerator(20, 41))
+
+    assert pool_key(columns["bio"], 10) == pool_key(_columns()["bio"], 10)
+    assert pool_key(columns["doc"], 10) == pool_key(_columns()["doc"], 10)
+    assert pool_key(columns["bio"], 10) != pool_key(changed, 10)
+    assert pool_key(columns["bio"], 10) != pool_key(columns["bio"], 11)
+
+
+def test_pooled_columns_build_once_and_reuse_pools(tmp_path):
+    columns = _columns()
+
+    pooled = pooled_columns(columns, ["bio", "doc"], tmp_path, size=64)
+    files = sorted(path.name for path in tmp_path.iterdir())
+    again = pooled_columns(_columns(), ["bio", "doc"], tmp_path, size=64)
+
+    assert len(files) == 2
+    assert sorted(path.name for path in tmp_path.iterdir()) == files
+    assert pooled["id"] is columns["id"]
+    assert isinstance(pooled["bio"].generator, PooledGenerator)
+    assert pooled["bio"].sql_type == "TEXT"
+    assert pooled["bio"].generator.pool.take(range(64)) == again["bio"].generator.pool.take(
+        range(64)
+    )
+    assert all(20 <= len(value) <= 40 for value in pooled["bio"].generate_many(100))
+    assert pooled["doc"].generate().startswith('{"n":')
+
+
+def test_pooled_columns_follow_random_streams(tmp_path):
+    first = pooled_columns(_columns(), ["bio"], tmp_path, size=32)
+    second = pooled_columns(_columns(), ["bio"], tmp_path, size=32)
+
+    RandomStreams(9).seed_columns(first)
+    RandomStreams(9).seed_columns(second)
+
+    assert first["bio"].generate_many(20) == second["bio"].generate_many(20)
+
+
+def test_pooled_columns_validate_arguments(tmp_path):
+    with pytest.raises(ValueError, match="Unknown columns"):
+        pooled_columns(_columns(), ["missing"], tmp_path)
+    with pytest.raises(ValueError):
+        pooled_columns(_columns(), ["bio"], tmp_path, size=0)
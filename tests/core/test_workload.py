@@ -0,0 +1,102 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from kraft.core.column import ColumnDefinition
+from kraft.core.workload import TableSpec, Workload
+
+
+def _columns():
+    return {
+        "id": ColumnDefinition("id", "UUID", lambda: "id", protected=True),
+        "name": ColumnDefinition("name", "TEXT", lambda: "Alice"),
+        "extra": ColumnDefinition("extra", "INT", lambda: 1, reserved=True),
+    }
+
+
+def _connect():
+    return MagicMock()
+
+
+@patch("kraft.core.mutator.execute_values")
+def test_workload_runs_every_table_to_completion(mock_execute_values):
+    tables = [
+        TableSpec(f"t{index}", _columns(), total_records=30, batch_size=10) for index in range(5)
+    ]
+    workload = Workload(_connect, tables, workers=2)
+
+    workload.run()
+
+    report = workload.report()
+    assert set(report) == {f"public.t{index}" for index in range(5)}
+    assert all(entry["batches"] == 3 for entry in report.values())
+    assert all(entry["total_inserts"] == 30 for entry in report.values())
+    assert workload.get_counters()["total_inserts"] == 150
+    assert mock_execute_values.call_count == 15
+
+
+@patch("kraft.core.mutator.execute_values")
+def test_workload_round_robins_tables(mock_execute_values):
+    order = []
+    tables = [TableSpec(name, _columns(), total_records=20, batch_size=10) for name in "ab"]
+    workload = Workload(_connect, tables, workers=1)
+    original = workload._run_batch
+
+    def record(state, conn):
+        order.append(state.spec.name)
+        original(state, conn)
+
+    workload._run_batch = record
+    workload.run()
+
+    assert order == ["a", "b", "a", "b"]
+
+
+@patch("kraft.core.mutator.execute_values")
+def test_workload_applies_per_table_settings(mock_execute_values):
+    spec = TableSpec(
+        "events",
+        _columns(),
+        total_records=10,
+        batch_size=5,
+        mutation_probability=0.0,
+        evolution={"evolution_interval": 1, "evolution_probability": 1.0, "add_probability": 1.0},
+    )
+    workload = Workload(_connect, [spec], workers=3)
+
+    workload.run()
+
+    state = workload.tables["public.events"]
+    assert state.engine.get_counters() == {
+        "total_inserts": 10,
+        "total_updates": 0,
+        "total_deletes": 0,
+    }
+    assert "extra" in state.manager.get_active_columns()
+    assert workload.report()["public.events"]["schema_version"] > 1
+
+
+def test_workload_surfaces_worker_errors():
+    def failing_connect():
+        raise ConnectionError("database unavailable")
+
+    workload = Workload(failing_connect, [TableSpec("events", _columns())], workers=2)
+
+    with pytest.raises(ConnectionError):
+        workload.run()
+
+
+def test_workload_rejects_duplicate_tables():
+    with pytest.raises(ValueError):
+        Workload(_connect, [TableSpec("events", _columns()), TableSpec("events", _columns())])
+
+
+@patch("kraft.core.mutator.execute_values")
+def test_workload_writes_final_partial_batch(mock_execute_values):
+    spec = TableSpec("events", _columns(), total_records=25, batch_size=10)
+    workload = Workload(_connect, [spec])
+
+    workload.run()
+
+    assert [len(call.args[2]) for call in mock_execute_values.call_args_list] == [10, 10, 5]
+    assert workload.report()["public.events"]["total_inserts"] == 25
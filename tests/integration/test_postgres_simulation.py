@@ -1,17 +1,34 @@
+import asyncio
+import functools
 import os
 import uuid
+from datetime import datetime
 
 import psycopg2
 import pytest
 
 from kraft import (
+    AsyncMutationEngine,
+    AsyncSimulationRunner,
     BatchGenerator,
+    CaptureEngine,
+    CaptureSchemaManager,
+    CaptureWriter,
     ColumnDefinition,
+    ConnectionPool,
     EvolutionController,
+    LiveKeyIndex,
+    LockPolicy,
     MutationEngine,
+    ParallelSimulationRunner,
+    RateController,
+    Replayer,
     SchemaManager,
     SimulationRunner,
+    TableSpec,
+    Workload,
 )
+from kraft.core.async_mutator import create_pool
 
 pytestmark = pytest.mark.integration
 
@@ -88,3 +105,543 @@ def test_full_simulation_flow(pg_conn):
     assert summary["adds"] >= 1
 
     manager.drop_table()
+
+
+@pytest.mark.parametrize("copy_format", ["text", "binary"])
+def test_copy_insert_modes_round_trip(pg_conn, copy_format):
+    table = f"integration_copy_{copy_format}"
+    columns = {
+        "id": ColumnDefinition("id", "UUID", lambda: str(uuid.uuid4()), protected=True),
+        "created_at": ColumnDefinition("created_at", "TIMESTAMP", datetime.now),
+        "label": ColumnDefinition("label", "TEXT", lambda: "tab\there"),
+        "quantity": ColumnDefinition("quantity", "BIGINT", lambda: 2**40),
+        "payload": ColumnDefinition("payload", "JSONB", lambda: {"k": [1, 2]}),
+        "ratio": ColumnDefinition("ratio", "FLOAT", lambda: 0.5),
+        "active": ColumnDefinition("active", "BOOLEAN", lambda: True),
+    }
+    manager = SchemaManager(pg_conn, schema="public", table_name=table, columns=columns)
+    manager.drop_table()
+    manager.create_table()
+
+    generator = BatchGenerator(schema=manager.get_active_columns())
+    mutator = MutationEngine(
+        pg_conn,
+        schema="public",
+        table_name=table,
+        generator=generator,
+        insert_mode="copy",
+        copy_format=copy_format,
+    )
+    mutator.insert_batch(generator.generate_batch(50))
+
+    with pg_conn.cursor() as cur:
+        cur.execute(
+            "SELECT count(*), min(label), min(quantity), min(payload::text), bool_and(active) "
+            f'FROM public."{table}";'
+        )
+        assert cur.fetchone() == (50, "tab\there", 2**40, '{"k": [1, 2]}', True)
+
+    manager.drop_table()
+
+
+def test_batched_updates_touch_every_sampled_row(pg_conn):
+    table = "integration_batched_updates"
+    columns = {
+        "id": ColumnDefinition("id", "UUID", lambda: str(uuid.uuid4()), protected=True),
+        "updated_at": ColumnDefinition("updated_at", "TIMESTAMP", lambda: None, protected=True),
+        "label": ColumnDefinition("label", "VARCHAR(16)", lambda: "fresh"),
+        "quantity": ColumnDefinition("quantity", "INT", lambda: 5),
+    }
+    manager = SchemaManager(pg_conn, schema="public", table_name=table, columns=columns)
+    manager.drop_table()
+    manager.create_table()
+
+    generator = BatchGenerator(schema=manager.get_active_columns())
+    mutator = MutationEngine(
+        pg_conn,
+        schema="public",
+        table_name=table,
+        update_column="updated_at",
+        generator=generator,
+        update_mode="batch",
+    )
+    ids = mutator.insert_batch(generator.generate_batch(40))
+    assert mutator._update_records(ids[:30]) == 30
+
+    with pg_conn.cursor() as cur:
+        cur.execute(f'SELECT count(*) FROM public."{table}" WHERE updated_at IS NOT NULL;')
+        assert cur.fetchone()[0] == 30
+
+    manager.drop_table()
+
+
+def test_parallel_simulation_flow(pg_conn):
+    table = "integration_parallel"
+    columns = _integration_columns()
+    manager = SchemaManager(pg_conn, schema="public", table_name=table, columns=columns)
+    manager.drop_table()
+    manager.create_table()
+
+    evolution = EvolutionController(
+        manager,
+        evolution_interval=2,
+        evolution_probability=1.0,
+        add_probability=1.0,
+        max_additions=1,
+        max_drops=0,
+    )
+    runner = ParallelSimulationRunner(
+        manager,
+        functools.partial(psycopg2.connect, os.environ["KRAFT_TEST_PG_DSN"]),
+        workers=3,
+        total_records=120,
+        batch_size=10,
+        evolution_controller=evolution,
+        engine_options={"primary_key": "id", "update_column": "updated_at"},
+    )
+    runner.run()
+
+    with pg_conn.cursor() as cur:
+        cur.execute(f'SELECT count(*), count(discount) FROM public."{table}";')
+        row_count, discounted = cur.fetchone()
+
+    counters = runner.get_counters()
+    assert counters["total_inserts"] == 120
+    assert row_count == counters["total_inserts"] - counters["total_deletes"]
+    assert discounted > 0
+    assert evolution.summary()["adds"] == 1
+
+    manager.drop_table()
+
+
+def test_pipelined_simulation_survives_schema_evolution(pg_conn):
+    table = "integration_pipelined"
+    columns = _integration_columns()
+    columns["id"] = ColumnDefinition("id", "UUID", lambda: str(uuid.uuid4()), protected=True)
+    manager = SchemaManager(pg_conn, schema="public", table_name=table, columns=columns)
+    manager.drop_table()
+    manager.create_table()
+
+    generator = BatchGenerator(schema=manager.get_active_columns())
+    mutator = MutationEngine(
+        pg_conn,
+        schema="public",
+        table_name=table,
+        update_column="updated_at",
+        generator=generator,
+    )
+    evolution = EvolutionController(
+        manager,
+        evolution_interval=1,
+        evolution_probability=1.0,
+        add_probability=0.5,
+        max_additions=1,
+        max_drops=2,
+    )
+    runner = SimulationRunner(
+        schema_manager=manager,
+        mutator=mutator,
+        batch_generator=generator,
+        evolution_controller=evolution,
+        total_records=200,
+        batch_size=10,
+        pipeline_depth=4,
+        columnar=True,
+    )
+    runner.run()
+
+    with pg_conn.cursor() as cur:
+        cur.execute(f'SELECT count(*) FROM public."{table}";')
+        row_count = cur.fetchone()[0]
+
+    counters = mutator.get_counters()
+    assert counters["total_inserts"] == 200
+    assert row_count == counters["total_inserts"] - counters["total_deletes"]
+    assert evolution.summary()["drops"] == 2
+
+    manager.drop_table()
+
+
+@pytest.mark.parametrize("insert_mode", ["values", "copy"])
+def test_async_runners_share_a_pool(pg_conn, insert_mode):
+    pytest.importorskip("psycopg_pool")
+    tables = [f"integration_async_{insert_mode}_{index}" for index in range(3)]
+    columns = {
+        **_integration_columns(),
+        "id": ColumnDefinition("id", "UUID", lambda: str(uuid.uuid4()), protected=True),
+    }
+
+    async def main():
+        pool = await create_pool(os.environ["KRAFT_TEST_PG_DSN"], max_size=3)
+        try:
+            runners = []
+            for table in tables:
+                manager = SchemaManager(
+                    pg_conn, schema="public", table_name=table, columns=dict(columns)
+                )
+                manager.drop_table()
+                manager.create_table()
+                generator = BatchGenerator(schema=manager.get_active_columns())
+                mutator = AsyncMutationEngine(
+                    pool,
+                    schema="public",
+                    table_name=table,
+                    generator=generator,
+                    insert_mode=insert_mode,
+                    update_mode="batch",
+                )
+                runners.append(
+                    AsyncSimulationRunner(
+                        manager,
+                        mutator,
+                        batch_generator=generator,
+                        total_records=100,
+                        batch_size=10,
+                    )
+                )
+            await asyncio.gather(*(runner.run() for runner in runners))
+            return [runner.mutator.get_counters() for runner in runners]
+        finally:
+            await pool.close()
+
+    all_counters = asyncio.run(main())
+
+    with pg_conn.cursor() as cur:
+        for table, counters in zip(tables, all_counters, strict=True):
+            cur.execute(f'SELECT count(*) FROM public."{table}";')
+            assert counters["total_inserts"] == 100
+            assert cur.fetchone()[0] == counters["total_inserts"] - counters["total_deletes"]
+            cur.execute(f'DROP TABLE public."{table}";')
+    pg_conn.commit()
+
+
+def test_workload_drives_many_tables(pg_conn):
+    columns = {
+        **_integration_columns(),
+        "id": ColumnDefinition("id", "UUID", lambda: str(uuid.uuid4()), protected=True),
+    }
+    specs = [
+        TableSpec(
+            f"integration_workload_{index}",
+            columns,
+            total_records=60,
+            batch_size=20,
+            update_ratio=1.0,
+            evolution={"evolution_interval": 1, "evolution_probability": 1.0},
+        )
+        for index in range(6)
+    ]
+    workload = Workload(
+        functools.partial(psycopg2.connect, os.environ["KRAFT_TEST_PG_DSN"]),
+        specs,
+        workers=3,
+        recreate_tables=True,
+    )
+    workload.run()
+
+    report = workload.report()
+    with pg_conn.cursor() as cur:
+        for spec in specs:
+            stats = report[f"public.{spec.name}"]
+            cur.execute(f'SELECT count(*) FROM public."{spec.name}";')
+            assert stats["total_inserts"] == 60
+            assert stats["total_deletes"] == 0
+            assert cur.fetchone()[0] == 60
+            cur.execute(f'DROP TABLE public."{spec.name}";')
+    pg_conn.commit()
+
+
+def test_rate_controlled_simulation_holds_target_rates(pg_conn):
+    table = "integration_rate_controlled"
+    columns = {
+        **_integration_columns(),
+        "id": ColumnDefinition("id", "UUID", lambda: str(uuid.uuid4()), protected=True),
+    }
+    manager = SchemaManager(pg_conn, schema="public", table_name=table, columns=columns)
+    manager.drop_table()
+    manager.create_table()
+    generator = BatchGenerator(schema=manager.get_active_columns())
+    mutator = MutationEngine(pg_conn, schema="public", table_name=table, generator=generator)
+    controller = RateController(inserts=2_000, updates=500, deletes=100)
+    runner = SimulationRunner(
+        schema_manager=manager,
+        mutator=mutator,
+        batch_generator=generator,
+        total_records=600,
+        batch_size=50,
+        rate_controller=controller,
+    )
+    runner.run()
+
+    report = controller.report()
+    assert 0.8 < report["insert"]["ratio"] <= 1.05
+    assert mutator.total_updates > 0
+    assert mutator.total_deletes > 0
+    with pg_conn.cursor() as cur:
+        cur.execute(f'SELECT count(*) FROM public."{table}";')
+        assert cur.fetchone()[0] == 600 - mutator.total_deletes
+
+    manager.drop_table()
+
+
+def test_duration_bounded_streaming_run(pg_conn):
+    table = "integration_streaming"
+    columns = {
+        **_integration_columns(),
+        "id": ColumnDefinition("id", "UUID", lambda: str(uuid.uuid4()), protected=True),
+    }
+    manager = SchemaManager(pg_conn, schema="public", table_name=table, columns=columns)
+    manager.drop_table()
+    manager.create_table()
+    generator = BatchGenerator(schema=manager.get_active_columns())
+    mutator = MutationEngine(pg_conn, schema="public", table_name=table, generator=generator)
+    runner = SimulationRunner(
+        schema_manager=manager,
+        mutator=mutator,
+        batch_generator=generator,
+        total_records=None,
+        batch_size=25,
+        duration=0.3,
+        pipeline_depth=2,
+    )
+    runner.run()
+
+    progress = runner.progress()
+    assert progress["batches"] > 0
+    assert 0.3 <= progress["elapsed_seconds"] < 2
+    with pg_conn.cursor() as cur:
+        cur.execute(f'SELECT count(*) FROM public."{table}";')
+        assert cur.fetchone()[0] == progress["rows"] - mutator.total_deletes
+
+    manager.drop_table()
+
+
+def test_key_index_mutates_historical_rows(pg_conn):
+    table = "integration_key_index"
+    columns = {
+        "id": ColumnDefinition("id", "UUID", lambda: str(uuid.uuid4()), protected=True),
+        "updated_at": ColumnDefinition("updated_at", "TIMESTAMP", lambda: None, protected=True),
+        "quantity": ColumnDefinition("quantity", "INT", lambda: 1),
+    }
+    manager = SchemaManager(pg_conn, schema="public", table_name=table, columns=columns)
+    manager.drop_table()
+    manager.create_table()
+    generator = BatchGenerator(schema=manager.get_active_columns())
+    index = LiveKeyIndex(skew="zipf")
+    mutator = MutationEngine(
+        pg_conn,
+        schema="public",
+        table_name=table,
+        update_column="updated_at",
+        generator=generator,
+        key_index=index,
+        mutation_probability=1.0,
+    )
+    first_batch = mutator.insert_batch(generator.generate_batch(50))
+    for _ in range(10):
+        mutator.maybe_mutate_batch(mutator.insert_batch(generator.generate_batch(50)))
+
+    with pg_conn.cursor() as cur:
+        cur.execute(f'SELECT count(*) FROM public."{table}";')
+        assert cur.fetchone()[0] == len(index) == 550 - mutator.total_deletes
+        cur.execute(
+            f'SELECT count(*) FROM public."{table}" WHERE updated_at IS NOT NULL '
+            "AND id = ANY(%s::uuid[]);",
+            (first_batch,),
+        )
+        touched_first_batch = cur.fetchone()[0]
+    assert mutator.total_updates == 0 or touched_first_batch > 0
+
+    manager.drop_table()
+
+
+def test_prepared_statements_survive_schema_evolution(pg_conn):
+    table = "integration_prepared_statements"
+    columns = {
+        "id": ColumnDefinition("id", "UUID", lambda: str(uuid.uuid4()), protected=True),
+        "updated_at": ColumnDefinition("updated_at", "TIMESTAMP", lambda: None, protected=True),
+        "quantity": ColumnDefinition("quantity", "INT", lambda: 3),
+        "price": ColumnDefinition("price", "FLOAT", lambda: 1.5),
+    }
+    manager = SchemaManager(pg_conn, schema="public", table_name=table, columns=columns)
+    manager.drop_table()
+    manager.create_table()
+    generator = BatchGenerator(schema=manager.get_active_columns())
+    mutator = MutationEngine(
+        pg_conn,
+        schema="public",
+        table_name=table,
+        update_column="updated_at",
+        generator=generator,
+        schema_manager=manager,
+        prepare_statements=True,
+    )
+
+    ids = list(mutator.insert_batch(generator.generate_batch(20)))
+    assert mutator._update_records(ids[:10]) == 10
+    assert mutator._delete_records(ids[10:15]) == 5
+
+    manager.drop_column()
+    generator.schema = manager.get_active_columns()
+    assert mutator._update_records(ids[:10]) == 10
+    assert mutator._delete_records(ids[15:]) == 5
+
+    with pg_conn.cursor() as cur:
+        cur.execute(f'SELECT count(*) FROM public."{table}" WHERE updated_at IS NOT NULL;')
+        assert cur.fetchone()[0] == 10
+        cur.execute("SELECT count(*) FROM pg_prepared_statements WHERE name LIKE 'kraft_%';")
+        assert cur.fetchone()[0] == 2
+
+    manager.drop_table()
+
+
+def test_lock_policy_bounds_ddl_waits_behind_open_transactions(pg_conn):
+    table = "integration_lock_policy"
+    pool = ConnectionPool(os.environ["KRAFT_TEST_PG_DSN"], min_size=0, max_size=2)
+    manager = SchemaManager(
+        pool,
+        schema="public",
+        table_name=table,
+        columns=_integration_columns(),
+        lock_policy=LockPolicy(lock_timeout=0.05, max_attempts=2, backoff=0.01),
+    )
+    manager.drop_table()
+    manager.create_table()
+
+    with pg_conn.cursor() as cur:
+        cur.execute(f"SELECT count(*) FROM public.{table};")
+    with pytest.raises(psycopg2.errors.LockNotAvailable):
+        manager.add_column()
+    assert "discount" not in manager.get_active_columns()
+    assert manager.ddl_log[-1]["attempts"] == 2
+
+    pg_conn.commit()
+    assert manager.add_column() == "discount"
+    assert manager.ddl_log[-1]["succeeded"] is True
+
+    manager.drop_table()
+    pool.closeall()
+
+
+def test_wide_evolution_alters_several_columns_at_once(pg_conn):
+    table = "integration_wide_evolution"
+    columns = _integration_columns()
+    columns["coupon"] = ColumnDefinition("coupon", "TEXT", lambda: "SAVE10", reserved=True)
+    manager = SchemaManager(pg_conn, schema="public", table_name=table, columns=columns)
+    manager.drop_table()
+    manager.create_table()
+
+    added, dropped = manager.alter_columns(add=2, drop=1)
+
+    assert added == ["discount", "coupon"]
+    assert dropped == ["id"]
+    with pg_conn.cursor() as cur:
+        cur.execute(
+            "SELECT column_name FROM information_schema.columns WHERE table_name = %s;",
+            (table,),
+        )
+        physical = {row[0] for row in cur.fetchall()}
+    assert physical == set(manager.get_active_columns())
+
+    manager.drop_table()
+
+
+def test_alterations_measure_table_rewrites(pg_conn):
+    table = "integration_alterations"
+    columns = {
+        "id": ColumnDefinition("id", "UUID", lambda: str(uuid.uuid4()), protected=True),
+        "code": ColumnDefinition("code", "VARCHAR(16)", lambda: "abc"),
+        "quantity": ColumnDefinition("quantity", "INT", lambda: 1),
+        "note": ColumnDefinition("note", "TEXT", lambda: "n"),
+    }
+    manager = SchemaManager(pg_conn, schema="public", table_name=table, columns=columns)
+    manager.drop_table()
+    manager.create_table()
+    generator = BatchGenerator(schema=manager.get_active_columns())
+    mutator = MutationEngine(pg_conn, schema="public", table_name=table, generator=generator)
+    mutator.insert_batch(generator.generate_batch(50))
+
+    assert manager.alter_columns(widen=1)["widen"] == ["code"]
+    assert manager.ddl_log[-1]["rewrote_table"] is False
+    assert manager.alter_columns(widen=1)["widen"] == ["quantity"]
+    assert manager.ddl_log[-1]["rewrote_table"] is True
+
+    changes = manager.alter_columns(rename=1, set_default=1, set_not_null=1)
+    assert changes["rename"] == ["code -> code_v4"]
+    generator.schema = manager.get_active_columns()
+    mutator.insert_batch(generator.generate_batch(10))
+
+    with pg_conn.cursor() as cur:
+        cur.execute(
+            "SELECT column_name, data_type, is_nullable FROM information_schema.columns "
+            "WHERE table_name = %s ORDER BY ordinal_position;",
+            (table,),
+        )
+        assert cur.fetchall() == [
+            ("id", "uuid", "YES"),
+            ("code_v4", "text", "YES"),
+            ("quantity", "bigint", "YES"),
+            ("note", "text", "NO"),
+        ]
+
+    manager.drop_table()
+
+
+def test_benchmark_suite_runs_against_postgres(pg_conn):
+    from kraft import bench
+
+    results = bench.run_suite(pg_conn, repeat=1, quick=True, target="postgres")
+
+    assert all(result.timings for result in results)
+    with pg_conn.cursor() as cur:
+        cur.execute("SELECT count(*) FROM pg_tables WHERE tablename LIKE 'kraft_bench_%'")
+        assert cur.fetchone()[0] == 0
+
+
+def test_captured_run_replays_into_postgres(pg_conn, tmp_path):
+    table = "integration_capture"
+    columns = _integration_columns()
+    # COPY text needs real timestamps rather than the "now()" placeholder.
+    columns["updated_at"] = ColumnDefinition(
+        "updated_at", "TIMESTAMP", datetime.now, protected=True
+    )
+    path = str(tmp_path / "run.kcap")
+    SchemaManager(pg_conn, schema="public", table_name=table, columns=columns).drop_table()
+    with CaptureWriter(path) as writer:
+        manager = CaptureSchemaManager(writer, schema="public", table_name=table, columns=columns)
+        manager.create_table()
+        generator = BatchGenerator(schema=manager.get_active_columns())
+        mutator = CaptureEngine(
+            writer,
+            schema="public",
+            table_name=table,
+            update_column="updated_at",
+            generator=generator,
+            key_index=LiveKeyIndex(),
+        )
+        evolution = EvolutionController(
+            manager, evolution_interval=2, evolution_probability=1.0, add_probability=1.0
+        )
+        SimulationRunner(
+            manager,
+            mutator,
+            total_records=200,
+            batch_size=50,
+            batch_generator=generator,
+            evolution_controller=evolution,
+            seed=5,
+        ).run()
+
+    counters = Replayer(pg_conn, path).run()
+
+    assert counters["inserts"] == 200
+    assert counters["deletes"] == mutator.total_deletes
+    with pg_conn.cursor() as cur:
+        cur.execute(f"SELECT count(*) FROM public.{table}")
+        assert cur.fetchone()[0] == 200 - mutator.total_deletes
+        cur.execute(
+            "SELECT column_name FROM information_schema.columns WHERE table_name = %s",
+            (table,),
+        )
+        assert {row[0] for row in cur.fetchall()} == set(manager.get_active_columns())
+    SchemaManager(pg_conn, schema="public", table_name=table, columns=columns).drop_table()
@@ -0,0 +1,66 @@
+import json
+
+import pytest
+
+from kraft import bench
+from kraft.core import mutator
+
+
+def test_quick_suite_covers_every_hot_path_and_restores_the_driver():
+    original = mutator.execute_values
+
+    results = bench.run_suite(repeat=1, quick=True)
+
+    names = {result.name for result in results}
+    assert names == {
+        "generate_batch",
+        "generate_columnar",
+        "insert_batch",
+        "update_rows",
+        "delete_rows",
+        "evolve",
+    }
+    assert len({result.key for result in results}) == len(results)
+    assert all(len(result.timings) == 1 for result in results)
+    assert mutator.execute_values is original
+
+
+def test_bench_columns_mix_types_and_reserve_the_tail():
+    columns = bench.bench_columns(5, "mixed", reserved=2)
+
+    assert [column.sql_type for column in columns.values()][:6] == [
+        "UUID",
+        "INT",
+        "TEXT",
+        "DOUBLE PRECISION",
+        "TIMESTAMP",
+        "UUID",
+    ]
+    assert [name for name, column in columns.items() if column.reserved] == ["c5", "c6"]
+    with pytest.raises(ValueError):
+        bench.bench_columns(1, "blob")
+
+
+def test_compare_reports_relative_median_times():
+    baseline = {"results": [{"key": "a", "median_seconds": 2.0}, {"key": "b", "median_seconds": 0}]}
+    current = {"results": [{"key": "a", "median_seconds": 3.0}, {"key": "c", "median_seconds": 1}]}
+
+    assert bench.compare(current, baseline) == {"a": 1.5}
+
+
+def test_main_writes_a_report_and_fails_past_the_threshold(tmp_path, monkeypatch, capsys):
+    results = [bench.BenchResult("evolve", {"columns": 10}, 5, [0.5, 0.25, 0.75])]
+    monkeypatch.setattr(bench, "run_suite", lambda conn, **options: results)
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps(bench.report(results, target="fake")))
+    output = tmp_path / "current.json"
+
+    assert bench.main(["--output", str(output), "--compare", str(baseline)]) == 0
+    report = json.loads(output.read_text())
+    assert report["target"] == "fake"
+    assert report["results"][0]["median_seconds"] == 0.5
+    assert report["results"][0]["operations_per_second"] == 10.0
+    assert "x1.00" in capsys.readouterr().out
+
+    results[0].timings = [1.0]
+    assert bench.main(["--compare", str(baseline), "--threshold", "1.5"]) == 1
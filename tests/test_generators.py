@@ -0,0 +1,221 @@
+import json
+import string
+import uuid
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from kraft import generators
+from kraft.core.column import ColumnDefinition
+from kraft.core.registry import clear_column_registry, get_registered_columns, register_column
+from kraft.generators import (
+    ChoiceGenerator,
+    FloatGenerator,
+    IntegerGenerator,
+    JSONGenerator,
+    SerialGenerator,
+    TextGenerator,
+    TimestampGenerator,
+    UUIDGenerator,
+    ValueGenerator,
+)
+
+
+@pytest.fixture(params=["numpy", "stdlib"])
+def backend(request, monkeypatch):
+    if request.param == "stdlib":
+        monkeypatch.setattr(generators, "np", None)
+    elif generators.np is None:
+        pytest.skip("NumPy is not installed")
+    return request.param
+
+
+def test_value_generator_subclasses_must_define_generate_many():
+    with pytest.raises(TypeError):
+        ValueGenerator()
+
+
+def test_uuid_generator_emits_valid_version_4_uuids():
+    values = UUIDGenerator(seed=1).generate_many(100)
+    parsed = [uuid.UUID(value) for value in values]
+    assert all(u.version == 4 and u.variant == uuid.RFC_4122 for u in parsed)
+    assert len(set(values)) == 100
+    assert UUIDGenerator(seed=1).generate_many(100) == values
+
+
+def test_serial_generator_continues_across_calls():
+    gen = SerialGenerator(10, step=2)
+    assert gen.generate_many(3) == [10, 12, 14]
+    assert gen() == 16
+
+
+def test_integer_generator_respects_bounds_and_seed(backend):
+    values = IntegerGenerator(-3, 3, seed=7).generate_many(500)
+    assert set(values) == set(range(-3, 4))
+    assert all(type(value) is int for value in values)
+    assert IntegerGenerator(-3, 3, seed=7).generate_many(500) == values
+
+
+def test_integer_generator_supports_bigint_ranges(backend):
+    values = IntegerGenerator(2**40, 2**62, seed=3).generate_many(50)
+    assert all(2**40 <= value <= 2**62 for value in values)
+
+
+@pytest.mark.parametrize("distribution", generators.DISTRIBUTIONS)
+def test_float_generator_distributions(backend, distribution):
+    gen = FloatGenerator(distribution, low=5.0, high=6.0, mean=2.0, stddev=0.5, seed=1)
+    values = gen.generate_many(200)
+    assert len(values) == 200
+    assert all(type(value) is float for value in values)
+    if distribution == "uniform":
+        assert all(5.0 <= value < 6.0 for value in values)
+    if distribution in ("lognormal", "exponential"):
+        assert all(value >= 0 for value in values)
+
+
+def test_float_generator_exponential_defaults_to_unit_mean(backend):
+    values = FloatGenerator("exponential", seed=1).generate_many(2000)
+    assert all(value > 0 for value in values)
+    assert 0.9 < sum(values) / len(values) < 1.1
+    assert FloatGenerator("exponential", seed=1)() > 0
+
+
+def test_float_generator_rejects_degenerate_parameters():
+    with pytest.raises(ValueError, match="mean"):
+        FloatGenerator("exponential", mean=0.0)
+    with pytest.raises(ValueError, match="mean"):
+        FloatGenerator("exponential", mean=-1.0)
+    for distribution in ("normal", "lognormal"):
+        with pytest.raises(ValueError, match="stddev"):
+            FloatGenerator(distribution, stddev=-0.5)
+    assert FloatGenerator("normal").mean == 0.0
+
+
+def test_float_generator_rounds_to_precision():
+    values = FloatGenerator(low=0, high=100, precision=2, seed=1).generate_many(20)
+    assert all(round(value, 2) == value for value in values)
+    with pytest.raises(ValueError):
+        FloatGenerator("pareto")
+
+
+def test_choice_generator_honors_weights():
+    values = ChoiceGenerator(["a", "b", "c"], weights=[1, 0, 3], seed=5).generate_many(300)
+    assert set(values) == {"a", "c"}
+    with pytest.raises(ValueError):
+        ChoiceGenerator(["a"], weights=[1, 2])
+
+
+def test_timestamp_generator_stays_inside_window():
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    end = start + timedelta(days=1)
+    values = TimestampGenerator(start, end, seed=2).generate_many(100)
+    assert all(start <= value < end for value in values)
+    assert all(value.tzinfo is timezone.utc for value in values)
+
+
+def test_naive_timestamps_are_datetimes(backend):
+    start = datetime(2024, 1, 1)
+    values = TimestampGenerator(start, start + timedelta(hours=1), seed=2).generate_many(50)
+    assert all(type(value) is datetime for value in values)
+    assert all(start <= value < start + timedelta(hours=1) for value in values)
+
+
+def test_text_generator_bounds_length_and_alphabet():
+    values = TextGenerator(2, 5, alphabet="xyz", seed=4).generate_many(200)
+    assert {len(value) for value in values} == {2, 3, 4, 5}
+    assert set("".join(values)) == {"x", "y", "z"}
+    with pytest.raises(ValueError):
+        TextGenerator(alphabet="ünïcode")
+
+
+def test_text_generator_draws_characters_uniformly():
+    text = "".join(TextGenerator(20, 20, seed=6).generate_many(20_000))
+    counts = Counter(text)
+
+    assert len(text) == 400_000
+    assert set(counts) == set(string.ascii_letters + string.digits)
+    assert max(counts.values()) / min(counts.values()) < 1.1
+
+
+def test_json_generator_builds_documents_from_field_generators():
+    gen = JSONGenerator(
+        {
+            "sku": ChoiceGenerator(["a"]),
+            "qty": lambda: 2,
+            "source": "api",
+            "meta": JSONGenerator({"serial": SerialGenerator(1)}),
+        }
+    )
+    documents = [json.loads(doc) for doc in gen.generate_many(2)]
+    assert documents == [
+        {"sku": "a", "qty": 2, "source": "api", "meta": {"serial": 1}},
+        {"sku": "a", "qty": 2, "source": "api", "meta": {"serial": 2}},
+    ]
+
+
+@pytest.mark.parametrize(
+    ("gen", "check"),
+    [
+        (UUIDGenerator(seed=1), lambda v: uuid.UUID(v).version == 4),
+        (IntegerGenerator(-3, 3, seed=1), lambda v: -3 <= v <= 3),
+        (FloatGenerator(low=5.0, high=6.0, precision=1, seed=1), lambda v: 5.0 <= v <= 6.0),
+        (FloatGenerator("exponential", mean=2.0, seed=1), lambda v: v >= 0),
+        (ChoiceGenerator(["a", "b"], weights=[0, 1], seed=1), lambda v: v == "b"),
+        (ChoiceGenerator(["a", "b"], seed=1), lambda v: v in ("a", "b")),
+        (
+            TimestampGenerator(datetime(2024, 1, 1), datetime(2024, 1, 2), seed=1),
+            lambda v: datetime(2024, 1, 1) <= v < datetime(2024, 1, 2),
+        ),
+        (
+            TextGenerator(2, 3, alphabet="xy", seed=1),
+            lambda v: len(v) in (2, 3) and set(v) <= {"x", "y"},
+        ),
+        (
+            JSONGenerator({"n": IntegerGenerator(1, 1), "doc": JSONGenerator({"k": "v"})}),
+            lambda v: json.loads(v) == {"n": 1, "doc": {"k": "v"}},
+        ),
+    ],
+)
+def test_scalar_draws_skip_the_batch_path(gen, check, monkeypatch):
+    monkeypatch.setattr(gen, "generate_many", None)
+    values = [gen() for _ in range(50)]
+    assert all(check(value) for value in values)
+
+
+def test_scalar_draws_are_reproducible():
+    first, second = IntegerGenerator(0, 10**6, seed=3), IntegerGenerator(0, 10**6, seed=3)
+    assert [first() for _ in range(10)] == [second() for _ in range(10)]
+    serial = SerialGenerator(5, step=3)
+    assert [serial(), serial()] == [5, 8]
+    assert serial.generate_many(1) == [11]
+
+
+def test_column_definition_uses_generator_batch_path():
+    col = ColumnDefinition("id", "BIGINT", SerialGenerator(1))
+    assert col.generate_many(3) == [1, 2, 3]
+    assert col.generate() == 4
+
+
+def test_register_column_accepts_generator_without_decorator():
+    clear_column_registry()
+    try:
+        gen = SerialGenerator(1)
+        assert register_column(name="id", sql_type="BIGINT", generator=gen, protected=True) is gen
+        col = get_registered_columns()["id"]
+        assert col.protected is True
+        assert col.generate_many(2) == [1, 2]
+    finally:
+        clear_column_registry()
+
+
+def test_fork_splits_random_state_but_shares_sequences():
+    serial = SerialGenerator(1)
+    document = JSONGenerator({"n": IntegerGenerator(0, 10**9), "seq": serial})
+    document.reseed(3)
+    fork = document.fork(4)
+
+    assert fork.fields["n"] is not document.fields["n"]
+    assert fork.fields["seq"] is serial and serial.fork(5) is serial
+    assert fork.generate_documents(5) != document.generate_documents(5)
+    assert IntegerGenerator(0, 10**9, seed=1).fork(2).seed == 2